@@ -0,0 +1,133 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A manifest of the input fingerprints of every item or monster in the last
+exported build, used to only rebuild the items or monsters that changed.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict
+
+# Bump this number if the layout of the manifest file changes
+MANIFEST_VERSION = 1
+
+
+def fingerprint(*inputs: Any) -> str:
+    """Calculate the SHA256 hash of some JSON serializable inputs.
+
+    :param inputs: The inputs to hash.
+    :return: The hex digest of the inputs.
+    """
+    data = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def source_fingerprint(*modules: ModuleType) -> str:
+    """Calculate the SHA256 hash of the source code of some Python modules.
+
+    :param modules: The modules to hash.
+    :return: The hex digest of the module source files.
+    """
+    sha256 = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, "rb") as f:
+            sha256.update(f.read())
+    return sha256.hexdigest()
+
+
+class BuildManifest:
+    """This class stores the input fingerprint of every item or monster in a build.
+
+    The header stores fingerprints of inputs shared by every entity (such as the
+    schema and the builder source code). If the header of the previous manifest
+    does not match, or a full build is requested, every entity is rebuilt. An
+    entity can be reused when its input fingerprint matches the previous manifest.
+
+    :param path_to_manifest: The path to the manifest JSON file.
+    :param header: A dictionary of fingerprints of the inputs shared by every entity.
+    :param full: Whether to ignore the previous manifest, and rebuild every entity.
+    """
+    def __init__(self, path_to_manifest: Path, header: Dict[str, str], full: bool = False):
+        self.path = path_to_manifest
+        self.header = header
+        self.previous_entries: Dict[str, Dict] = dict()
+        self.entries: Dict[str, Dict] = dict()
+
+        if not full:
+            self._load()
+
+    def is_unchanged(self, entity_id: str, entity_fingerprint: str) -> bool:
+        """Determine if the inputs of an entity are the same as the previous build.
+
+        :param entity_id: The item or monster ID number.
+        :param entity_fingerprint: The input fingerprint of the entity.
+        :return: A boolean to indicate if the entity inputs are unchanged.
+        """
+        previous_entry = self.previous_entries.get(entity_id)
+        return previous_entry is not None and previous_entry["fingerprint"] == entity_fingerprint
+
+    def was_exported(self, entity_id: str) -> bool:
+        """Determine if an entity was exported in the previous build.
+
+        :param entity_id: The item or monster ID number.
+        :return: A boolean to indicate if the entity was exported.
+        """
+        previous_entry = self.previous_entries.get(entity_id)
+        return previous_entry is not None and previous_entry["exported"]
+
+    def update(self, entity_id: str, entity_fingerprint: str, exported: bool = True) -> None:
+        """Set the input fingerprint of an entity in this build.
+
+        :param entity_id: The item or monster ID number.
+        :param entity_fingerprint: The input fingerprint of the entity.
+        :param exported: Whether the entity was exported to JSON.
+        """
+        self.entries[entity_id] = {
+            "fingerprint": entity_fingerprint,
+            "exported": exported
+        }
+
+    def save(self) -> None:
+        """Save the manifest of this build, replacing the previous manifest."""
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "header": self.header,
+            "entries": self.entries
+        }
+
+        temp_file_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_file_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(temp_file_path, self.path)
+
+    def _load(self) -> None:
+        """Load the previous manifest, if it exists and the header matches."""
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+            if manifest["version"] == MANIFEST_VERSION and manifest["header"] == self.header:
+                self.previous_entries = manifest["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # No usable manifest, rebuild every entity
+            pass
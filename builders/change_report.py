@@ -0,0 +1,138 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A field-level differ for items and monsters, and a report of every new or
+changed item or monster in a build, saved as a JSON Lines file.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def diff_fields(old: Dict, new: Dict, path: str = "") -> List[Dict]:
+    """Find the changed fields between two versions of an item or monster.
+
+    Fields are compared one at a time, and nested dictionaries (such as
+    `equipment`) are compared field by field, using a dotted path (such as
+    `equipment.attack_stab`). Lists (such as `drops`) are compared ignoring
+    order, and the added and removed list elements are reported.
+
+    :param old: The existing item or monster dictionary.
+    :param new: The newly built item or monster dictionary.
+    :param path: The path of the parent field, for nested dictionaries.
+    :return: A list of changes, each a dictionary with `path` and `type` keys.
+    """
+    changes = list()
+    for field, new_value in new.items():
+        field_path = path + field
+        try:
+            old_value = old[field]
+        except KeyError:
+            changes.append({"path": field_path, "type": "added", "new": new_value})
+            continue
+        if old_value == new_value:
+            continue
+
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changes.extend(diff_fields(old_value, new_value, field_path + "."))
+        elif isinstance(old_value, list) and isinstance(new_value, list):
+            list_change = diff_list(old_value, new_value, field_path)
+            if list_change is not None:
+                changes.append(list_change)
+        else:
+            changes.append({"path": field_path, "type": "changed", "old": old_value, "new": new_value})
+
+    for field, old_value in old.items():
+        if field not in new:
+            changes.append({"path": path + field, "type": "removed", "old": old_value})
+
+    return changes
+
+
+def diff_list(old: List, new: List, path: str) -> Optional[Dict]:
+    """Find the added and removed elements of a list, ignoring order.
+
+    Elements are compared using their JSON representation, so lists of
+    dictionaries (such as monster drops) can be compared.
+
+    :param old: The existing list.
+    :param new: The newly built list.
+    :param path: The path of the list field.
+    :return: A change dictionary, or None if the lists have the same elements.
+    """
+    old_counts = Counter(json.dumps(element, sort_keys=True) for element in old)
+    new_counts = Counter(json.dumps(element, sort_keys=True) for element in new)
+    if old_counts == new_counts:
+        return None
+
+    return {
+        "path": path,
+        "type": "list_changed",
+        "added": [json.loads(element) for element in (new_counts - old_counts).elements()],
+        "removed": [json.loads(element) for element in (old_counts - new_counts).elements()]
+    }
+
+
+def change_record(entity_id: int, name: str, old: Optional[Dict], new: Dict) -> Optional[Dict]:
+    """Create a change report record for a single item or monster.
+
+    :param entity_id: The item or monster ID number.
+    :param name: The item or monster name.
+    :param old: The existing item or monster dictionary, or None if it is new.
+    :param new: The newly built item or monster dictionary.
+    :return: A change record dictionary, or None if the item or monster is unchanged.
+    """
+    if old is None:
+        return {"id": entity_id, "name": name, "status": "new", "new": new}
+    if old == new:
+        return None
+    return {"id": entity_id, "name": name, "status": "changed", "changes": diff_fields(old, new)}
+
+
+class ChangeReport:
+    """This class writes a report of every new or changed item or monster in a build.
+
+    The report is a JSON Lines file, with one change record per line. The
+    report file is replaced at the start of every build.
+
+    :param path_to_report: The path to the change report JSONL file.
+    """
+    def __init__(self, path_to_report: Path):
+        self.path = path_to_report
+        self.counts: Counter = Counter()
+        self.report_file = open(self.path, "w")
+
+    def add(self, record: Optional[Dict[str, Any]]) -> None:
+        """Add a change record to the report.
+
+        :param record: A change record from change_record, None records are ignored.
+        """
+        if record is None:
+            return
+        self.counts[record["status"]] += 1
+        self.report_file.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        """Close the report file, then print a summary of the changes."""
+        self.report_file.close()
+        print(f"Found {self.counts['new']} new and {self.counts['changed']} changed entries, "
+              f"change report saved to: {self.path}")
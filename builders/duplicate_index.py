@@ -0,0 +1,74 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+An index of already built (known) items or monsters, used to detect duplicates.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+from typing import Any, Dict, List, Set, Tuple
+
+
+class DuplicateIndex:
+    """This class indexes known items or monsters by name, and correlation property values.
+
+    An item (or monster) is a duplicate when a known item has the same name, and
+    every correlation property value (for example, `wiki_name` and `noted`)
+    matches the value of at least one known item with the same name. For each name
+    the index stores the set of values seen for each correlation property, so a
+    duplicate check is a few hash lookups instead of a scan of every known item.
+
+    :param correlation_properties: The property names compared between items with the same name.
+    """
+    def __init__(self, correlation_properties: Tuple[str, ...]):
+        self.correlation_properties = correlation_properties
+        self.names: Dict[str, List[Set[Any]]] = dict()
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the count of the total number of known entries.
+
+        :return: The total number of known entries.
+        """
+        return self.count
+
+    def append(self, entry: Any) -> None:
+        """Add a known (already processed) entry to the index.
+
+        :param entry: An ItemProperties or MonsterProperties object.
+        """
+        try:
+            seen_values = self.names[entry.name]
+        except KeyError:
+            seen_values = self.names[entry.name] = [set() for _ in self.correlation_properties]
+
+        for cprop, values in zip(self.correlation_properties, seen_values):
+            values.add(getattr(entry, cprop))
+        self.count += 1
+
+    def is_duplicate(self, entry: Any) -> bool:
+        """Determine if an entry is a duplicate of the known entries.
+
+        :param entry: An ItemProperties or MonsterProperties object.
+        :return: A boolean to indicate if the entry is a duplicate.
+        """
+        seen_values = self.names.get(entry.name)
+        if seen_values is None:
+            return False
+
+        return all(getattr(entry, cprop) in values for cprop, values in zip(self.correlation_properties, seen_values))
@@ -27,6 +27,8 @@ from typing import List
 
 import dateparser
 
+from osrsbox.monsters_api.drop_rarity import BaseValue, evaluate_rarity
+
 
 def clean_wikitext(value: str) -> str:
     """Generic infobox property cleaner.
@@ -394,11 +396,11 @@ def clean_drop_quantity(value: str) -> str:
     return value
 
 
-def clean_drop_rarity(value: str, base_value: str = None) -> float:
+def clean_drop_rarity(value: str, base_value: BaseValue = None) -> float:
     """Convert the drop rartiy text entry from an OSRS Wiki infobox.
 
     :param value: The extracted raw wiki text.
-    :param base_value: Used for special drop rartiy rates.
+    :param base_value: Used for special drop rartiy rates, the value of any #var: in the rarity.
     :return: A cleaned drop rarity property value.
     """
     if value is None:
@@ -436,50 +438,13 @@ def clean_drop_rarity(value: str, base_value: str = None) -> float:
         value = "1/128"
     elif value.lower() == "veryrare":
         value = "1/512"
-    elif "var:herbbase" in value:
-        # 1/#expr:1/(40*#var:herbbase) round 1
-        numerator = value.split("/")[0]
-        denominator = value.split("#expr:")[1]
-        denominator = re.sub("round[1 ]", "", denominator)
-        denominator = denominator.replace("#var:herbbase", str(base_value))
-        denominator = eval(denominator)
-        denominator = round(denominator, 1)
-        value = str(numerator) + "/" + str(denominator)
-    elif "var:seedbase" in value:
-        # 1/#expr:1/(40*#var:seedbase) round 1
-        numerator = value.split("/")[0]
-        denominator = value.split("#expr:")[1]
-        denominator = re.sub("round[1 ]", "", denominator)
-        denominator = denominator.replace("#var:seedbase", str(base_value))
-        denominator = eval(denominator)
-        denominator = round(denominator, 1)
-        value = str(numerator) + "/" + str(denominator)
-    elif "var:uht" in value:
-        # 1/#expr:1/(5*#var:uht)round 2
-        numerator = value.split("/")[0]
-        denominator = value.split("#expr:")[1]
-        denominator = re.sub("round[2 ]", "", denominator)
-        denominator = denominator.replace("#var:uht", str(base_value))
-        denominator = eval(denominator)
-        denominator = round(denominator, 1)
-        value = str(numerator) + "/" + str(denominator)
-    elif "var:bolttipbase" in value:
-        # 1/#expr:1/(10*#var:bolttipbase)round1
-        numerator = value.split("/")[0]
-        denominator = value.split("#expr:")[1]
-        denominator = re.sub("round[1 ]", "", denominator)
-        denominator = denominator.replace("#var:bolttipbase", str(base_value))
-        denominator = eval(denominator)
-        denominator = round(denominator, 1)
-        value = str(numerator) + "/" + str(denominator)
     elif "#expr:" in value:
+        # 1/#expr:1/(40*#var:herbbase) round 1
         # 1/#expr:1/(1800 / 3500) round 1
+        # The #expr: template is the denominator, any #var: is replaced by the base value
         numerator = value.split("/")[0]
         denominator = value.split("#expr:")[1]
-        denominator = re.sub("round[1 ]", "", denominator)
-        denominator = eval(denominator)
-        denominator = round(denominator, 1)
-        value = str(numerator) + "/" + str(denominator)
+        value = f"{numerator}/({denominator})"
     elif ":" in value:
         value = value.split(":")[0]
     else:
@@ -493,7 +458,11 @@ def clean_drop_rarity(value: str, base_value: str = None) -> float:
         value = None
 
     if value is not None:
-        value = float(eval(value))
+        try:
+            value = evaluate_rarity(value, base_value).value
+        except ValueError:
+            print(f"Drop rarity evaluation failed: {value}")
+            value = None
 
     return value
 
@@ -22,20 +22,23 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import logging
-from typing import Dict
-from pathlib import Path
+from typing import Dict, Optional
 
 from cerberus import Validator
 import mwparserfromhell
-from deepdiff import DeepDiff
 
-import config
 from builders import infobox_cleaner
+from builders.build_manifest import fingerprint
+from builders.change_report import change_record
+from builders.json_exporter import serialize_json
 from osrsbox.items_api.item_properties import ItemProperties
 from scripts.wiki.wikitext_parser import WikitextTemplateParser
 
 logger = logging.getLogger(__name__)
 
+# Set the item properties that we want to compare, for items with the same name
+CORRELATION_PROPERTIES = ("wiki_name", "noted", "placeholder", "equipable", "equipable_by_player", "equipable_weapon")
+
 
 class MyValidator(Validator):
     def _validate_description(self, description, field, value):
@@ -72,10 +75,14 @@ class BuildItem:
         self.weapon_stances_data = kwargs["weapon_stances_data"]
         # Dictionary of invalid items
         self.invalid_items_data = kwargs["invalid_items_data"]
-        # A list of already known (processed) items
+        # An index of already known (processed) items
         self.known_items = kwargs["known_items"]
         # The item schema
         self.schema_data = kwargs["schema_data"]
+        # The schema validator, compiled once from the schema
+        self.schema_validator = kwargs["schema_validator"]
+        # An optional cache of infobox templates extracted from the wikitext
+        self.infobox_cache = kwargs.get("infobox_cache")
         # If the JSON should be exported/created
         self.export = kwargs["export"]
         # Specify verbosity
@@ -157,48 +164,78 @@ class BuildItem:
         # Create an ItemProperties object
         item_properties = ItemProperties(**self.item_dict)
 
-        # Set the item properties that we want to compare
-        correlation_properties = {
-            "wiki_name": False,
-            "noted": False,
-            "placeholder": False,
-            "equipable": False,
-            "equipable_by_player": False,
-            "equipable_weapon": False
-        }
+        # Check the known (already processed) items for the same name and correlation properties
+        if self.known_items.is_duplicate(item_properties):
+            self.item_dict["duplicate"] = True
 
-        # Loop the list of currently (already processed) items
-        for known_item in self.known_items:
-            # Do a quick name check before deeper inspection
-            if item_properties.name != known_item.name:
-                continue
+        return item_properties
 
-            # If the cache names are equal, do further inspection
-            for cprop in correlation_properties:
-                if getattr(item_properties, cprop) == getattr(known_item, cprop):
-                    correlation_properties[cprop] = True
+    def input_fingerprint(self) -> str:
+        """Determine the fingerprint of every input used to build this item.
 
-            # Check is all values in correlation properties are True
-            correlation_result = all(value is True for value in correlation_properties.values())
-            if correlation_result:
-                self.item_dict["duplicate"] = True
+        The fingerprint includes the cache data, the wikitext found using the ID,
+        linked ID, name and normalized name, and this item's entries in the invalid
+        items, buy limits, skill requirements, weapon types and weapon stances data.
+        The item does not need to be preprocessed first.
 
-        return item_properties
+        :return: The hex digest of the item inputs.
+        """
+        item_cache_data = self.all_item_cache_data[str(self.item_id)]
+        item_name = item_cache_data["name"]
+
+        linked_id_item = None
+        if item_cache_data["linked_id_item"] is not None:
+            linked_id_item = str(item_cache_data["linked_id_item"])
+
+        # Noted and placeholder items use the linked item for invalid item lookups
+        item_id_to_process = str(self.item_id)
+        if item_cache_data["noted"] is True or item_cache_data["placeholder"] is True:
+            item_id_to_process = linked_id_item
+
+        invalid_item = self.invalid_items_data.get(item_id_to_process)
+        normalized_name = None
+        if isinstance(invalid_item, dict):
+            normalized_name = invalid_item.get("normalized_name")
+
+        weapon_type = self.weapon_types_data.get(str(self.item_id))
+        weapon_stances = None
+        if isinstance(weapon_type, dict):
+            weapon_stances = self.weapon_stances_data.get(weapon_type.get("weapon_type"))
+
+        return fingerprint(item_cache_data,
+                           self.all_wikitext_processed.get(str(self.item_id)),
+                           self.all_wikitext_processed.get(linked_id_item),
+                           self.all_wikitext_raw.get(item_name),
+                           invalid_item,
+                           self.all_wikitext_raw.get(normalized_name),
+                           self.buy_limits_data.get(item_name),
+                           self.skill_requirements.get(str(self.item_id)),
+                           weapon_type,
+                           weapon_stances)
 
     def generate_item_object(self):
-        """Generate the `ItemProperties` object from the item_dict dictionary."""
+        """Generate the `ItemProperties` object, and JSON dictionary, from the item_dict dictionary."""
         self.item_properties = ItemProperties(**self.item_dict)
+        self.item_json = self.item_properties.construct_json()
 
-    def compare_new_vs_old_item(self):
-        """Compare the newly generated item to the existing item in the database."""
-        self.compare_json_files(self.item_properties)
+    def compare_new_vs_old_item(self) -> Optional[Dict]:
+        """Compare the newly generated item to the existing item in the database.
 
-    def export_item_to_json(self):
-        """Export item to JSON, if requested."""
-        if self.export:
-            output_dir = Path(config.DOCS_PATH, "items-json")
-            self.item_properties.export_json(True, output_dir)
+        :return: A change record, or None if the item is unchanged.
+        """
+        return self.compare_json_files(self.item_properties)
+
+    def export_item_to_json(self) -> Optional[str]:
+        """Serialize the item for export to JSON, if requested.
+
+        The JSON file is written by the builder, using a JsonExporter.
+
+        :return: The serialized JSON text, or None if export is not requested.
+        """
         logging.debug(self.item_dict)
+        if self.export:
+            return serialize_json(self.item_json)
+        return None
 
     def preprocessing(self) -> Dict:
         """Preprocess an item, and set important object variables.
@@ -313,7 +350,7 @@ class BuildItem:
             return return_status
 
         # Parse the infobox item
-        infobox_parser = WikitextTemplateParser(self.item_wikitext)
+        infobox_parser = WikitextTemplateParser(self.item_wikitext, self.infobox_cache)
 
         # Try extract infobox for item, then pet
         self.has_infobox = infobox_parser.extract_infobox("infobox item")
@@ -387,7 +424,7 @@ class BuildItem:
                 # fail. So use the normalized name from the invalid-items.json file
                 self.item_wikitext = self.all_wikitext_raw[self.normalized_name]
                 self.wikitext_found_using = "normalized_name"
-                infobox_parser = WikitextTemplateParser(self.item_wikitext)
+                infobox_parser = WikitextTemplateParser(self.item_wikitext, self.infobox_cache)
                 infobox_parser.extract_infobox("infobox item")
                 self.template = infobox_parser.template
                 self.populate_item_properties_from_wiki_data()
@@ -633,7 +670,7 @@ class BuildItem:
         self.item_dict["equipment"] = dict()
 
         # Extract the infobox bonuses template
-        infobox_parser = WikitextTemplateParser(self.item_wikitext)
+        infobox_parser = WikitextTemplateParser(self.item_wikitext, self.infobox_cache)
         has_infobox = infobox_parser.extract_infobox("infobox bonuses")
         if not has_infobox:
             has_infobox = infobox_parser.extract_infobox("infobox_bonuses")
@@ -807,37 +844,20 @@ class BuildItem:
         clean_value = clean_value.replace("]", "")
         return clean_value
 
-    def compare_json_files(self, item_properties: ItemProperties) -> bool:
-        """Print the difference between this item and the database."""
-        # Create JSON out object to compare
-        current_json = item_properties.construct_json()
-
-        # Try get existing entry (KeyError means it doesn't exist - aka a new item)
-        try:
-            existing_json = self.all_db_items[self.item_id]
-        except KeyError:
-            print(f">>> compare_json_files: NEW ITEM: {item_properties.id}")
-            print(current_json)
-            return
-
-        if current_json == existing_json:
-            return
+    def compare_json_files(self, item_properties: ItemProperties) -> Optional[Dict]:
+        """Compare this item to the item in the database.
 
-        ddiff = DeepDiff(existing_json, current_json, ignore_order=True)
-        logging.debug(f">>> compare_json_files: CHANGED ITEM: {item_properties.id}: {item_properties.name}, {item_properties.wiki_name}")
-        print(f">>> compare_json_files: CHANGED ITEM: {item_properties.id}: {item_properties.name}")
-
-        print(ddiff)
-
-        return
+        :param item_properties: The newly generated item.
+        :return: A change record, or None if the item is unchanged.
+        """
+        existing_json = self.all_db_items.get(self.item_id)
+        record = change_record(item_properties.id, item_properties.name, existing_json, self.item_json)
+        if record is not None:
+            logging.debug(f">>> compare_json_files: {record['status'].upper()} ITEM: {item_properties.id}: "
+                          f"{item_properties.name}, {item_properties.wiki_name}")
+        return record
 
     def validate_item(self):
         """Use the schema-items.json file to validate the populated item."""
-        # Create JSON out object to validate
-        current_json = self.item_properties.construct_json()
-
-        # Validate object with schema attached
-        v = config.MyValidator(self.schema_data)
-        v.validate(current_json)
-
-        assert v.validate(current_json)
+        # Validate the JSON object with the compiled schema validator
+        assert self.schema_validator.validate(self.item_json), self.schema_validator.errors
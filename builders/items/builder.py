@@ -21,13 +21,28 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
+import io
+import sys
 import json
 import logging
 import argparse
+import contextlib
+import multiprocessing
 from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
 import config
+from builders import infobox_cleaner
 from builders.items import build_item
+from builders.build_manifest import BuildManifest, fingerprint, source_fingerprint
+from builders.change_report import ChangeReport
+from builders.json_exporter import JsonExporter
+from osrsbox.items_api import item_equipment, item_properties, item_weapon
+from scripts.wiki import wikitext_parser
+from scripts.wiki import page_text_store
+from builders import duplicate_index
+from builders.duplicate_index import DuplicateIndex
+from builders.schema_validator import SchemaValidator
 
 # Configure logging
 log_file_path = Path(Path(__file__).stem+".log")
@@ -39,7 +54,102 @@ logging.basicConfig(filename=Path(__file__).stem+".log",
 logging.info(">>> Starting builders/items/builder.py...")
 
 
-def main(export: bool = False, verbose: bool = False):
+# The read-only inputs for building items, set once in each worker process
+build_inputs = None
+
+
+def init_worker(inputs: Dict):
+    """Set the read-only inputs used to build items in this process.
+
+    :param inputs: A dictionary of BuildItem keyword arguments, shared by every item.
+    """
+    global build_inputs
+    build_inputs = inputs
+
+
+def populate_item(item_id: str) -> Tuple[Dict, str, Dict]:
+    """Preprocess and populate a single item, without checking for duplicates.
+
+    Any printed output is captured and returned, so that output from worker
+    processes can be printed in item order. Any wiki pages parsed for the first
+    time are also returned, so they can be added to the infobox cache of the
+    main process.
+
+    :param item_id: The item ID number to build.
+    :return: A tuple of the populated item dictionary, the printed output, and the newly cached pages.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        builder = build_item.BuildItem(item_id=item_id, known_items=None, **build_inputs)
+        preprocessing_status = builder.preprocessing()
+        if preprocessing_status["status"]:
+            builder.populate_item()
+        else:
+            builder.populate_from_cache_data()
+            builder.populate_non_wiki_item()
+    return builder.item_dict, output.getvalue(), build_inputs["infobox_cache"].pop_new_pages()
+
+
+def merge_duplicate_items(item_ids: List[str], populated_items, reused_item_ids: Set[str], inputs: Dict):
+    """Check each item for duplicates, in item order.
+
+    Duplicate detection depends on every item built before the current item,
+    so it is run in this process, in the same order as a serial build. Reused
+    items (unchanged since the last build) are read from the previous export,
+    and only need to be exported again if the duplicate property changed.
+
+    :param item_ids: The item ID numbers, in build order.
+    :param populated_items: An iterable of populate_item results, for each item that is not reused.
+        Newly parsed wiki pages are added to the infobox cache of the inputs.
+    :param reused_item_ids: The item ID numbers to read from the previous export.
+    :param inputs: A dictionary of BuildItem keyword arguments, shared by every item.
+    :return: A generator of (item ID, item dictionary, printed output) tuples, for items to finish.
+    """
+    known_items = DuplicateIndex(build_item.CORRELATION_PROPERTIES)
+    populated_items = iter(populated_items)
+    for item_id in item_ids:
+        if item_id in reused_item_ids:
+            with open(Path(config.DOCS_PATH / "items-json" / f"{item_id}.json")) as f:
+                item_dict = json.load(f)
+            previous_duplicate = item_dict["duplicate"]
+            output = ""
+        else:
+            item_dict, output, new_pages = next(populated_items)
+            inputs["infobox_cache"].update(new_pages)
+            previous_duplicate = None
+
+        builder = build_item.BuildItem(item_id=item_id, known_items=known_items, **inputs)
+        builder.item_dict = item_dict
+        known_item = builder.check_duplicate_item()
+        known_items.append(known_item)
+        if builder.item_dict["duplicate"] != previous_duplicate:
+            yield item_id, builder.item_dict, output
+
+
+def finish_item(finish_item_data: Tuple[str, Dict, str]) -> Tuple[str, str, Optional[Dict], Optional[str]]:
+    """Generate, compare, serialize and validate a single item, after checking for duplicates.
+
+    The serialized JSON is returned, so that every JSON file is written by the
+    JsonExporter of the main process.
+
+    :param finish_item_data: A tuple of (item ID, item dictionary, printed output) from merge_duplicate_items.
+    :return: A tuple of the item ID, the printed output of building the item, the change record
+        (None if unchanged), and the serialized JSON (None if export is not requested).
+    """
+    item_id, item_dict, populate_output = finish_item_data
+    output = io.StringIO(populate_output)
+    output.seek(0, io.SEEK_END)
+    with contextlib.redirect_stdout(output):
+        builder = build_item.BuildItem(item_id=item_id, known_items=None, **build_inputs)
+        builder.item_dict = item_dict
+        builder.generate_item_object()
+        record = builder.compare_new_vs_old_item()
+        json_text = builder.export_item_to_json()
+        builder.validate_item()
+    return item_id, output.getvalue(), record, json_text
+
+
+def main(export: bool = False, verbose: bool = False, workers: int = 1, full: bool = False):
     # Load the current database contents
     items_compltete_file_path = Path(config.DOCS_PATH / "items-complete.json")
     with open(items_compltete_file_path) as f:
@@ -47,8 +157,7 @@ def main(export: bool = False, verbose: bool = False):
 
     # Load the item wikitext file
     wiki_text_file_path = Path(config.DATA_WIKI_PATH / "page-text-items.json")
-    with open(wiki_text_file_path) as f:
-        all_wikitext_raw = json.load(f)
+    all_wikitext_raw = page_text_store.load_page_text(wiki_text_file_path)
 
     # Temp loading of item ID -> wikitext
     processed_wikitextfile_path = Path(config.DATA_WIKI_PATH / "processed-wikitext-items.json")
@@ -91,49 +200,90 @@ def main(export: bool = False, verbose: bool = False):
     with open(schema_file_path) as f:
         schema_data = json.load(f)
 
-    # Initialize a list of known items
-    known_items = list()
-
-    # Start processing every item!
-    for item_id in all_item_cache_data:
-        # Toggle to start, stop at a specific item ID
-        # if int(item_id) < 24300:
-        #     continue
-
-        # Initialize the BuildItem class, used for all items
-        builder = build_item.BuildItem(item_id=item_id,
-                                       all_item_cache_data=all_item_cache_data,
-                                       all_wikitext_processed=all_wikitext_processed,
-                                       all_wikitext_raw=all_wikitext_raw,
-                                       all_db_items=all_db_items,
-                                       buy_limits_data=buy_limits_data,
-                                       skill_requirements_data=skill_requirements_data,
-                                       weapon_types_data=weapon_types_data,
-                                       weapon_stances_data=weapon_stances_data,
-                                       invalid_items_data=invalid_items_data,
-                                       known_items=known_items,
-                                       schema_data=schema_data,
-                                       export=export,
-                                       verbose=verbose)
+    # Load the infobox templates of every previously parsed wiki page
+    infobox_cache = wikitext_parser.InfoboxCache(Path(config.DATA_WIKI_PATH / "infobox-cache-items.json"))
 
-        preprocessing_status = builder.preprocessing()
-        if preprocessing_status["status"]:
-            builder.populate_item()
-            known_item = builder.check_duplicate_item()
-            known_items.append(known_item)
-            builder.generate_item_object()
-            builder.compare_new_vs_old_item()
-            builder.export_item_to_json()
-            builder.validate_item()
-        else:
-            builder.populate_from_cache_data()
-            builder.populate_non_wiki_item()
-            known_item = builder.check_duplicate_item()
-            known_items.append(known_item)
-            builder.generate_item_object()
-            builder.compare_new_vs_old_item()
-            builder.export_item_to_json()
-            builder.validate_item()
+    # Read-only inputs shared by every BuildItem
+    inputs = {
+        "all_item_cache_data": all_item_cache_data,
+        "all_wikitext_processed": all_wikitext_processed,
+        "all_wikitext_raw": all_wikitext_raw,
+        "all_db_items": all_db_items,
+        "buy_limits_data": buy_limits_data,
+        "skill_requirements_data": skill_requirements_data,
+        "weapon_types_data": weapon_types_data,
+        "weapon_stances_data": weapon_stances_data,
+        "invalid_items_data": invalid_items_data,
+        "schema_data": schema_data,
+        "schema_validator": SchemaValidator(schema_data),
+        "infobox_cache": infobox_cache,
+        "export": export,
+        "verbose": verbose
+    }
+
+    # Toggle to start, stop at a specific item ID
+    item_ids = [item_id for item_id in all_item_cache_data]
+    # item_ids = [item_id for item_id in all_item_cache_data if int(item_id) >= 24300]
+
+    # Load the input fingerprints of the last exported build, unless a full build is requested
+    # Any change to the schema or builder source code (including this module) rebuilds every item
+    manifest_header = {
+        "schema": fingerprint(schema_data),
+        "source": source_fingerprint(sys.modules[__name__], build_item, duplicate_index, infobox_cleaner,
+                                     wikitext_parser, item_properties, item_equipment, item_weapon)
+    }
+    manifest = BuildManifest(Path(config.DATA_ITEMS_PATH / "items-build-manifest.json"),
+                             manifest_header,
+                             full=full or not export)
+
+    # Reuse the exported JSON of every item with unchanged inputs
+    reused_item_ids = set()
+    for item_id in item_ids:
+        item_fingerprint = build_item.BuildItem(item_id=item_id, known_items=None, **inputs).input_fingerprint()
+        manifest.update(item_id, item_fingerprint)
+        if (manifest.is_unchanged(item_id, item_fingerprint) and
+                Path(config.DOCS_PATH / "items-json" / f"{item_id}.json").exists()):
+            reused_item_ids.add(item_id)
+    build_item_ids = [item_id for item_id in item_ids if item_id not in reused_item_ids]
+    print(f"Building {len(build_item_ids)} items, reusing {len(reused_item_ids)} unchanged items...")
+
+    # Report every new or changed item, compared to the current database
+    change_report = ChangeReport(Path(config.DATA_ITEMS_PATH / "items-change-report.jsonl"))
+
+    # Write the JSON file of every item in a background thread, skipping unchanged files
+    json_exporter = JsonExporter(Path(config.DOCS_PATH / "items-json")) if export else None
+
+    if workers > 1:
+        # Each worker process receives the read-only inputs once, when it is started
+        chunksize = max(1, len(build_item_ids) // (workers * 4))
+        with multiprocessing.Pool(workers, initializer=init_worker, initargs=(inputs,)) as pool:
+            populated_items = pool.imap(populate_item, build_item_ids, chunksize=chunksize)
+            finish_items = merge_duplicate_items(item_ids, populated_items, reused_item_ids, inputs)
+            for item_id, output, record, json_text in pool.imap(finish_item, finish_items, chunksize=chunksize):
+                print(output, end="")
+                change_report.add(record)
+                if json_text is not None:
+                    json_exporter.write(f"{item_id}.json", json_text)
+    else:
+        init_worker(inputs)
+        populated_items = map(populate_item, build_item_ids)
+        finish_items = merge_duplicate_items(item_ids, populated_items, reused_item_ids, inputs)
+        for item_id, output, record, json_text in map(finish_item, finish_items):
+            print(output, end="")
+            change_report.add(record)
+            if json_text is not None:
+                json_exporter.write(f"{item_id}.json", json_text)
+
+    change_report.close()
+    if json_exporter is not None:
+        json_exporter.close()
+
+    # Save the input fingerprints, only if the items were exported
+    if export:
+        manifest.save()
+
+    # Save the infobox cache, removing unused pages if every item was built
+    infobox_cache.save(prune=not reused_item_ids)
 
     # Done processing, rejoice!
     print("Done.")
@@ -149,8 +299,18 @@ if __name__ == "__main__":
                         default=False,
                         required=False,
                         help='A boolean of whether to be verbose.')
+    parser.add_argument('--workers',
+                        default=1,
+                        type=int,
+                        required=False,
+                        help='The number of worker processes used to build items.')
+    parser.add_argument('--full',
+                        action='store_true',
+                        help='Rebuild every item, instead of only items with changed inputs.')
     args = parser.parse_args()
 
     export = args.export
     verbose = args.verbose
-    main(export, verbose)
+    workers = args.workers
+    full = args.full
+    main(export, verbose, workers, full)
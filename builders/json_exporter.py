@@ -0,0 +1,119 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A background writer for exporting item and monster JSON files, that only
+replaces files with changed contents.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# The maximum number of files waiting to be written, before export blocks
+QUEUE_SIZE = 1024
+
+
+def serialize_json(json_dict: Dict) -> str:
+    """Serialize an item or monster to the exported (pretty printed) JSON format.
+
+    :param json_dict: The item or monster dictionary.
+    :return: The JSON text.
+    """
+    return json.dumps(json_dict, indent=4)
+
+
+class JsonExporter:
+    """This class writes exported JSON files in a background thread.
+
+    Each file is compared to the existing file, and is only replaced if the
+    contents changed, so that unchanged files keep the same modification time.
+    Changed files are written to a temporary file, then renamed over the
+    existing file, so a file is never partially written.
+
+    :param output_dir: The directory to write the JSON files to.
+    """
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        self.written_count = 0
+        self.skipped_count = 0
+        self.error: Optional[BaseException] = None
+        self.queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(QUEUE_SIZE)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, file_name: str, json_text: str) -> None:
+        """Queue a JSON file to be written, if the contents changed.
+
+        :param file_name: The JSON file name, such as `4151.json`.
+        :param json_text: The serialized JSON text.
+        :raises OSError: A previous file could not be written.
+        """
+        if self.error is not None:
+            raise self.error
+        self.queue.put((file_name, json_text))
+
+    def close(self) -> None:
+        """Wait for every queued file to be written, then print the written and skipped counts.
+
+        :raises OSError: A file could not be written.
+        """
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+        print(f"Exported {self.written_count} changed files, skipped {self.skipped_count} unchanged files "
+              f"to: {self.output_dir}")
+
+    def _run(self) -> None:
+        """Write queued files until the queue is closed."""
+        while True:
+            queued_file = self.queue.get()
+            if queued_file is None:
+                return
+            if self.error is not None:
+                # Keep emptying the queue, so that write does not block
+                continue
+            try:
+                self._write_file(*queued_file)
+            except OSError as e:
+                self.error = e
+
+    def _write_file(self, file_name: str, json_text: str) -> None:
+        """Write a single JSON file, if the contents changed.
+
+        :param file_name: The JSON file name.
+        :param json_text: The serialized JSON text.
+        """
+        data = json_text.encode("utf-8")
+        file_path = Path(self.output_dir / file_name)
+        try:
+            if file_path.stat().st_size == len(data) and file_path.read_bytes() == data:
+                self.skipped_count += 1
+                return
+        except FileNotFoundError:
+            pass
+
+        temp_file_path = file_path.with_name(f"{file_name}.{os.getpid()}.tmp")
+        temp_file_path.write_bytes(data)
+        os.replace(temp_file_path, file_path)
+        self.written_count += 1
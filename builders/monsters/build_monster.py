@@ -22,20 +22,46 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import logging
-from pathlib import Path
+from fractions import Fraction
+from typing import Dict, Optional
 
 import mwparserfromhell
-from deepdiff import DeepDiff
 
-import config
-import drop_tables
+from builders.monsters import drop_tables
 from builders import infobox_cleaner
+from builders.build_manifest import fingerprint
+from builders.change_report import change_record
+from builders.json_exporter import serialize_json
 from scripts.wiki import wikitext_parser
 from scripts.wiki.wikitext_parser import WikitextTemplateParser
+from osrsbox.items_api.all_items import AllItems
+from osrsbox.items_api.item_properties import ItemProperties
+from osrsbox.monsters_api.drop_rarity import evaluate_rarity
 from osrsbox.monsters_api.monster_properties import MonsterProperties
 
 logger = logging.getLogger(__name__)
 
+# Set the monster properties that we want to compare, for monsters with the same name
+CORRELATION_PROPERTIES = ("wiki_name", "combat_level", "members")
+
+
+def build_item_name_index(all_db_items: AllItems) -> Dict[str, ItemProperties]:
+    """Index every item by name and wiki_name, used to find the item of each monster drop.
+
+    Items are indexed in database order, and a name is only indexed for the
+    first item with a matching name or wiki_name, so a lookup returns the same
+    item as a scan of the database for the first match.
+
+    :param all_db_items: The item database.
+    :return: A dictionary of item name (or wiki name) to the first matching item.
+    """
+    item_name_index = dict()
+    for item in all_db_items:
+        item_name_index.setdefault(item.name, item)
+        if item.wiki_name is not None:
+            item_name_index.setdefault(item.wiki_name, item)
+    return item_name_index
+
 
 class BuildMonster:
     def __init__(self, **kwargs):
@@ -51,10 +77,16 @@ class BuildMonster:
         self.all_db_monsters = kwargs["all_db_monsters"]
         # The existing item database contents
         self.all_db_items = kwargs["all_db_items"]
-        # A list of already known (processed) monsters
+        # An index of item name and wiki_name to item, shared by every monster
+        self.item_name_index = kwargs["item_name_index"]
+        # An index of already known (processed) monsters
         self.known_monsters = kwargs["known_monsters"]
         # The monster schema
         self.schema_data = kwargs["schema_data"]
+        # The schema validator, compiled once from the schema
+        self.schema_validator = kwargs["schema_validator"]
+        # An optional cache of infobox templates extracted from the wikitext
+        self.infobox_cache = kwargs.get("infobox_cache")
         # If the JSON should be exported/created
         self.export = kwargs["export"]
         # Specify verbosity
@@ -120,19 +152,28 @@ class BuildMonster:
             "drops"]
 
     def generate_monster_object(self):
-        """Generate the `MonsterProperties` object from the monster_dict dictionary."""
+        """Generate the `MonsterProperties` object, and JSON dictionary, from the monster_dict dictionary."""
         self.monster_properties = MonsterProperties(**self.monster_dict)
+        self.monster_json = self.monster_properties.construct_json()
 
-    def compare_new_vs_old_monster(self):
-        """Compare the newly generated monster to the existing monster in the database."""
-        self.compare_json_files(self.monster_properties)
+    def compare_new_vs_old_monster(self) -> Optional[Dict]:
+        """Compare the newly generated monster to the existing monster in the database.
 
-    def export_monster_to_json(self):
-        """Export monster to JSON, if requested."""
-        if self.export:
-            output_dir = Path(config.DOCS_PATH, "monsters-json")
-            self.monster_properties.export_json(True, output_dir)
+        :return: A change record, or None if the monster is unchanged.
+        """
+        return self.compare_json_files(self.monster_properties)
+
+    def export_monster_to_json(self) -> Optional[str]:
+        """Serialize the monster for export to JSON, if requested.
+
+        The JSON file is written by the builder, using a JsonExporter.
+
+        :return: The serialized JSON text, or None if export is not requested.
+        """
         logging.debug(self.monster_dict)
+        if self.export:
+            return serialize_json(self.monster_json)
+        return None
 
     def check_duplicate_monster(self) -> MonsterProperties:
         """Determine if this is a duplicate monster.
@@ -144,30 +185,25 @@ class BuildMonster:
         # Create an MonsterProperties object
         monster_properties = MonsterProperties(**self.monster_dict)
 
-        # Set the monster properties that we want to compare
-        correlation_properties = {
-            "wiki_name": False,
-            "combat_level": False,
-            "members": False
-        }
-
-        # Loop the list of currently (already processed) monsters
-        for known_monster in self.known_monsters:
-            # Do a quick name check before deeper inspection
-            if monster_properties.name != known_monster.name:
-                continue
+        # Check the known (already processed) monsters for the same name and correlation properties
+        if self.known_monsters.is_duplicate(monster_properties):
+            self.monster_dict["duplicate"] = True
+
+        return monster_properties
 
-            # If the cache names are equal, do further inspection
-            for cprop in correlation_properties:
-                if getattr(monster_properties, cprop) == getattr(known_monster, cprop):
-                    correlation_properties[cprop] = True
+    def input_fingerprint(self) -> str:
+        """Determine the fingerprint of the inputs used to build this monster.
 
-            # Check is all values in correlation properties are True
-            correlation_result = all(value is True for value in correlation_properties.values())
-            if correlation_result:
-                self.monster_dict["duplicate"] = True
+        The fingerprint includes the cache data, and the wikitext found using the
+        ID and name. The items database is shared by every monster, so it is not
+        included. The monster does not need to be preprocessed first.
 
-        return monster_properties
+        :return: The hex digest of the monster inputs.
+        """
+        monster_cache_data = self.all_monster_cache_data[str(self.monster_id)]
+        return fingerprint(monster_cache_data,
+                           self.all_wikitext_processed.get(str(self.monster_id)),
+                           self.all_wikitext_raw.get(monster_cache_data["name"]))
 
     def preprocessing(self):
         """Preprocess an monster, and set important object variables.
@@ -216,7 +252,7 @@ class BuildMonster:
             return False
 
         # Parse the infobox monster
-        infobox_parser = WikitextTemplateParser(self.monster_wikitext)
+        infobox_parser = WikitextTemplateParser(self.monster_wikitext, self.infobox_cache)
 
         # Try extract infobox for monster
         self.has_infobox = infobox_parser.extract_infobox("infobox monster")
@@ -596,15 +632,15 @@ class BuildMonster:
         if not self.monster_dict.get("incomplete"):
             self.monster_dict["incomplete"] = False
 
-    def extract_dropsline_header(self, table_head_type: str) -> float:
+    def extract_dropsline_header(self, table_head_type: str) -> Optional[Fraction]:
         """Parse the dropstablehead template for variable drop rarity values.
 
         :param table_head_type: Specify a seed, or herb table head search.
-        :return: A float of the drop rarity multiplier.
+        :return: A fraction of the drop rarity multiplier.
         """
         # Extract "dropstablehead" templates
         # This is used for extracting "herbbase" and "seedbase" values
-        self.drops_templates = wikitext_parser.extract_wikitext_template(self.monster_wikitext, "dropstablehead")
+        self.drops_templates = wikitext_parser.filter_wikitext_templates(self.monster_templates, "dropstablehead")
 
         table_head_value = None
 
@@ -618,8 +654,7 @@ class BuildMonster:
                 # {{DropsTableHead{{#vardefine:herbbase|{{#expr:9/123/128}}}}}}
                 table_head_value = template.split("#expr:")[1]
                 table_head_value = table_head_value.replace("}", "")
-                table_head_value = eval(table_head_value)
-                return table_head_value
+                return evaluate_rarity(table_head_value).fraction
 
     def parse_monster_drops(self):
         """Extract monster drop information.
@@ -629,8 +664,11 @@ class BuildMonster:
         to determine the ID, name, quantity, rarity and and requirements of the
         specific drop.
         """
+        # Parse the monster wikitext once, the templates are used for every drop and drop table
+        self.monster_templates = mwparserfromhell.parse(self.monster_wikitext).filter_templates()
+
         # Extract "dropsline" templates
-        self.drops_templates = wikitext_parser.extract_wikitext_template(self.monster_wikitext, "dropsline")
+        self.drops_templates = wikitext_parser.filter_wikitext_templates(self.monster_templates, "dropsline")
 
         drops_dict_all = dict()
         drops_list_ids = list()
@@ -662,15 +700,8 @@ class BuildMonster:
                 continue
 
             # Determine the drop item ID
-            item_id = None
-            found = False
-            for item in self.all_db_items:
-                if item.name == name or item.wiki_name == name:
-                    found = True
-                    item_id = item.id
-                    break
-            if not found:
-                item_id = None
+            drop_item = self.item_name_index.get(name)
+            item_id = drop_item.id if drop_item is not None else None
 
             # Extract the item drop quantity and if the drop is noted
             quantity = template_parser.extract_infobox_value("Quantity")
@@ -686,7 +717,7 @@ class BuildMonster:
             if self.monster_dict["members"]:
                 members = True
             elif item_id:
-                if self.all_db_items[item_id].members:
+                if drop_item.members:
                     members = True
             elif name_notes:
                 if "{{m}}" in name_notes:
@@ -732,71 +763,72 @@ class BuildMonster:
                 drops_list_ids.append(str(item_id))
                 drops_dict_all[str(item_id)] = drop_dict
 
-        # Handle any embedded drop tables
-        if "talismandroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.talisman(self.monster_wikitext[2])
+        # Handle any embedded drop tables, using the already parsed monster templates
+        monster_wikitext_lower = self.monster_wikitext[2].lower()
+        if "talismandroptable2" in monster_wikitext_lower:
+            items = drop_tables.talisman(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "catacombsdroptable" in self.monster_wikitext[2].lower():
+        if "catacombsdroptable" in monster_wikitext_lower:
             items = drop_tables.catacombs(self.monster_dict["name"],
                                           self.monster_dict["hitpoints"],
-                                          self.monster_wikitext[2])
+                                          self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "herbdroptable2" in self.monster_wikitext[2].lower():
+        if "herbdroptable2" in monster_wikitext_lower:
             items = drop_tables.herb(self.monster_dict["members"],
-                                     self.monster_wikitext[2])
+                                     self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "usefulherbdroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.usefulherb(self.monster_wikitext[2])
+        if "usefulherbdroptable2" in monster_wikitext_lower:
+            items = drop_tables.usefulherb(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "fixedallotmentseeddroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.fixedallotmentseed(self.monster_wikitext[2])
+        if "fixedallotmentseeddroptable2" in monster_wikitext_lower:
+            items = drop_tables.fixedallotmentseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "dropsallotmenttable" in self.monster_wikitext[2].lower():
-            items = drop_tables.fixedallotmentseed(self.monster_wikitext[2])
+        if "dropsallotmenttable" in monster_wikitext_lower:
+            items = drop_tables.fixedallotmentseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "treeherbseeddroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.treeseed(self.monster_wikitext[2])
+        if "treeherbseeddroptable2" in monster_wikitext_lower:
+            items = drop_tables.treeseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "rareseeddroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.rareseed(self.monster_wikitext[2])
+        if "rareseeddroptable2" in monster_wikitext_lower:
+            items = drop_tables.rareseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "variableallotmentseeddroptale2" in self.monster_wikitext[2].lower():
-            items = drop_tables.variableallotmentseed(self.monster_wikitext[2])
+        if "variableallotmentseeddroptale2" in monster_wikitext_lower:
+            items = drop_tables.variableallotmentseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "manyseeddroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.commonseed(self.monster_wikitext[2])
+        if "manyseeddroptable2" in monster_wikitext_lower:
+            items = drop_tables.commonseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "hopsdroptable2" in self.monster_wikitext[2].lower():
-            items = drop_tables.hopsseed(self.monster_wikitext[2])
+        if "hopsdroptable2" in monster_wikitext_lower:
+            items = drop_tables.hopsseed(self.monster_templates)
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if "superiordroptable" in self.monster_wikitext[2].lower():
+        if "superiordroptable" in monster_wikitext_lower:
             items = drop_tables.superior(self.monster_dict["slayer_level"])
             for item, item_dict in items.items():
                 drops_list_ids.append(str(item))
                 drops_dict_all[str(item)] = item_dict
-        if ("wildernessslayerdroptable" in self.monster_wikitext[2].lower() and
+        if ("wildernessslayerdroptable" in monster_wikitext_lower and
                 "krystilia" in self.monster_dict["slayer_masters"]):
             items = drop_tables.wildernessslayer(self.monster_dict["name"],
                                                  self.monster_dict["combat_level"], self.monster_dict["hitpoints"],
@@ -838,52 +870,20 @@ class BuildMonster:
         except ValueError:
             return value
 
-    def compare_json_files(self, monster_properties: MonsterProperties) -> bool:
-        """Print the difference between this monster object, and the monster that exists in the database."""
-        # Create JSON out object to compare
-        current_json = monster_properties.construct_json()
-        current_drops = current_json["drops"]
-        del current_json["drops"]
-
-        # Try get existing entry (KeyError means it doesn't exist - aka a new monster)
-        try:
-            existing_json = self.all_db_monsters[self.monster_id]
-            existing_drops = existing_json["drops"]
-            del existing_json["drops"]
-        except KeyError:
-            print(f">>> compare_json_files: NEW MONSTER: {monster_properties.id}")
-            print(current_json)
-            return
-
-        # Quick check of eqaulity, return if properties and drops are the same
-        if current_json == existing_json:
-            if current_drops == existing_drops:
-                return
-
-        # Print a header for the changed monster
-        logging.debug(f">>> compare_json_files: CHANGED MONSTER: {monster_properties.id}: {monster_properties.name}, {monster_properties.wiki_name}")
-        print(f">>> compare_json_files: CHANGED MONSTER: {monster_properties.id}: {monster_properties.name}")
-
-        # First check the base properties
-        ddiff_props = DeepDiff(existing_json, current_json, ignore_order=True)
-        if ddiff_props:
-            print("  > CHANGED BASE PROPERTIES...")
-            print(ddiff_props)
-
-        ddiff_drops = DeepDiff(existing_drops, current_drops, ignore_order=True)
-        if ddiff_drops:
-            print("  > CHANGED DROP PROPERTIES...")
-            print(ddiff_drops)
+    def compare_json_files(self, monster_properties: MonsterProperties) -> Optional[Dict]:
+        """Compare this monster to the monster in the database.
 
-        return
+        :param monster_properties: The newly generated monster.
+        :return: A change record, or None if the monster is unchanged.
+        """
+        existing_json = self.all_db_monsters.get(self.monster_id)
+        record = change_record(monster_properties.id, monster_properties.name, existing_json, self.monster_json)
+        if record is not None:
+            logging.debug(f">>> compare_json_files: {record['status'].upper()} MONSTER: {monster_properties.id}: "
+                          f"{monster_properties.name}, {monster_properties.wiki_name}")
+        return record
 
     def validate_monster(self):
         """Use the schema-monsters.json file to validate the populated monster."""
-        # Create JSON out object to validate
-        current_json = self.monster_properties.construct_json()
-
-        # Validate object with schema attached
-        v = config.MyValidator(self.schema_data)
-        v.validate(current_json)
-
-        assert v.validate(current_json)
+        # Validate the JSON object with the compiled schema validator
+        assert self.schema_validator.validate(self.monster_json), self.schema_validator.errors
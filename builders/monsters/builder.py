@@ -21,15 +21,28 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
+import sys
 import json
 import logging
 import argparse
 from pathlib import Path
 
 import config
+from builders import infobox_cleaner
 from builders.monsters import build_monster
+from builders import duplicate_index
+from builders.duplicate_index import DuplicateIndex
+from builders.schema_validator import SchemaValidator
+from builders.build_manifest import BuildManifest, fingerprint, source_fingerprint
+from builders.change_report import ChangeReport
+from builders.json_exporter import JsonExporter
+from scripts.wiki import wikitext_parser
+from scripts.wiki import page_text_store
 
 from osrsbox import items_api
+from osrsbox.snapshot import file_hash
+from osrsbox.items_api import all_items
+from osrsbox.monsters_api import monster_drop, monster_properties
 
 # Configure logging
 log_file_path = Path(Path(__file__).stem+".log")
@@ -41,7 +54,7 @@ logging.basicConfig(filename=Path(__file__).stem+".log",
 logging.info(">>> Starting builders/monsters/builder.py...")
 
 
-def main(export: bool = False, verbose: bool = False):
+def main(export: bool = False, verbose: bool = False, full: bool = False):
     # Load the current database contents
     monsters_complete_file_path = Path(config.DOCS_PATH / "monsters-complete.json")
     with open(monsters_complete_file_path) as f:
@@ -50,10 +63,12 @@ def main(export: bool = False, verbose: bool = False):
     # Load the current item database contents
     all_db_items = items_api.load()
 
+    # Index the items by name and wiki_name once, used to find the item of every monster drop
+    item_name_index = build_monster.build_item_name_index(all_db_items)
+
     # Load the item wikitext file
     wiki_text_file_path = Path(config.DATA_WIKI_PATH / "page-text-monsters.json")
-    with open(wiki_text_file_path) as f:
-        all_wikitext_raw = json.load(f)
+    all_wikitext_raw = page_text_store.load_page_text(wiki_text_file_path)
 
     # Temp loading of monster ID -> wikitext
     processed_wikitextfile_path = Path(config.DATA_WIKI_PATH / "processed-wikitext-monsters.json")
@@ -71,8 +86,35 @@ def main(export: bool = False, verbose: bool = False):
     with open(schema_file_path) as f:
         schema_data = json.load(f)
 
-    # Initialize a list of known monsters
-    known_monsters = list()
+    # Compile the schema validator once, used to validate every monster
+    schema_validator = SchemaValidator(schema_data)
+
+    # Load the infobox templates of every previously parsed wiki page
+    infobox_cache = wikitext_parser.InfoboxCache(Path(config.DATA_WIKI_PATH / "infobox-cache-monsters.json"))
+
+    # Initialize an index of known monsters, used for duplicate detection
+    known_monsters = DuplicateIndex(build_monster.CORRELATION_PROPERTIES)
+
+    # Load the input fingerprints of the last exported build, unless a full build is requested
+    # Any change to the schema, items database, builder source code (including this module) or drop tables
+    # rebuilds every monster
+    manifest_header = {
+        "schema": fingerprint(schema_data),
+        "items": file_hash(all_items.PATH_TO_ITEMS_COMPLETE_JSON),
+        "source": source_fingerprint(sys.modules[__name__], build_monster, build_monster.drop_tables, duplicate_index,
+                                     infobox_cleaner, wikitext_parser, monster_properties, monster_drop),
+        "drop_tables": file_hash(build_monster.drop_tables.PATH_TO_DROP_TABLES_JSON)
+    }
+    manifest = BuildManifest(Path(config.DATA_MONSTERS_PATH / "monsters-build-manifest.json"),
+                             manifest_header,
+                             full=full or not export)
+    reused_monsters_count = 0
+
+    # Report every new or changed monster, compared to the current database
+    change_report = ChangeReport(Path(config.DATA_MONSTERS_PATH / "monsters-change-report.jsonl"))
+
+    # Write the JSON file of every monster in a background thread, skipping unchanged files
+    json_exporter = JsonExporter(Path(config.DOCS_PATH / "monsters-json")) if export else None
 
     # Start processing every monster!
     for monster_id in all_monster_cache_data:
@@ -87,22 +129,66 @@ def main(export: bool = False, verbose: bool = False):
                                              all_wikitext_raw=all_wikitext_raw,
                                              all_db_monsters=all_db_monsters,
                                              all_db_items=all_db_items,
+                                             item_name_index=item_name_index,
                                              known_monsters=known_monsters,
                                              schema_data=schema_data,
+                                             schema_validator=schema_validator,
+                                             infobox_cache=infobox_cache,
                                              export=export,
                                              verbose=verbose)
 
+        # Reuse the exported JSON of a monster with unchanged inputs
+        monster_fingerprint = builder.input_fingerprint()
+        if manifest.is_unchanged(monster_id, monster_fingerprint):
+            monster_json_file_path = Path(config.DOCS_PATH / "monsters-json" / f"{monster_id}.json")
+            if not manifest.was_exported(monster_id):
+                manifest.update(monster_id, monster_fingerprint, exported=False)
+                reused_monsters_count += 1
+                continue
+            if monster_json_file_path.exists():
+                with open(monster_json_file_path) as f:
+                    builder.monster_dict = json.load(f)
+                previous_duplicate = builder.monster_dict["duplicate"]
+                known_monster = builder.check_duplicate_monster()
+                known_monsters.append(known_monster)
+                # Only export again if the duplicate property changed
+                if builder.monster_dict["duplicate"] != previous_duplicate:
+                    builder.generate_monster_object()
+                    change_report.add(builder.compare_new_vs_old_monster())
+                    json_text = builder.export_monster_to_json()
+                    if json_text is not None:
+                        json_exporter.write(f"{monster_id}.json", json_text)
+                    builder.validate_monster()
+                manifest.update(monster_id, monster_fingerprint)
+                reused_monsters_count += 1
+                continue
+
         status = builder.preprocessing()
+        manifest.update(monster_id, monster_fingerprint, exported=bool(status))
         if status:
             builder.populate_monster()
             known_monster = builder.check_duplicate_monster()
             known_monsters.append(known_monster)
             builder.parse_monster_drops()
             builder.generate_monster_object()
-            builder.compare_new_vs_old_monster()
-            builder.export_monster_to_json()
+            change_report.add(builder.compare_new_vs_old_monster())
+            json_text = builder.export_monster_to_json()
+            if json_text is not None:
+                json_exporter.write(f"{monster_id}.json", json_text)
             builder.validate_monster()
 
+    print(f"Reused {reused_monsters_count} unchanged monsters.")
+    change_report.close()
+    if json_exporter is not None:
+        json_exporter.close()
+
+    # Save the input fingerprints, only if the monsters were exported
+    if export:
+        manifest.save()
+
+    # Save the infobox cache, removing unused pages if every monster was built
+    infobox_cache.save(prune=reused_monsters_count == 0)
+
     # Done processing, rejoice!
     print("Done.")
 
@@ -117,8 +203,12 @@ if __name__ == "__main__":
                         default=False,
                         required=False,
                         help='A boolean of whether to be verbose.')
+    parser.add_argument('--full',
+                        action='store_true',
+                        help='Rebuild every monster, instead of only monsters with changed inputs.')
     args = parser.parse_args()
 
     export = args.export
     verbose = args.verbose
-    main(export)
+    full = args.full
+    main(export, full=full)
@@ -6,6 +6,11 @@ Website: https://www.osrsbox.com
 Description:
 Populate hard-coded drop tables for monsters.
 
+The items on each drop table are loaded once from the drop tables data file,
+and the rarity of every item is precomputed as a factor of the drop table rate.
+Each function finds the drop table template in the already parsed monster
+templates, then scales the precomputed rarities by the drop table rate.
+
 Copyright (c) 2020, PH01L
 
 ###############################################################################
@@ -21,20 +26,134 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
+import re
 import math
+import json
 import logging
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
 from fractions import Fraction
 
-import mwparserfromhell
+import config
+from osrsbox.monsters_api.drop_rarity import evaluate_rarity
 
 logger = logging.getLogger(__name__)
 
+PATH_TO_DROP_TABLES_JSON = Path(config.DATA_MONSTERS_PATH / "monsters-drop-tables.json")
+
+# The rate used to scale drop table items without a named rate
+BASE_RATE = "base"
+
+# Watermelon seeds on the tree seed drop table are dropped 15 at a time, per multiplier
+WATERMELON_SEED_ID = "5321"
+WATERMELON_SEED_QUANTITIES = {"1": "15", "2": "30", "2-3": "30-45"}
+
+
+class DropTable(NamedTuple):
+    """A drop table loaded from the drop tables data file.
+
+    :param templates: The (lower case) template names used to find the drop table.
+    :param items: The item dictionaries on the drop table, ordered by drop table position.
+    :param factors: The rarity of each item, as a factor of the item rate, or None to use the rate.
+    :param rates: The name of the rate used to scale each item rarity.
+    """
+    templates: List[str]
+    items: List[Dict]
+    factors: List[Optional[float]]
+    rates: List[str]
+
+
+def parse_rarity_factor(rarity: str) -> float:
+    """Parse a rarity factor from the drop tables data file, such as `1/128 * 1/16`.
+
+    The factor is evaluated left to right, which matches Python evaluation of
+    the same expression.
+
+    :param rarity: The rarity factor expression.
+    :return: The rarity factor.
+    :raises ValueError: The rarity factor is not a product of fractions.
+    """
+    tokens = re.split(r"\s*([*/])\s*", rarity.strip())
+    factor = float(tokens[0])
+    for operator, operand in zip(tokens[1::2], tokens[2::2]):
+        if operator == "*":
+            factor *= float(operand)
+        else:
+            factor /= float(operand)
+    return factor
+
+
+def load_drop_tables(path_to_drop_tables: Path) -> Dict[str, DropTable]:
+    """Load the drop tables data file, and precompute the rarity factor of every item.
+
+    :param path_to_drop_tables: The path to the drop tables JSON file.
+    :return: A dictionary of drop table name to drop table.
+    """
+    with open(path_to_drop_tables) as f:
+        drop_tables_data = json.load(f)
+
+    drop_tables = dict()
+    for table_name, table_data in drop_tables_data.items():
+        items = list()
+        factors = list()
+        rates = list()
+        for item_data in table_data["items"]:
+            item = dict(item_data)
+            rates.append(item.pop("rate", BASE_RATE))
+            rarity = item["rarity"]
+            factors.append(parse_rarity_factor(rarity) if rarity is not None else None)
+            item["rarity"] = None
+            items.append(item)
+        drop_tables[table_name] = DropTable(table_data["templates"], items, factors, rates)
+
+    return drop_tables
+
+
+DROP_TABLES = load_drop_tables(PATH_TO_DROP_TABLES_JSON)
+
+
+def find_drop_table_template(table_name: str, templates: List) -> Optional[str]:
+    """Find the template of a drop table in the parsed monster templates.
+
+    :param table_name: The drop table name.
+    :param templates: The monster wikitext templates, from mwparserfromhell filter_templates.
+    :return: The last matching template as a string, or None if no template matched.
+    """
+    drop_table_template = None
+    for template in templates:
+        template = str(template)
+        template_lower = template.lower()
+        if any(name in template_lower for name in DROP_TABLES[table_name].templates):
+            drop_table_template = template
+    return drop_table_template
+
+
+def scale_drop_table(table_name: str, rates: Dict[str, float], quantity: Optional[str] = None) -> Dict:
+    """Populate the items of a drop table, scaling the precomputed rarities by the drop table rates.
+
+    :param table_name: The drop table name.
+    :param rates: A dictionary of rate name to drop rate.
+    :param quantity: The quantity of items with a variable quantity.
+    :return: Dictionary of items on the drop table.
+    """
+    drop_table = DROP_TABLES[table_name]
+    items = dict()
+    for item, factor, rate in zip(drop_table.items, drop_table.factors, drop_table.rates):
+        item_dict = dict(item)
+        if factor is None:
+            item_dict["rarity"] = rates[rate]
+        else:
+            item_dict["rarity"] = factor * rates[rate]
+        if item_dict["quantity"] is None:
+            item_dict["quantity"] = quantity
+        items[str(item_dict["id"])] = item_dict
+    return items
+
 
 def superior(slayer_level: int) -> Dict:
     """Set superior drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Superior_slayer_monster
 
@@ -52,52 +171,13 @@ def superior(slayer_level: int) -> Dict:
     other_drop_rate = 1 / (8 * (200 - (slayer_level + 55)**2 / 125))
 
     # Populate drop table items
-    items = {
-        "20730": {
-            "id": 20730,
-            "name": "Mist battlestaff",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": staff_drop_rate,
-            "drop_requirements": "superior-only"
-        },
-        "20736": {
-            "id": 20736,
-            "name": "Dust battlestaff",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": staff_drop_rate,
-            "drop_requirements": "superior-only"
-        },
-        "21270": {
-            "id": 21270,
-            "name": "Eternal gem",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": other_drop_rate,
-            "drop_requirements": "superior-only"
-        },
-        "20724": {
-            "id": 20724,
-            "name": "Imbued heart",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": other_drop_rate,
-            "drop_requirements": "superior-only"
-        }
-    }
-
-    return(items)
+    return scale_drop_table("superior", {"staff": staff_drop_rate, "other": other_drop_rate})
 
 
 def wildernessslayer(monster_name: str, combat_level: int, hitpoints: int, slayer_level: int) -> Dict:
     """Set wilderness slayer drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://twitter.com/jagexash/status/1152237123778555904
     https://osrs.wiki/w/Larran%27s_key
@@ -130,160 +210,45 @@ def wildernessslayer(monster_name: str, combat_level: int, hitpoints: int, slaye
         if monster_name in ["Spiritual ranger", "Spiritual warrior", "Spiritual mage"]:
             # Only >= 2 slayer requirement (listed above) get 25% boost
             larrans_key_drop_rate = larrans_key_drop_rate * 1.25
-        larrans_key_drop_rate = eval("1/" + str(larrans_key_drop_rate))
+        larrans_key_drop_rate = 1 / larrans_key_drop_rate
     elif combat_level >= 350:
         larrans_key_drop_rate = 1/50
 
     # Populate drop table items
-    items = {
-        "23490": {
-            "id": 23490,
-            "name": "Larran's key",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": larrans_key_drop_rate,
-            "drop_requirements": "krystilia-task-only"
-        },
-        "21257": {
-            "id": 21257,
-            "name": "Slayer's enchantment",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": slayers_enchantment_drop_rate,
-            "drop_requirements": "krystilia-task-only"
-        }
-    }
-
-    return(items)
-
-
-def talisman(wikitext: str) -> Dict:
+    return scale_drop_table("wildernessslayer", {"larrans_key": larrans_key_drop_rate,
+                                                 "slayers_enchantment": slayers_enchantment_drop_rate})
+
+
+def talisman(templates: List) -> Dict:
     """Set superior drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Talisman_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "talismandroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("talisman", templates)
 
     table_drop_rate = drop_table_template.split("|")[1]
     table_drop_rate = table_drop_rate.replace("}", "")
     table_drop_rate = float(Fraction(table_drop_rate))
 
-    base_drop_rate = 10/70 * table_drop_rate
-
-    cosmic_drop_rate = 4/70 * table_drop_rate
+    # Populate drop table items
+    return scale_drop_table("talisman", {BASE_RATE: table_drop_rate})
 
-    chaos_nature_drop_rate = 3/70 * table_drop_rate
 
-    # Populate drop table items
-    items = {
-        "1438": {
-            "id": 1438,
-            "name": "Air talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": base_drop_rate,
-            "drop_requirements": None
-        },
-        "1446": {
-            "id": 1446,
-            "name": "Body talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": base_drop_rate,
-            "drop_requirements": None
-        },
-        "1440": {
-            "id": 1440,
-            "name": "Earth talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": base_drop_rate,
-            "drop_requirements": None
-        },
-        "1442": {
-            "id": 1442,
-            "name": "Fire talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": base_drop_rate,
-            "drop_requirements": None
-        },
-        "1448": {
-            "id": 1448,
-            "name": "Mind talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": base_drop_rate,
-            "drop_requirements": None
-        },
-        "1444": {
-            "id": 1444,
-            "name": "Water talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": base_drop_rate,
-            "drop_requirements": None
-        },
-        "1454": {
-            "id": 1454,
-            "name": "Cosmic talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": cosmic_drop_rate,
-            "drop_requirements": None
-        },
-        "1452": {
-            "id": 1452,
-            "name": "Chaos talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": chaos_nature_drop_rate,
-            "drop_requirements": None
-        },
-        "1462": {
-            "id": 1462,
-            "name": "Nature talisman",
-            "members": False,
-            "quantity": "1",
-            "noted": False,
-            "rarity": chaos_nature_drop_rate,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def catacombs(monster_name: str, hitpoints: int, wikitext: str) -> Dict:
+def catacombs(monster_name: str, hitpoints: int, templates: List) -> Dict:
     """Set catacombs drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Dark_totem
 
     :param monster_name: The monsters name.
     :param hitpoints: The monsters hitpoints level.
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
     # Exit if required levels not provided
@@ -292,26 +257,16 @@ def catacombs(monster_name: str, hitpoints: int, wikitext: str) -> Dict:
         print("You need these to determine drop rarity!")
         exit(1)
 
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "catacombsdroptable" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("catacombs", templates)
 
     # Determine if the monster is superior
     superior = False
     if "superior" in drop_table_template.lower():
         superior = True
 
-    # Determine Ancient shard drop rate, and then quantity
+    # Determine Ancient shard drop rate
     ancient_shard_drop_rate = 1 / (2/3 * (500 - hitpoints))
 
-    if monster_name == "Skotizo":
-        ancient_shard_quantity = "1-4"
-    else:
-        ancient_shard_quantity = "1"
-
     # Determine totem drop rate
     if superior:
         totem_drop_rate = 1
@@ -319,57 +274,24 @@ def catacombs(monster_name: str, hitpoints: int, wikitext: str) -> Dict:
         totem_drop_rate = 1 / (500 - hitpoints)
 
     # Populate drop table items
-    items = {
-        "19677": {
-            "id": 19677,
-            "name": "Ancient shard",
-            "members": True,
-            "quantity": ancient_shard_quantity,
-            "noted": False,
-            "rarity": ancient_shard_drop_rate,
-            "drop_requirements": "catacombs-only"
-        },
-        "19679": {
-            "id": 19679,
-            "name": "Dark totem base",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": totem_drop_rate,
-            "drop_requirements": "catacombs-only"
-        },
-        "19681": {
-            "id": 19681,
-            "name": "Dark totem middle",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": totem_drop_rate,
-            "drop_requirements": "catacombs-only"
-        },
-        "19683": {
-            "id": 19683,
-            "name": "Dark totem top",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": totem_drop_rate,
-            "drop_requirements": "catacombs-only"
-        }
-    }
-
-    return(items)
-
-
-def herb(members: bool, wikitext: str) -> Dict:
+    items = scale_drop_table("catacombs", {"ancient_shard": ancient_shard_drop_rate, "totem": totem_drop_rate})
+
+    # Determine Ancient shard quantity
+    if monster_name == "Skotizo":
+        items["19677"]["quantity"] = "1-4"
+
+    return items
+
+
+def herb(members: bool, templates: List) -> Dict:
     """Set herb drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Template:HerbDropTable2/doc
 
     :param members: If the monster is members.
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
     # Exit if required levels not provided
@@ -378,12 +300,7 @@ def herb(members: bool, wikitext: str) -> Dict:
         print("You need these to determine drop rarity!")
         exit(1)
 
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "herbdroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("herb", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -397,134 +314,27 @@ def herb(members: bool, wikitext: str) -> Dict:
         quantity = "1"
 
     try:
-        base_rarity = eval(drop_table_template[1])
+        base_rarity = evaluate_rarity(drop_table_template[1]).value
     except ValueError:
         print("Error: drop_tables.herb")
         print("NO BASE RARITY FOR: drop_tables.herb")
         exit(1)
 
     # Populate drop table items
-    items = {
-        "199": {
-            "id": 199,
-            "name": "Grimy guam leaf",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/4 * base_rarity,
-            "drop_requirements": None
-        },
-        "201": {
-            "id": 201,
-            "name": "Grimy marrentill",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/5.333 * base_rarity,
-            "drop_requirements": None
-        },
-        "203": {
-            "id": 203,
-            "name": "Grimy tarromin",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/7.111 * base_rarity,
-            "drop_requirements": None
-        },
-        "205": {
-            "id": 205,
-            "name": "Grimy harralander",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/9.143 * base_rarity,
-            "drop_requirements": None
-        },
-        "207": {
-            "id": 207,
-            "name": "Grimy ranarr weed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/11.64 * base_rarity,
-            "drop_requirements": None
-        },
-        "209": {
-            "id": 209,
-            "name": "Grimy irit leaf",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/16 * base_rarity,
-            "drop_requirements": None
-        },
-        "211": {
-            "id": 211,
-            "name": "Grimy avantoe",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/21.33 * base_rarity,
-            "drop_requirements": None
-        },
-        "213": {
-            "id": 213,
-            "name": "Grimy kwuarm",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/25.6 * base_rarity,
-            "drop_requirements": None
-        },
-        "215": {
-            "id": 215,
-            "name": "Grimy cadantine",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/32 * base_rarity,
-            "drop_requirements": None
-        },
-        "2485": {
-            "id": 2485,
-            "name": "Grimy lantadyme",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/42.67 * base_rarity,
-            "drop_requirements": None
-        },
-        "217": {
-            "id": 217,
-            "name": "Grimy dwarf weed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/42.67 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def usefulherb(wikitext: str) -> Dict:
+    return scale_drop_table("herb", {BASE_RATE: base_rarity}, quantity)
+
+
+def usefulherb(templates: List) -> Dict:
     """Set useful herb drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Useful_herb_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "usefulherbdroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("usefulherb", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -541,64 +351,20 @@ def usefulherb(wikitext: str) -> Dict:
         exit(1)
 
     # Populate drop table items
-    items = {
-        "211": {
-            "id": 211,
-            "name": "Grimy avantoe",
-            "members": True,
-            "quantity": quantity,
-            "noted": True,
-            "rarity": 1/3.2 * base_rarity,
-            "drop_requirements": None
-        },
-        "3051": {
-            "id": 3051,
-            "name": "Grimy snapdragon",
-            "members": True,
-            "quantity": quantity,
-            "noted": True,
-            "rarity": 1/4 * base_rarity,
-            "drop_requirements": None
-        },
-        "207": {
-            "id": 207,
-            "name": "Grimy ranarr weed",
-            "members": True,
-            "quantity": quantity,
-            "noted": True,
-            "rarity": 1/4 * base_rarity,
-            "drop_requirements": None
-        },
-        "219": {
-            "id": 219,
-            "name": "Grimy torstol",
-            "members": True,
-            "quantity": quantity,
-            "noted": True,
-            "rarity": 1/5.333 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def gem(wikitext: str) -> Dict:
+    return scale_drop_table("usefulherb", {BASE_RATE: base_rarity}, quantity)
+
+
+def gem(templates: List) -> Dict:
     """Set gem drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Useful_herb_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "usefulherbdroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("gem", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -610,138 +376,20 @@ def gem(wikitext: str) -> Dict:
         exit(1)
 
     # Populate drop table items
-    items = {
-        "1623": {
-            "id": 1623,
-            "name": "Uncut sapphire",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/4 * base_rarity,
-            "drop_requirements": None
-        },
-        "1621": {
-            "id": 1621,
-            "name": "Uncut emerald",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/8 * base_rarity,
-            "drop_requirements": None
-        },
-        "1619": {
-            "id": 1619,
-            "name": "Uncut ruby",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/16 * base_rarity,
-            "drop_requirements": None
-        },
-        "1452": {
-            "id": 1452,
-            "name": "Chaos talisman",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/42.67 * base_rarity,
-            "drop_requirements": None
-        },
-        "1462": {
-            "id": 1462,
-            "name": "Nature talisman",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/42.67 * base_rarity,
-            "drop_requirements": None
-        },
-        "1617": {
-            "id": 1617,
-            "name": "Uncut diamond",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/64 * base_rarity,
-            "drop_requirements": None
-        },
-        "830": {
-            "id": 830,
-            "name": "Rune javelin",
-            "members": True,
-            "quantity": "5",
-            "noted": False,
-            "rarity": 1/128 * base_rarity,
-            "drop_requirements": None
-        },
-        "987": {
-            "id": 987,
-            "name": "Loop half of key",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * base_rarity,
-            "drop_requirements": None
-        },
-        "985": {
-            "id": 985,
-            "name": "Tooth half of key",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * base_rarity,
-            "drop_requirements": None
-        },
-        "1247": {
-            "id": 1247,
-            "name": "Rune spear",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * 1/16 * base_rarity,
-            "drop_requirements": None
-        },
-        "2366": {
-            "id": 2366,
-            "name": "Shield left half",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * 1/32 * base_rarity,
-            "drop_requirements": None
-        },
-        "1249": {
-            "id": 1249,
-            "name": "Dragon spear",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * 1/42.67 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def fixedallotmentseed(wikitext: str) -> Dict:
+    return scale_drop_table("gem", {BASE_RATE: base_rarity})
+
+
+def fixedallotmentseed(templates: List) -> Dict:
     """Set allotment seed drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Fixed_allotment_seed_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "fixedallotmentseeddroptable2" in template.lower():
-            drop_table_template = template
-        if "dropsallotmenttable" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("fixedallotmentseed", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -753,100 +401,20 @@ def fixedallotmentseed(wikitext: str) -> Dict:
         base_rarity = 6/128
 
     # Populate drop table items
-    items = {
-        "5318": {
-            "id": 5318,
-            "name": "Potato seed",
-            "members": True,
-            "quantity": "4",
-            "noted": False,
-            "rarity": 1/2.74 * base_rarity,
-            "drop_requirements": None
-        },
-        "5319": {
-            "id": 5319,
-            "name": "Onion seed",
-            "members": True,
-            "quantity": "4",
-            "noted": False,
-            "rarity": 1/3.653 * base_rarity,
-            "drop_requirements": None
-        },
-        "5324": {
-            "id": 5324,
-            "name": "Cabbage seed",
-            "members": True,
-            "quantity": "4",
-            "noted": False,
-            "rarity": 1/5.479 * base_rarity,
-            "drop_requirements": None
-        },
-        "5322": {
-            "id": 5322,
-            "name": "Tomato seed",
-            "members": True,
-            "quantity": "3",
-            "noted": False,
-            "rarity": 1/10.96 * base_rarity,
-            "drop_requirements": None
-        },
-        "5320": {
-            "id": 5320,
-            "name": "Sweetcorn seed",
-            "members": True,
-            "quantity": "3",
-            "noted": False,
-            "rarity": 1/21.92 * base_rarity,
-            "drop_requirements": None
-        },
-        "5323": {
-            "id": 5323,
-            "name": "Strawberry seed",
-            "members": True,
-            "quantity": "2",
-            "noted": False,
-            "rarity": 1/43.83 * base_rarity,
-            "drop_requirements": None
-        },
-        "5321": {
-            "id": 5321,
-            "name": "Watermelon seed",
-            "members": True,
-            "quantity": "2",
-            "noted": False,
-            "rarity": 1/87.67 * base_rarity,
-            "drop_requirements": None
-        },
-        "22879": {
-            "id": 22879,
-            "name": "Snape grass seed",
-            "members": True,
-            "quantity": "2",
-            "noted": False,
-            "rarity": 1/131.5 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def treeseed(wikitext: str) -> Dict:
+    return scale_drop_table("fixedallotmentseed", {BASE_RATE: base_rarity})
+
+
+def treeseed(templates: List) -> Dict:
     """Set tree seed drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Tree-herb_seed_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "treeherbseeddroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("treeseed", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -859,181 +427,29 @@ def treeseed(wikitext: str) -> Dict:
 
     if "multiplier=2-3" in drop_table_template:
         quantity = "2-3"
-        watermelon_quantity = "30-45"
     elif "multiplier=2" in drop_table_template:
         quantity = "2"
-        watermelon_quantity = "30"
     else:
         quantity = "1"
-        watermelon_quantity = "15"
 
     # Populate drop table items
-    items = {
-        "5295": {
-            "id": 5295,
-            "name": "Ranarr seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/8.333 * base_rarity,
-            "drop_requirements": None
-        },
-        "5300": {
-            "id": 5300,
-            "name": "Snapdragon seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/8.929 * base_rarity,
-            "drop_requirements": None
-        },
-        "5304": {
-            "id": 5304,
-            "name": "Torstol seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/11.36 * base_rarity,
-            "drop_requirements": None
-        },
-        "5321": {
-            "id": 5321,
-            "name": "Watermelon seed",
-            "members": True,
-            "quantity": watermelon_quantity,
-            "noted": False,
-            "rarity": 1/12.5 * base_rarity,
-            "drop_requirements": None
-        },
-        "5313": {
-            "id": 5313,
-            "name": "Willow seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/12.5 * base_rarity,
-            "drop_requirements": None
-        },
-        "21488": {
-            "id": 21488,
-            "name": "Mahogany seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/13.89 * base_rarity,
-            "drop_requirements": None
-        },
-        "5314": {
-            "id": 5314,
-            "name": "Maple seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/13.89 * base_rarity,
-            "drop_requirements": None
-        },
-        "21486": {
-            "id": 21486,
-            "name": "Teak seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/13.89 * base_rarity,
-            "drop_requirements": None
-        },
-        "5315": {
-            "id": 5315,
-            "name": "Yew seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/13.89 * base_rarity,
-            "drop_requirements": None
-        },
-        "5288": {
-            "id": 5288,
-            "name": "Papaya tree seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/17.86 * base_rarity,
-            "drop_requirements": None
-        },
-        "5316": {
-            "id": 5316,
-            "name": "Magic seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/20.83 * base_rarity,
-            "drop_requirements": None
-        },
-        "5289": {
-            "id": 5289,
-            "name": "Palm tree seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/25 * base_rarity,
-            "drop_requirements": None
-        },
-        "5317": {
-            "id": 5317,
-            "name": "Spirit seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/31.25 * base_rarity,
-            "drop_requirements": None
-        },
-        "22877": {
-            "id": 22877,
-            "name": "Dragonfruit tree seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/41.67 * base_rarity,
-            "drop_requirements": None
-        },
-        "22869": {
-            "id": 22869,
-            "name": "Celastrus seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/62.5 * base_rarity,
-            "drop_requirements": None
-        },
-        "22871": {
-            "id": 22871,
-            "name": "Redwood tree seed",
-            "members": True,
-            "quantity": quantity,
-            "noted": False,
-            "rarity": 1/62.5 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def rareseed(wikitext: str) -> Dict:
+    items = scale_drop_table("treeseed", {BASE_RATE: base_rarity}, quantity)
+    items[WATERMELON_SEED_ID]["quantity"] = WATERMELON_SEED_QUANTITIES[quantity]
+
+    return items
+
+
+def rareseed(templates: List) -> Dict:
     """Set rare seed drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Rare_seed_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "rareseeddroptable" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("rareseed", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -1045,154 +461,20 @@ def rareseed(wikitext: str) -> Dict:
         exit(1)
 
     # Populate drop table items
-    items = {
-        "5296": {
-            "id": 5296,
-            "name": "Toadflax seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/5.064 * base_rarity,
-            "drop_requirements": None
-        },
-        "5297": {
-            "id": 5297,
-            "name": "Irit seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/7.438 * base_rarity,
-            "drop_requirements": None
-        },
-        "5281": {
-            "id": 5281,
-            "name": "Belladonna seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/7.677 * base_rarity,
-            "drop_requirements": None
-        },
-        "5298": {
-            "id": 5298,
-            "name": "Avantoe seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/10.82 * base_rarity,
-            "drop_requirements": None
-        },
-        "5106": {
-            "id": 5106,
-            "name": "Poison ivy seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/10.82 * base_rarity,
-            "drop_requirements": None
-        },
-        "5280": {
-            "id": 5280,
-            "name": "Cactus seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/11.33 * base_rarity,
-            "drop_requirements": None
-        },
-        "5299": {
-            "id": 5299,
-            "name": "Kwuarm seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/15.87 * base_rarity,
-            "drop_requirements": None
-        },
-        "22873": {
-            "id": 22873,
-            "name": "Potato cactus seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/15.87 * base_rarity,
-            "drop_requirements": None
-        },
-        "5300": {
-            "id": 5300,
-            "name": "Snapdragon seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/23.8 * base_rarity,
-            "drop_requirements": None
-        },
-        "5301": {
-            "id": 5301,
-            "name": "Cadantine seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/34 * base_rarity,
-            "drop_requirements": None
-        },
-        "5302": {
-            "id": 5302,
-            "name": "Lantadyme seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/47.6 * base_rarity,
-            "drop_requirements": None
-        },
-        "22879": {
-            "id": 22879,
-            "name": "Snape grass seed",
-            "members": True,
-            "quantity": "3",
-            "noted": False,
-            "rarity": 1/59.5 * base_rarity,
-            "drop_requirements": None
-        },
-        "5303": {
-            "id": 5303,
-            "name": "Dwarf weed seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/79.33 * base_rarity,
-            "drop_requirements": None
-        },
-        "5304": {
-            "id": 5304,
-            "name": "Torstol seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/119 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def variableallotmentseed(wikitext: str) -> Dict:
+    return scale_drop_table("rareseed", {BASE_RATE: base_rarity})
+
+
+def variableallotmentseed(templates: List) -> Dict:
     """Set rare seed drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Rare_seed_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "rareseeddroptable" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("variableallotmentseed", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -1204,100 +486,20 @@ def variableallotmentseed(wikitext: str) -> Dict:
         exit(1)
 
     # Populate drop table items
-    items = {
-        "5318": {
-            "id": 5318,
-            "name": "Potato seed",
-            "members": True,
-            "quantity": "1-4",
-            "noted": False,
-            "rarity": 1/2 * base_rarity,
-            "drop_requirements": None
-        },
-        "5319": {
-            "id": 5319,
-            "name": "Onion seed",
-            "members": True,
-            "quantity": "1-3",
-            "noted": False,
-            "rarity": 1/4 * base_rarity,
-            "drop_requirements": None
-        },
-        "5324": {
-            "id": 5324,
-            "name": "Cabbage seed",
-            "members": True,
-            "quantity": "1-3",
-            "noted": False,
-            "rarity": 1/8 * base_rarity,
-            "drop_requirements": None
-        },
-        "5322": {
-            "id": 5322,
-            "name": "Tomato seed",
-            "members": True,
-            "quantity": "1-2",
-            "noted": False,
-            "rarity": 1/16 * base_rarity,
-            "drop_requirements": None
-        },
-        "5320": {
-            "id": 5320,
-            "name": "Sweetcorn seed",
-            "members": True,
-            "quantity": "1-2",
-            "noted": False,
-            "rarity": 1/32 * base_rarity,
-            "drop_requirements": None
-        },
-        "5323": {
-            "id": 5323,
-            "name": "Strawberry seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/64 * base_rarity,
-            "drop_requirements": None
-        },
-        "5321": {
-            "id": 5321,
-            "name": "Watermelon seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * base_rarity,
-            "drop_requirements": None
-        },
-        "22879": {
-            "id": 22879,
-            "name": "Snape grass seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/128 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def commonseed(wikitext: str) -> Dict:
+    return scale_drop_table("variableallotmentseed", {BASE_RATE: base_rarity})
+
+
+def commonseed(templates: List) -> Dict:
     """Set common seed drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Drop_table#Common_seed_drop_table
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "manyseeddroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("commonseed", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -1309,253 +511,20 @@ def commonseed(wikitext: str) -> Dict:
         exit(1)
 
     # Populate drop table items
-    items = {
-        "5100": {
-            "id": 5100,
-            "name": "Limpwurt seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/7.65 * base_rarity,
-            "drop_requirements": None
-        },
-        "5323": {
-            "id": 5323,
-            "name": "Strawberry seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/8 * base_rarity,
-            "drop_requirements": None
-        },
-        "5292": {
-            "id": 5292,
-            "name": "Marrentill seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/8.384 * base_rarity,
-            "drop_requirements": None
-        },
-        "5104": {
-            "id": 5104,
-            "name": "Jangerberry seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/11.39 * base_rarity,
-            "drop_requirements": None
-        },
-        "5293": {
-            "id": 5293,
-            "name": "Tarromin seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/12.33 * base_rarity,
-            "drop_requirements": None
-        },
-        "5311": {
-            "id": 5311,
-            "name": "Wildblood seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/12.63 * base_rarity,
-            "drop_requirements": None
-        },
-        "5321": {
-            "id": 5321,
-            "name": "Watermelon seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/16.63 * base_rarity,
-            "drop_requirements": None
-        },
-        "5294": {
-            "id": 5294,
-            "name": "Harralander seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/18.71 * base_rarity,
-            "drop_requirements": None
-        },
-        "22879": {
-            "id": 22879,
-            "name": "Snape grass seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/26.2 * base_rarity,
-            "drop_requirements": None
-        },
-        "5295": {
-            "id": 5295,
-            "name": "Ranarr seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/26.87 * base_rarity,
-            "drop_requirements": None
-        },
-        "5105": {
-            "id": 5105,
-            "name": "Whiteberry seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/30.82 * base_rarity,
-            "drop_requirements": None
-        },
-        "5282": {
-            "id": 5282,
-            "name": "Mushroom spore",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/36.14 * base_rarity,
-            "drop_requirements": None
-        },
-        "5296": {
-            "id": 5296,
-            "name": "Toadflax seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/38.81 * base_rarity,
-            "drop_requirements": None
-        },
-        "5281": {
-            "id": 5281,
-            "name": "Belladonna seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/58.22 * base_rarity,
-            "drop_requirements": None
-        },
-        "5297": {
-            "id": 5297,
-            "name": "Irit seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/58.22 * base_rarity,
-            "drop_requirements": None
-        },
-        "5106": {
-            "id": 5106,
-            "name": "Poison ivy seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/80.62 * base_rarity,
-            "drop_requirements": None
-        },
-        "5298": {
-            "id": 5298,
-            "name": "Avantoe seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/87.33 * base_rarity,
-            "drop_requirements": None
-        },
-        "5280": {
-            "id": 5280,
-            "name": "Cactus seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/87.33 * base_rarity,
-            "drop_requirements": None
-        },
-        "5299": {
-            "id": 5299,
-            "name": "Kwuarm seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/116.4 * base_rarity,
-            "drop_requirements": None
-        },
-        "22873": {
-            "id": 22873,
-            "name": "Potato cactus seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/131 * base_rarity,
-            "drop_requirements": None
-        },
-        "5300": {
-            "id": 5300,
-            "name": "Snapdragon seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/209.6 * base_rarity,
-            "drop_requirements": None
-        },
-        "5301": {
-            "id": 5301,
-            "name": "Cadantine seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/262 * base_rarity,
-            "drop_requirements": None
-        },
-        "5302": {
-            "id": 5302,
-            "name": "Lantadyme seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/349.3 * base_rarity,
-            "drop_requirements": None
-        },
-        "5303": {
-            "id": 5303,
-            "name": "Dwarf weed seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/524 * base_rarity,
-            "drop_requirements": None
-        },
-        "5304": {
-            "id": 5304,
-            "name": "Torstol seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/1048 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
-
-
-def hopsseed(wikitext: str) -> Dict:
+    return scale_drop_table("commonseed", {BASE_RATE: base_rarity})
+
+
+def hopsseed(templates: List) -> Dict:
     """Set hops seed drop tables items.
 
-    Item drops are hard coded.
+    Item drops are loaded from the drop tables data file.
     Drop rates sourced from:
     https://osrs.wiki/w/Template:HopsDropTable2
 
-    :param wikitext: The monsters wikitext as a string.
+    :param templates: The monsters parsed wikitext templates.
     :return: Dictionary of items on the drop table.
     """
-    drop_table_template = None
-    wikicode = mwparserfromhell.parse(wikitext)
-    templates = wikicode.filter_templates()
-    for template in templates:
-        if "hopsdroptable2" in template.lower():
-            drop_table_template = template
+    drop_table_template = find_drop_table_template("hopsseed", templates)
 
     drop_table_template = drop_table_template.replace("{", "")
     drop_table_template = drop_table_template.replace("}", "")
@@ -1567,70 +536,4 @@ def hopsseed(wikitext: str) -> Dict:
         exit(1)
 
     # Populate drop table items
-    items = {
-        "5305": {
-            "id": 5305,
-            "name": "Barley seed",
-            "members": True,
-            "quantity": "4",
-            "noted": False,
-            "rarity": 1/3.228 * base_rarity,
-            "drop_requirements": None
-        },
-        "5307": {
-            "id": 5307,
-            "name": "Hammerstone seed",
-            "members": True,
-            "quantity": "3",
-            "noted": False,
-            "rarity": 1/4.035 * base_rarity,
-            "drop_requirements": None
-        },
-        "5308": {
-            "id": 5308,
-            "name": "Asgarnian seed",
-            "members": True,
-            "quantity": "3",
-            "noted": False,
-            "rarity": 1/6.647 * base_rarity,
-            "drop_requirements": None
-        },
-        "5306": {
-            "id": 5306,
-            "name": "Jute seed",
-            "members": True,
-            "quantity": "2",
-            "noted": False,
-            "rarity": 1/6.647 * base_rarity,
-            "drop_requirements": None
-        },
-        "5309": {
-            "id": 5309,
-            "name": "Yanillian seed",
-            "members": True,
-            "quantity": "2",
-            "noted": False,
-            "rarity": 1/10.272 * base_rarity,
-            "drop_requirements": None
-        },
-        "5310": {
-            "id": 5310,
-            "name": "Krandorian seed",
-            "members": True,
-            "quantity": "2",
-            "noted": False,
-            "rarity": 113/4 * base_rarity,
-            "drop_requirements": None
-        },
-        "5311": {
-            "id": 5311,
-            "name": "Wildblood seed",
-            "members": True,
-            "quantity": "1",
-            "noted": False,
-            "rarity": 1/113 * base_rarity,
-            "drop_requirements": None
-        }
-    }
-
-    return(items)
+    return scale_drop_table("hopsseed", {BASE_RATE: base_rarity})
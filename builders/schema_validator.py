@@ -0,0 +1,285 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A Cerberus schema validator that is compiled once, then used to validate single
+items or monsters, or a batch of documents.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import re
+from collections.abc import Iterable, Mapping, Sequence, Sized
+from typing import Any, Callable, Dict, Optional, Type
+
+from cerberus import Validator
+
+import config
+
+# Schema rules that do not change the validation result
+IGNORED_RULES = ("description", "example", "meta", "required")
+
+# Schema rules that are skipped for empty values, when the `empty` rule is set
+EMPTY_SKIPPED_RULES = ("allowed", "minlength", "maxlength", "regex")
+
+Check = Callable[[Any], bool]
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema uses a rule that cannot be compiled."""
+
+
+def compile_mapping_schema(schema: Dict, types_mapping: Dict) -> Check:
+    """Compile a schema (field name to rules) into a function that checks a document.
+
+    Unknown fields are not allowed, the same as the Cerberus default.
+
+    :param schema: The Cerberus schema.
+    :param types_mapping: The Cerberus type definitions, by type name.
+    :return: A function returning True if the document is valid.
+    :raises UnsupportedSchemaError: The schema uses a rule that cannot be compiled.
+    """
+    if not isinstance(schema, Mapping):
+        raise UnsupportedSchemaError(schema)
+
+    field_checks = {field: compile_rules(rules, types_mapping) for field, rules in schema.items()}
+    required_fields = frozenset(field for field, rules in schema.items() if rules.get("required") is True)
+
+    def check_mapping(document: Any) -> bool:
+        if not isinstance(document, Mapping) or not required_fields <= document.keys():
+            return False
+        for field, value in document.items():
+            field_check = field_checks.get(field)
+            if field_check is None or not field_check(value):
+                return False
+        return True
+
+    return check_mapping
+
+
+def compile_rules(rules: Dict, types_mapping: Dict) -> Check:
+    """Compile the rules of a single field into a function that checks a value.
+
+    The rules are checked in the same order as Cerberus: `nullable`, `type` and
+    `empty` first, then the remaining rules.
+
+    :param rules: The Cerberus rules of the field.
+    :param types_mapping: The Cerberus type definitions, by type name.
+    :return: A function returning True if the value is valid.
+    :raises UnsupportedSchemaError: The rules include a rule that cannot be compiled.
+    """
+    if not isinstance(rules, Mapping):
+        raise UnsupportedSchemaError(rules)
+
+    checks = list()
+    for rule, constraint in rules.items():
+        if rule in IGNORED_RULES or rule in ("nullable", "type", "empty"):
+            continue
+        if rule == "allowed":
+            checks.append((rule, _compile_allowed(constraint)))
+        elif rule == "min":
+            checks.append((rule, lambda value, min_value=constraint: not _compare(value, min_value)))
+        elif rule == "max":
+            checks.append((rule, lambda value, max_value=constraint: not _compare(max_value, value)))
+        elif rule == "minlength":
+            checks.append((rule, lambda value, length=constraint: not isinstance(value, Iterable) or
+                           len(value) >= length))
+        elif rule == "maxlength":
+            checks.append((rule, lambda value, length=constraint: not isinstance(value, Iterable) or
+                           len(value) <= length))
+        elif rule == "regex":
+            pattern = re.compile(constraint if constraint.endswith("$") else constraint + "$")
+            checks.append((rule, lambda value, pattern=pattern: not isinstance(value, str) or
+                           pattern.match(value) is not None))
+        elif rule == "schema":
+            checks.append((rule, _compile_schema_rule(constraint, types_mapping)))
+        elif rule == "keysrules":
+            check_key = compile_rules(constraint, types_mapping)
+            checks.append((rule, lambda value, check_key=check_key: not isinstance(value, Mapping) or
+                           all(check_key(key) for key in value)))
+        elif rule == "valuesrules":
+            check_item = compile_rules(constraint, types_mapping)
+            checks.append((rule, lambda value, check_item=check_item: not isinstance(value, Mapping) or
+                           all(check_item(item) for item in value.values())))
+        else:
+            raise UnsupportedSchemaError(rule)
+
+    nullable = rules.get("nullable", False)
+    type_check = _compile_type(rules.get("type"), types_mapping)
+    empty = rules.get("empty")
+    empty_checks = [check for rule, check in checks if rule not in EMPTY_SKIPPED_RULES]
+    checks = [check for rule, check in checks]
+
+    def check_value(value: Any) -> bool:
+        if value is None:
+            return nullable
+        if type_check is not None and not type_check(value):
+            return False
+        value_checks = checks
+        if empty is not None and isinstance(value, Sized) and len(value) == 0:
+            if not empty:
+                return False
+            value_checks = empty_checks
+        for value_check in value_checks:
+            if not value_check(value):
+                return False
+        return True
+
+    return check_value
+
+
+def _compile_type(data_type: Any, types_mapping: Dict) -> Optional[Check]:
+    """Compile the `type` rule into a function that checks the type of a value.
+
+    :param data_type: A type name, or list of type names.
+    :param types_mapping: The Cerberus type definitions, by type name.
+    :return: A function returning True if the value matches any type, or None if there is no type rule.
+    :raises UnsupportedSchemaError: The type is not a Cerberus type definition.
+    """
+    if not data_type:
+        return None
+
+    type_definitions = list()
+    for type_name in ((data_type,) if isinstance(data_type, str) else data_type):
+        if type_name not in types_mapping:
+            raise UnsupportedSchemaError(type_name)
+        type_definitions.append(types_mapping[type_name])
+
+    def check_type(value: Any) -> bool:
+        for type_definition in type_definitions:
+            if (isinstance(value, type_definition.included_types) and
+                    not isinstance(value, type_definition.excluded_types)):
+                return True
+        return False
+
+    return check_type
+
+
+def _compile_allowed(allowed_values: Any) -> Check:
+    """Compile the `allowed` rule into a function that checks a value, or every value in a list.
+
+    :param allowed_values: The allowed values.
+    :return: A function returning True if the value is allowed.
+    """
+    def check_allowed(value: Any) -> bool:
+        try:
+            if isinstance(value, Iterable) and not isinstance(value, str):
+                return set(value) <= set(allowed_values)
+            return value in allowed_values
+        except TypeError:
+            # Unhashable values, let Cerberus decide
+            return False
+
+    return check_allowed
+
+
+def _compile_schema_rule(schema: Any, types_mapping: Dict) -> Check:
+    """Compile the `schema` rule into a function that checks a list or dictionary value.
+
+    For a list value, the schema is the rules of every list element. For a
+    dictionary value, the schema is the field name to rules mapping.
+
+    :param schema: The Cerberus schema rule constraint.
+    :param types_mapping: The Cerberus type definitions, by type name.
+    :return: A function returning True if the list or dictionary value is valid.
+    :raises UnsupportedSchemaError: The schema cannot be compiled for either a list or dictionary.
+    """
+    try:
+        check_element = compile_rules(schema, types_mapping)
+    except (UnsupportedSchemaError, AttributeError, TypeError):
+        check_element = None
+    try:
+        check_mapping = compile_mapping_schema(schema, types_mapping)
+    except (UnsupportedSchemaError, AttributeError, TypeError):
+        check_mapping = None
+    if check_element is None and check_mapping is None:
+        raise UnsupportedSchemaError(schema)
+
+    def check_schema(value: Any) -> bool:
+        if isinstance(value, Sequence) and not isinstance(value, str):
+            return check_element is not None and all(check_element(element) for element in value)
+        if isinstance(value, Mapping):
+            return check_mapping is not None and check_mapping(value)
+        return True
+
+    return check_schema
+
+
+def _compare(value: Any, limit: Any) -> bool:
+    """Check if a value is less than a limit, ignoring values that cannot be compared (like Cerberus).
+
+    :param value: The value to compare.
+    :param limit: The limit to compare against.
+    :return: A boolean to indicate if the value is less than the limit.
+    """
+    try:
+        return value < limit
+    except TypeError:
+        return False
+
+
+class SchemaValidator:
+    """This class validates documents against a Cerberus schema, compiled once.
+
+    The schema is compiled into a tree of check functions, one for each field.
+    Valid documents are only checked by the compiled functions, which is much
+    faster than the Cerberus Validator. Invalid documents are then validated by
+    Cerberus, so the verdict and error messages are always the same as
+    Cerberus. If the schema uses a rule that cannot be compiled, every document
+    is validated by Cerberus.
+
+    :param schema: The Cerberus schema, such as the contents of `schema-items.json`.
+    :param validator_class: The Cerberus Validator class used for invalid documents.
+    """
+    def __init__(self, schema: Dict, validator_class: Type[Validator] = config.MyValidator):
+        self.schema = schema
+        self.validator_class = validator_class
+        self.validator = validator_class(schema)
+        self.errors: Dict = dict()
+        try:
+            self.check: Optional[Check] = compile_mapping_schema(schema, validator_class.types_mapping)
+        except (UnsupportedSchemaError, AttributeError, TypeError):
+            self.check = None
+
+    def __reduce__(self):
+        # The compiled functions cannot be pickled, so compile again when unpickled (such as in a worker process)
+        return self.__class__, (self.schema, self.validator_class)
+
+    def validate(self, document: Dict) -> bool:
+        """Validate a single document, then set the errors of the document.
+
+        :param document: The document to validate.
+        :return: A boolean to indicate if the document is valid.
+        """
+        if self.check is not None and self.check(document):
+            self.errors = dict()
+            return True
+        is_valid = self.validator.validate(document)
+        self.errors = self.validator.errors
+        return is_valid
+
+    def validate_many(self, documents: Iterable) -> Dict[int, Dict]:
+        """Validate a batch of documents.
+
+        :param documents: An iterable of documents to validate.
+        :return: A dictionary of the position of each invalid document to the document errors.
+        """
+        errors = dict()
+        for position, document in enumerate(documents):
+            if not self.validate(document):
+                errors[position] = self.errors
+        return errors
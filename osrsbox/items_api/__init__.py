@@ -18,12 +18,44 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
+from pathlib import Path
+from typing import Generator, Union
+
+from osrsbox.json_stream import iter_json_object
+from osrsbox.parallel_loader import read_json_file
 from osrsbox.items_api import all_items
+from osrsbox.items_api.item_properties import ItemProperties
 
 
-def load() -> all_items.AllItems:
+def load(lazy: bool = False, cache_size: int = 1024, snapshot: bool = False) -> all_items.AllItems:
     """Load the item database.
 
+    :param lazy: Whether to build each item on first use, instead of on load.
+    :param cache_size: The maximum number of items to keep in memory in lazy mode.
+    :param snapshot: Whether to use (and save) a binary snapshot of the item database, default is False.
     :return all_db_items: An AllItems object containing the entire item database.
     """
-    return all_items.AllItems()
+    return all_items.AllItems(lazy=lazy, cache_size=cache_size, snapshot=snapshot)
+
+
+def iter_items(path: Union[Path, str] = all_items.PATH_TO_ITEMS_COMPLETE_JSON) -> Generator[ItemProperties, None, None]:
+    """Iterate (loop) over the item database, without loading the entire database.
+
+    Items are decoded from the JSON file one at a time, and each ItemProperties
+    object is built when it is reached, so memory use does not grow with the
+    size of the database. Items are returned in file order for a single JSON
+    file, and sorted by ID for a directory of JSON files.
+
+    :param path: The path to the `items-complete.json` file, or `items-json` directory.
+    :return: A generator of ItemProperties objects.
+    :raises ValueError: Valid input not found.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for json_file in sorted(path.glob("*.json"), key=lambda x: int(x.stem)):
+            yield all_items.AllItems._build_item(read_json_file(json_file))
+    elif path.is_file():
+        for _, item_json in iter_json_object(path):
+            yield all_items.AllItems._build_item(item_json)
+    else:
+        raise ValueError("Error: Valid input not found. Exiting.")
@@ -21,8 +21,17 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import json
 from pathlib import Path
-from typing import Dict, List, Union, Generator
-
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union, Generator
+
+from osrsbox.query_index import QueryIndex
+from osrsbox.ngram_index import NgramIndex, TrigramSimilarityIndex
+from osrsbox.parallel_loader import load_json_files
+from osrsbox.snapshot import load_snapshot, save_snapshot
+from osrsbox.items_api.item_offsets import ItemOffsets
+from osrsbox.items_api.item_variants import ItemVariants
+from osrsbox.items_api.item_weapon import ItemWeapon
+from osrsbox.items_api.item_equipment import ItemEquipment
 from osrsbox.items_api.item_properties import ItemProperties
 
 PATH_TO_ITEMS_COMPLETE_JSON = Path(__file__).absolute().parent / ".." / ".." / "docs" / "items-complete.json"
@@ -31,19 +40,64 @@ if not PATH_TO_ITEMS_COMPLETE_JSON.is_file():
     if not PATH_TO_ITEMS_COMPLETE_JSON.is_file():
         raise ValueError("Error: Default item database file not found. Exiting")
 
+# The dataclasses stored in an items database snapshot
+SNAPSHOT_SCHEMA = (ItemProperties, ItemEquipment, ItemWeapon)
+
+# Equipment slot names, the index of each slot name is used as the slot code
+EQUIPMENT_SLOTS = ("2h", "ammo", "body", "cape", "feet", "hands", "head", "legs", "neck", "ring", "shield", "weapon")
+EQUIPMENT_SLOT_CODES = {slot: code for code, slot in enumerate(EQUIPMENT_SLOTS)}
+
+# Equipment bonus properties, in the same order as the ItemEquipment class
+EQUIPMENT_BONUSES = ("attack_stab", "attack_slash", "attack_crush", "attack_magic", "attack_ranged",
+                     "defence_stab", "defence_slash", "defence_crush", "defence_magic", "defence_ranged",
+                     "melee_strength", "ranged_strength", "magic_damage", "prayer")
+
 
 class AllItems:
     """This class handles loading of the osrsbox-db items database.
 
+    In lazy mode only an index of item ID numbers to file locations is loaded.
+    Each ItemProperties object is built the first time the item is requested, and
+    held in a bounded (least recently used) cache. The `all_items` list and
+    `all_items_dict` dictionary are not populated in lazy mode.
+
+    When snapshots are enabled and a single JSON file is loaded, a binary snapshot
+    of the loaded items is saved next to the JSON file, and used on the next load
+    if the JSON file is unchanged. Snapshots are pickle files, so only enable them
+    if other users cannot write to the JSON file directory (see snapshot.py).
+
     :param input_data_file_or_directory: The osrsbox-db items folder of JSON files, or single JSON file.
+    :param lazy: Whether to build ItemProperties objects on first use, instead of on load.
+    :param cache_size: The maximum number of ItemProperties objects to keep in lazy mode.
+    :param snapshot: Whether to use (and save) a binary snapshot of a single JSON file, default is False.
+    :param workers: The number of worker processes used to read a directory of JSON files.
     """
-    def __init__(self, input_data_file_or_directory: Path = PATH_TO_ITEMS_COMPLETE_JSON):
+    def __init__(self, input_data_file_or_directory: Path = PATH_TO_ITEMS_COMPLETE_JSON,
+                 lazy: bool = False, cache_size: int = 1024, snapshot: bool = False, workers: int = 1):
         self.all_items: List[ItemProperties] = list()
         self.all_items_dict: Dict[int, ItemProperties] = dict()
+        self.lazy = lazy
+        self.cache_size = cache_size
+        self.snapshot = snapshot
+        self.workers = workers
+        self.item_offsets: Optional[ItemOffsets] = None
+        self.item_cache: OrderedDict = OrderedDict()
+        self._equipment_matrix = None
+        self.name_index: Optional[Dict[str, int]] = None
+        self.wiki_name_index: Optional[Dict[str, int]] = None
+        self.item_variants: Optional[ItemVariants] = None
+        self.name_search_index: Optional[NgramIndex] = None
+        self.name_similarity_index: Optional[TrigramSimilarityIndex] = None
+        self.query_index: Optional[QueryIndex] = None
         self.load_all_items(input_data_file_or_directory)
 
     def __iter__(self) -> Generator[ItemProperties, None, None]:
         """Iterate (loop) over each ItemProperties object."""
+        if self.lazy:
+            for item_id in self.item_offsets:
+                yield self._get_lazy_item(item_id)
+            return
+
         for item in self.all_items:
             yield item
 
@@ -53,6 +107,8 @@ class AllItems:
         :param id_number: The item ID number.
         :return: The item definition object linked to a specific ID number.
         """
+        if self.lazy:
+            return self._get_lazy_item(id_number)
         return self.all_items_dict[id_number]
 
     def __len__(self) -> int:
@@ -60,6 +116,8 @@ class AllItems:
 
         :return: The total number of items.
         """
+        if self.lazy:
+            return len(self.item_offsets)
         return len(self.all_items)
 
     def lookup_by_item_id(self, item_id_number: int) -> ItemProperties:
@@ -70,7 +128,7 @@ class AllItems:
         :raises: KeyError when the item ID cannot be found.
         """
         try:
-            item_properties = self.all_items_dict[item_id_number]
+            item_properties = self[item_id_number]
         except KeyError:
             raise KeyError("Cannot find the provided item ID number...")
         return item_properties
@@ -83,30 +141,75 @@ class AllItems:
         method parameters. The only transformation performed on the item name
         provided is to convert it to lower case to (slightly) improve lookup recall.
         This function works on a first-come-first-served basis. The first instance
-        where the name matches is returned.
+        (lowest item ID) where the name matches is returned.
 
         :param item_name: The item name to lookup.
         :param use_wiki_name: Whether to use the `wiki_name` instead of `name`.
         :return: The ItemProperties object found from the lookup.
         :raises: ValueError when the item name cannot be found.
         """
-        # Set the property value
-        lookup_property = "name"
-        if use_wiki_name:
-            lookup_property = "wiki_name"
+        name_index = self._get_name_index(use_wiki_name)
 
-        for item in self.all_items:
-            # Get the raw property value
-            name_value = getattr(item, lookup_property)
-            # Check property value for None (only effective for wiki_name)
-            if not name_value:
-                continue
+        try:
+            item_id = name_index[item_name.lower()]
+        except KeyError:
+            raise ValueError("Cannot find the provided item name...")
+        return self[item_id]
 
-            # Check for an exact name match
-            if name_value.lower() == item_name.lower():
-                return item
+    def lookup_by_item_names(self, item_names: List[str], use_wiki_name: bool = False) -> List[Optional[ItemProperties]]:
+        """Lookup a list of item names and get the associated ItemProperties objects.
 
-        raise ValueError("Cannot find the provided item name...")
+        This function performs the same lookup as `lookup_by_item_name` for every
+        name in the provided list. Item names that cannot be found are returned as
+        None, instead of raising an error.
+
+        :param item_names: The item names to lookup.
+        :param use_wiki_name: Whether to use the `wiki_name` instead of `name`.
+        :return: A list of ItemProperties objects (or None), in the same order as `item_names`.
+        """
+        name_index = self._get_name_index(use_wiki_name)
+
+        item_results = list()
+        for item_name in item_names:
+            item_id = name_index.get(item_name.lower())
+            if item_id is None:
+                item_results.append(None)
+            else:
+                item_results.append(self[item_id])
+
+        return item_results
+
+    def canonical(self, item_id_number: int) -> int:
+        """Get the canonical (base) item ID of an item.
+
+        Noted, placeholder and other linked items resolve to the item they are
+        linked to (the `linked_id_item` property). Every other item is its own
+        canonical item. In lazy mode the variant graph is built on the first call,
+        as every item must be read.
+
+        :param item_id_number: The item ID to resolve.
+        :return: The canonical item ID.
+        :raises: KeyError when the item ID cannot be found.
+        """
+        try:
+            return self._get_item_variants().canonical(item_id_number)
+        except KeyError:
+            raise KeyError("Cannot find the provided item ID number...")
+
+    def variants(self, item_id_number: int) -> List[int]:
+        """Get the item IDs of every variant of an item.
+
+        The variants are the canonical item and every item linked to it (for
+        example, the noted and placeholder versions of the item).
+
+        :param item_id_number: The item ID of the canonical item, or any variant.
+        :return: A list of item IDs, the canonical item ID first.
+        :raises: KeyError when the item ID cannot be found.
+        """
+        try:
+            return self._get_item_variants().variants(item_id_number)
+        except KeyError:
+            raise KeyError("Cannot find the provided item ID number...")
 
     def search_item_names(self, keyword: str) -> List[ItemProperties]:
         """Keyword search items and get the a list of ItemProperties objects.
@@ -114,20 +217,107 @@ class AllItems:
         This function performs a search of all item names in the database. The name
         and wiki_name properties are searched. Results are returned as a list of
         ItemProperties objects. The only transformation performed is converting the
-        search keyword and item name/wiki_name to lower case.
+        search keyword and item name/wiki_name to lower case. A trigram index of
+        the item names is built on the first search.
 
         :param keyword: The keyword to search for.
         :return: A list of ItemProperties objects found from the keyword search.
-        :raises: ValueError when no keyword matches can be found.
         """
-        item_results = list()
-        for item in self.all_items:
-            if keyword.lower() in item.name.lower():
-                item_results.append(item)
-            elif keyword.lower() in item.wiki_name.lower():
-                item_results.append(item)
+        if self.name_search_index is None:
+            name_search_index = NgramIndex()
+            for item in self:
+                name_search_index.add(item.id, item.name, item.wiki_name)
+            self.name_search_index = name_search_index
+
+        return [self[item_id] for item_id in self.name_search_index.search(keyword)]
+
+    def fuzzy_search_item_names(self, query: str, k: int = 10) -> List[ItemProperties]:
+        """Fuzzy search items and get a ranked list of ItemProperties objects.
+
+        This function performs a typo-tolerant search of all item names in the database.
+        The name and wiki_name properties are searched, and items are ranked by the
+        trigram similarity of the most similar name to the query. For example, the
+        query `dragn scimmy` returns `Dragon scimitar` first. A trigram index of the
+        item names is built on the first search.
+
+        :param query: The text to search for.
+        :param k: The maximum number of items to return.
+        :return: A list of ItemProperties objects, most similar first.
+        """
+        if self.name_similarity_index is None:
+            name_similarity_index = TrigramSimilarityIndex()
+            for item in self:
+                name_similarity_index.add(item.id, item.name, item.wiki_name)
+            self.name_similarity_index = name_similarity_index
 
-        return item_results
+        return [self[item_id] for item_id, _ in self.name_similarity_index.search(query, k)]
+
+    def query(self, **predicates) -> List[ItemProperties]:
+        """Query items by property values and get a list of ItemProperties objects.
+
+        Each keyword is a property name, with an optional operator separated by `__`.
+        Nested properties are also separated by `__`. The supported operators are:
+        `eq` (the default), `in` (value in a collection), `contains` (list property
+        contains a value), `lt`, `le`, `gt`, `ge` and `range` (inclusive (low, high)
+        tuple). For example:
+
+            all_db_items.query(members=False, equipment__slot__in=("weapon", "2h"))
+            all_db_items.query(tradeable_on_ge=True, weapon__weapon_type="slashing_swords", cost__range=(100, 1000))
+
+        Secondary indexes for each queried property are built on first use, and
+        the results of each keyword are intersected. Results are sorted by ID.
+
+        :param predicates: Keyword predicates of `property__operator=value`.
+        :return: A list of ItemProperties objects matching every predicate.
+        :raises ValueError: Unknown property name, or invalid value for the operator.
+        """
+        if self.query_index is None:
+            self.query_index = QueryIndex(lambda: self)
+
+        return [self[entry_id] for entry_id in self.query_index.query(**predicates)]
+
+    def equipment_matrix(self):
+        """Get a NumPy structured array of the equipment bonuses of equipable items.
+
+        The array has one row for every item that is `equipable_by_player`, sorted
+        by item ID. The fields (columns) are `id`, `slot` (the index of the slot name
+        in `EQUIPMENT_SLOTS`, or -1 if unknown), `attack_speed` (-1 for items that
+        are not weapons) and the 14 equipment bonuses in `EQUIPMENT_BONUSES`. The
+        array is built on the first call, then cached, and is read-only. For example,
+        the IDs of the 10 items with the highest slash attack bonus:
+
+            matrix = all_db_items.equipment_matrix()
+            top_ids = matrix["id"][numpy.argsort(matrix["attack_slash"])[::-1][:10]]
+
+        :return: A read-only NumPy structured array of equipment bonuses.
+        :raises ImportError: NumPy is not installed.
+        """
+        if self._equipment_matrix is not None:
+            return self._equipment_matrix
+
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("Error: equipment_matrix requires NumPy, install using: pip install osrsbox[numpy]") from e
+
+        dtype = [("id", numpy.int32), ("slot", numpy.int8), ("attack_speed", numpy.int8)]
+        dtype += [(bonus, numpy.int16) for bonus in EQUIPMENT_BONUSES]
+
+        rows = list()
+        for item in self:
+            if not item.equipable_by_player:
+                continue
+            attack_speed = -1
+            if item.weapon and item.weapon.attack_speed is not None:
+                attack_speed = item.weapon.attack_speed
+            row = (item.id, EQUIPMENT_SLOT_CODES.get(item.equipment.slot, -1), attack_speed)
+            row += tuple(getattr(item.equipment, bonus) for bonus in EQUIPMENT_BONUSES)
+            rows.append(row)
+
+        matrix = numpy.array(rows, dtype=dtype)
+        matrix.flags.writeable = False
+        self._equipment_matrix = matrix
+        return matrix
 
     def load_all_items(self, input_data_file_or_directory: Union[Path, str]) -> None:
         """Load the items database via a JSON file, or directory of JSON files.
@@ -139,6 +329,11 @@ class AllItems:
         if isinstance(input_data_file_or_directory, str):
             input_data_file_or_directory = Path(input_data_file_or_directory)
 
+        # In lazy mode, only index the item locations
+        if self.lazy:
+            self.item_offsets = ItemOffsets(input_data_file_or_directory)
+            return
+
         # Process the directory of JSON, or a single JSON file
         if input_data_file_or_directory.is_dir():
             self._load_items_from_directory(path_to_directory=input_data_file_or_directory)
@@ -150,6 +345,51 @@ class AllItems:
         # Sort the list of items
         self.all_items.sort(key=lambda x: x.id)
 
+        # Build the item name lookup indexes
+        self._build_name_indexes()
+
+        # Build the noted/placeholder/linked item variant graph
+        self.item_variants = ItemVariants(self.all_items)
+
+    def _get_name_index(self, use_wiki_name: bool) -> Dict[str, int]:
+        """Get the lower case `name` or `wiki_name` to item ID index.
+
+        :param use_wiki_name: Whether to get the `wiki_name` index instead of `name`.
+        :return: A dictionary mapping lower case name to item ID.
+        """
+        if self.name_index is None:
+            self._build_name_indexes()
+        if use_wiki_name:
+            return self.wiki_name_index
+        return self.name_index
+
+    def _get_item_variants(self) -> ItemVariants:
+        """Get the item variant graph, building it in lazy mode.
+
+        :return: The ItemVariants object for the loaded items.
+        """
+        if self.item_variants is None:
+            self.item_variants = ItemVariants(self)
+        return self.item_variants
+
+    def _build_name_indexes(self) -> None:
+        """Build the lower case `name` and `wiki_name` to item ID indexes.
+
+        Only the first (lowest) item ID is stored for each name. In lazy mode the
+        indexes are built on the first name lookup, as every item must be read.
+        """
+        name_index = dict()
+        wiki_name_index = dict()
+        for item in self:
+            # Check property values for None (only effective for wiki_name)
+            if item.name:
+                name_index.setdefault(item.name.lower(), item.id)
+            if item.wiki_name:
+                wiki_name_index.setdefault(item.wiki_name.lower(), item.id)
+
+        self.name_index = name_index
+        self.wiki_name_index = wiki_name_index
+
     def _load_items_from_directory(self, path_to_directory: Path) -> None:
         """Load item database from a directory of JSON files (`items-json`).
 
@@ -164,11 +404,8 @@ class AllItems:
         except IndexError as e:
             raise ValueError("Error: No files found in directory, check the supplied path. Exiting.") from e
 
-        # Loop through every item in JSON file
-        for json_file in json_files:
-            with open(json_file) as input_json_file:
-                temp = json.load(input_json_file)
-
+        # Read and decode every JSON file, sorted by file name for a deterministic load order
+        for temp in load_json_files(json_files, workers=self.workers):
             self._load_item(temp)
 
     def _load_items_from_file(self, path_to_json_file: Path) -> None:
@@ -176,24 +413,66 @@ class AllItems:
 
         :param path_to_json_file: The path to the `items-complete.json` file.
         """
+        # Use the binary snapshot of the JSON file, if available
+        if self.snapshot:
+            snapshot_items = load_snapshot(path_to_json_file, SNAPSHOT_SCHEMA)
+            if snapshot_items is not None:
+                for item_def in snapshot_items:
+                    self.all_items.append(item_def)
+                    self.all_items_dict[item_def.id] = item_def
+                return
+
         with open(path_to_json_file) as input_json_file:
             temp = json.load(input_json_file)
 
         for entry in temp:
             self._load_item(temp[entry])
 
+        if self.snapshot:
+            save_snapshot(path_to_json_file, SNAPSHOT_SCHEMA, self.all_items)
+
     def _load_item(self, item_json: Dict) -> None:
         """Convert the `item_json` into a :class:`ItemProperties` and store it.
 
         :param item_json: A dict from an open and loaded JSON file.
         :raises ValueError: Cannot populate item.
         """
-        # Load the item using the ItemProperties class
-        try:
-            item_def = ItemProperties.from_json(item_json)
-        except TypeError as e:
-            raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting") from e
+        item_def = self._build_item(item_json)
 
         # Add item to list
         self.all_items.append(item_def)
         self.all_items_dict[item_def.id] = item_def
+
+    def _get_lazy_item(self, item_id: int) -> ItemProperties:
+        """Return a cached :class:`ItemProperties`, or build it from the item index.
+
+        :param item_id: The item ID number.
+        :return: The ItemProperties object for the item ID number.
+        :raises KeyError: When the item ID is not indexed.
+        """
+        item_def = self.item_cache.get(item_id)
+        if item_def is not None:
+            self.item_cache.move_to_end(item_id)
+            return item_def
+
+        item_def = self._build_item(self.item_offsets.read(item_id))
+
+        # Add item to cache, and drop the least recently used item if full
+        self.item_cache[item_id] = item_def
+        if len(self.item_cache) > self.cache_size:
+            self.item_cache.popitem(last=False)
+        return item_def
+
+    @staticmethod
+    def _build_item(item_json: Dict) -> ItemProperties:
+        """Convert the `item_json` into a :class:`ItemProperties`.
+
+        :param item_json: A dict from an open and loaded JSON file.
+        :return: The populated ItemProperties object.
+        :raises ValueError: Cannot populate item.
+        """
+        # Load the item using the ItemProperties class
+        try:
+            return ItemProperties.from_json(item_json)
+        except TypeError as e:
+            raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting") from e
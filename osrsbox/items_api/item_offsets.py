@@ -0,0 +1,204 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import re
+import json
+from pathlib import Path
+from typing import BinaryIO, Dict, Generator, List, Optional, Tuple, Union
+
+from osrsbox.snapshot import sample_hash
+
+# Bump this number if the layout of the sidecar index file changes
+INDEX_VERSION = 2
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ItemOffsets:
+    """This class maps item ID numbers to the location of the item JSON on disk.
+
+    For a single JSON file (`items-complete.json`) the byte offset and length of
+    every item entry is stored in a sidecar index file (`items-complete.json.idx`)
+    so that the whole file does not need to be decoded on every load. The index is
+    rebuilt when the size, modification time or a hash of the first and last blocks
+    of the JSON file changes. The JSON file is kept open for reading items until
+    close is called. For a directory of JSON files (`items-json`) each item is
+    stored in `<id>.json`.
+
+    :param input_data_file_or_directory: The osrsbox-db items folder of JSON files, or single JSON file.
+    """
+    def __init__(self, input_data_file_or_directory: Union[Path, str]):
+        self.json_file: Optional[BinaryIO] = None
+        self.path = Path(input_data_file_or_directory)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.offsets: Dict[int, Tuple[int, int]] = dict()
+        self.paths: Dict[int, Path] = dict()
+
+        if self.path.is_dir():
+            self._load_directory()
+        elif self.path.is_file():
+            self.json_file = open(self.path, "rb")
+            self._load_index()
+        else:
+            raise ValueError("Error: Valid input not found. Exiting.")
+
+        # Item IDs are sorted to keep the same order as a fully loaded database
+        self.item_ids: List[int] = sorted(self.paths or self.offsets)
+
+    def __iter__(self) -> Generator[int, None, None]:
+        """Iterate (loop) over each item ID number, sorted by ID."""
+        for item_id in self.item_ids:
+            yield item_id
+
+    def __contains__(self, item_id: int) -> bool:
+        """Check if an item ID number is indexed."""
+        return item_id in self.offsets or item_id in self.paths
+
+    def __len__(self) -> int:
+        """Return the count of the total number of indexed items.
+
+        :return: The total number of indexed items.
+        """
+        return len(self.item_ids)
+
+    def read(self, item_id: int) -> Dict:
+        """Read and decode the JSON for a single item.
+
+        :param item_id: The item ID number.
+        :return: A dict of the item JSON.
+        :raises KeyError: When the item ID is not indexed.
+        """
+        if self.paths:
+            with open(self.paths[item_id]) as input_json_file:
+                return json.load(input_json_file)
+
+        offset, length = self.offsets[item_id]
+        self.json_file.seek(offset)
+        raw = self.json_file.read(length)
+        return json.loads(raw.decode("utf-8"))
+
+    def close(self):
+        """Close the JSON file, no more items can be read from a single JSON file."""
+        if self.json_file is not None:
+            self.json_file.close()
+
+    def __del__(self):
+        self.close()
+
+    def _load_directory(self):
+        """Index a directory of JSON files, where each file is named `<id>.json`.
+
+        :raises ValueError: No JSON files found in supplied directory.
+        """
+        for json_file in self.path.glob("*.json"):
+            self.paths[int(json_file.stem)] = json_file
+
+        if not self.paths:
+            raise ValueError("Error: No files found in directory, check the supplied path. Exiting.")
+
+    def _load_index(self):
+        """Load the sidecar index file, or build (and save) it if missing or outdated."""
+        stat = self.path.stat()
+        sample_sha256 = sample_hash(self.path, stat.st_size)
+
+        try:
+            with open(self.index_path) as index_file:
+                index = json.load(index_file)
+            if (index["version"] == INDEX_VERSION and
+                    index["size"] == stat.st_size and
+                    index["mtime_ns"] == stat.st_mtime_ns and
+                    index["sample_sha256"] == sample_sha256):
+                for item_id, offset, length in index["offsets"]:
+                    self.offsets[item_id] = (offset, length)
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            # No usable index file, fall through and build one
+            pass
+
+        self.offsets = scan_offsets(self.path)
+
+        index = {
+            "version": INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sample_sha256": sample_sha256,
+            "offsets": [[item_id, offset, length] for item_id, (offset, length) in self.offsets.items()]
+        }
+        try:
+            with open(self.index_path, "w") as index_file:
+                json.dump(index, index_file)
+        except OSError:
+            # Read-only install location, keep the index in memory only
+            pass
+
+
+def scan_offsets(path_to_json_file: Path) -> Dict[int, Tuple[int, int]]:
+    """Determine the byte offset and length of every entry in a JSON object file.
+
+    The file must have the `items-complete.json` layout: a single JSON object
+    where each key is an ID number, and each value is the JSON for that ID.
+
+    :param path_to_json_file: The path to the JSON file.
+    :return: A dictionary mapping ID number to a tuple of (offset, length) in bytes.
+    :raises ValueError: Invalid JSON structure found.
+    """
+    with open(path_to_json_file, "rb") as input_json_file:
+        raw = input_json_file.read()
+    text = raw.decode("utf-8")
+    # If every character is a single byte, character and byte positions are equal
+    is_ascii = len(text) == len(raw)
+
+    decoder = json.JSONDecoder()
+    offsets = dict()
+
+    # Track the last converted character position for non-ASCII files
+    last_char = 0
+    last_byte = 0
+
+    def to_byte_position(char_position: int) -> int:
+        nonlocal last_char, last_byte
+        if is_ascii:
+            return char_position
+        last_byte += len(text[last_char:char_position].encode("utf-8"))
+        last_char = char_position
+        return last_byte
+
+    position = WHITESPACE.match(text, 0).end()
+    if text[position:position + 1] != "{":
+        raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+    position = WHITESPACE.match(text, position + 1).end()
+
+    while text[position:position + 1] != "}":
+        key, position = decoder.raw_decode(text, position)
+        position = WHITESPACE.match(text, position).end()
+        if text[position:position + 1] != ":":
+            raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+        start = WHITESPACE.match(text, position + 1).end()
+        _, end = decoder.raw_decode(text, start)
+
+        byte_start = to_byte_position(start)
+        byte_end = to_byte_position(end)
+        offsets[int(key)] = (byte_start, byte_end - byte_start)
+
+        position = WHITESPACE.match(text, end).end()
+        if text[position:position + 1] == ",":
+            position = WHITESPACE.match(text, position + 1).end()
+
+    return offsets
@@ -0,0 +1,126 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+from array import array
+from typing import Dict, Iterable, List
+
+from osrsbox.items_api.item_properties import ItemProperties
+
+# Value stored for item IDs that are not in the database
+MISSING = -1
+
+
+class ItemVariants:
+    """This class maps items to their canonical (base) item, and base items to their variants.
+
+    Noted and placeholder items (and other linked items) have a `linked_id_item`
+    property that is the ID of the base item. The base item is the canonical item
+    of itself, and every item linked to it. The graph is stored as flat integer
+    arrays indexed by item ID: `canonical_ids` holds the canonical item ID of each
+    item, and the variants of each canonical item are stored in `variant_ids`,
+    starting at `variant_offsets[canonical_id]` (a compressed sparse row layout).
+
+    :param items: The items to map.
+    """
+    def __init__(self, items: Iterable[ItemProperties]):
+        links: Dict[int, int] = dict()
+        for item in items:
+            links[item.id] = item.linked_id_item if item.linked_id_item is not None else item.id
+
+        size = max(links) + 1 if links else 0
+        canonical_ids = array("i", [MISSING]) * size
+        for item_id, linked_id in links.items():
+            if linked_id == item_id or links.get(linked_id) == linked_id:
+                # Most items are canonical, or linked directly to a canonical item
+                canonical_ids[item_id] = linked_id
+            else:
+                canonical_ids[item_id] = self._resolve(links, item_id)
+
+        # Count the variants of each canonical item, then convert the counts to offsets
+        variant_offsets = array("i", [0]) * (size + 1)
+        for canonical_id in canonical_ids:
+            if canonical_id != MISSING:
+                variant_offsets[canonical_id + 1] += 1
+        for item_id in range(size):
+            variant_offsets[item_id + 1] += variant_offsets[item_id]
+
+        # Store the canonical item first, then the other variants sorted by item ID
+        variant_ids = array("i", [MISSING]) * len(links)
+        positions = variant_offsets[:-1]
+        canonical_items = [item_id for item_id in range(size) if canonical_ids[item_id] == item_id]
+        other_items = [item_id for item_id in range(size) if canonical_ids[item_id] not in (item_id, MISSING)]
+        for item_id in canonical_items + other_items:
+            canonical_id = canonical_ids[item_id]
+            variant_ids[positions[canonical_id]] = item_id
+            positions[canonical_id] += 1
+
+        self.canonical_ids = canonical_ids
+        self.variant_offsets = variant_offsets
+        self.variant_ids = variant_ids
+
+    def __len__(self) -> int:
+        """Return the count of the total number of mapped items.
+
+        :return: The total number of mapped items.
+        """
+        return len(self.variant_ids)
+
+    def canonical(self, item_id: int) -> int:
+        """Get the canonical (base) item ID of an item.
+
+        :param item_id: The item ID number.
+        :return: The canonical item ID number.
+        :raises KeyError: When the item ID is not mapped.
+        """
+        if 0 <= item_id < len(self.canonical_ids):
+            canonical_id = self.canonical_ids[item_id]
+            if canonical_id != MISSING:
+                return canonical_id
+        raise KeyError(item_id)
+
+    def variants(self, item_id: int) -> List[int]:
+        """Get every variant of an item, including the item itself.
+
+        :param item_id: The item ID number, of the canonical item or any variant.
+        :return: A list of item ID numbers, the canonical item first.
+        :raises KeyError: When the item ID is not mapped.
+        """
+        canonical_id = self.canonical(item_id)
+        return self.variant_ids[self.variant_offsets[canonical_id]:self.variant_offsets[canonical_id + 1]].tolist()
+
+    @staticmethod
+    def _resolve(links: Dict[int, int], item_id: int) -> int:
+        """Follow the links from an item to the canonical item.
+
+        A link to an item that is not in the database is ignored, and a loop of
+        links resolves to the lowest item ID in the loop.
+
+        :param links: A dictionary mapping item ID to the linked item ID.
+        :param item_id: The item ID number.
+        :return: The canonical item ID number.
+        """
+        seen = [item_id]
+        while True:
+            linked_id = links[seen[-1]]
+            if linked_id == seen[-1] or linked_id not in links:
+                return seen[-1]
+            if linked_id in seen:
+                return min(seen[seen.index(linked_id):])
+            seen.append(linked_id)
@@ -53,44 +53,43 @@ if __name__ == "__main__":
     # Setup output dictionary
     chunk_tracker_data = list()
 
-    # Loop through all items in the database
-    for item in all_db_items:
-        # Convert stats if item is equipable
-        if item.equipable_by_player:
-            offensive = [item.equipment.attack_stab,
-                         item.equipment.attack_slash,
-                         item.equipment.attack_crush,
-                         item.equipment.attack_magic,
-                         item.equipment.attack_ranged]
-            defensive = [item.equipment.defence_stab,
-                         item.equipment.defence_slash,
-                         item.equipment.defence_crush,
-                         item.equipment.defence_magic,
-                         item.equipment.defence_ranged]
-            other = [item.equipment.melee_strength,
-                     item.equipment.ranged_strength,
-                     item.equipment.magic_damage,
-                     item.equipment.prayer,
-                     item.equipment.attack_speed]
+    # Loop through all equipable items in the database
+    for item in all_db_items.query(equipable_by_player=True):
+        # Convert equipment stats
+        offensive = [item.equipment.attack_stab,
+                     item.equipment.attack_slash,
+                     item.equipment.attack_crush,
+                     item.equipment.attack_magic,
+                     item.equipment.attack_ranged]
+        defensive = [item.equipment.defence_stab,
+                     item.equipment.defence_slash,
+                     item.equipment.defence_crush,
+                     item.equipment.defence_magic,
+                     item.equipment.defence_ranged]
+        other = [item.equipment.melee_strength,
+                 item.equipment.ranged_strength,
+                 item.equipment.magic_damage,
+                 item.equipment.prayer,
+                 item.equipment.attack_speed]
 
-            # Append extracted data to a dictionary
-            stats_dict = dict()
-            stats_dict["offensive"] = offensive
-            stats_dict["defensive"] = defensive
-            stats_dict["other"] = other
+        # Append extracted data to a dictionary
+        stats_dict = dict()
+        stats_dict["offensive"] = offensive
+        stats_dict["defensive"] = defensive
+        stats_dict["other"] = other
 
-            # Set properties for the item dictionary
-            item_dict = dict()
-            item_dict["id"] = item.id
-            item_dict["name"] = item.name
-            item_dict["equipable"] = item.equipable
-            item_dict["members"] = item.members
-            item_dict["stats"] = stats_dict
-            item_dict["slot"] = item.equipment.slot
-            item_dict["skill_reqs"] = item.equipment.requirements
+        # Set properties for the item dictionary
+        item_dict = dict()
+        item_dict["id"] = item.id
+        item_dict["name"] = item.name
+        item_dict["equipable"] = item.equipable
+        item_dict["members"] = item.members
+        item_dict["stats"] = stats_dict
+        item_dict["slot"] = item.equipment.slot
+        item_dict["skill_reqs"] = item.equipment.requirements
 
-            # Add equipable item data to list of all equipable items
-            chunk_tracker_data.append(item_dict)
+        # Add equipable item data to list of all equipable items
+        chunk_tracker_data.append(item_dict)
 
     # Export extracted data
     out_file_name = "EquippableItems.json"
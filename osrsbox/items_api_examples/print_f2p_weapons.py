@@ -31,10 +31,11 @@ if __name__ == "__main__":
     # Load all items
     all_db_items = items_api.load()
 
-    # Loop through all items in the database and print the item name for each item
-    for item in all_db_items:
-        # Check if item is equipable, and is not memebers (aka f2p item)
-        if item.equipable_by_player and not item.members:
-            # If item is a "weapon" of "2h" weapon, print it!
-            if item.equipment.slot == "weapon" or item.equipment.slot == "2h":
-                print(f"{item.id:<6} {item.name}")  # New, f-strings printing method
+    # Query for every equipable, non-members (aka f2p) "weapon" or "2h" weapon
+    f2p_weapons = all_db_items.query(equipable_by_player=True,
+                                     members=False,
+                                     equipment__slot__in=("weapon", "2h"))
+
+    # Loop through all items found and print the item name for each item
+    for item in f2p_weapons:
+        print(f"{item.id:<6} {item.name}")  # New, f-strings printing method
@@ -31,21 +31,22 @@ if __name__ == "__main__":
     # Load all items
     all_db_items = items_api.load()
 
+    # Query for every item equipable by the player
+    equipable_items = all_db_items.query(equipable_by_player=True)
+
     prayer_items = dict()
 
     # Populate dict
-    for item in all_db_items:
-        if item.equipable_by_player:
-            prayer_items[item.equipment.slot] = {"prayer_bonus": 0, "name": None}
-
-    # Loop through all items in the database
-    for item in all_db_items:
-        if item.equipable_by_player:
-            item_slot = item.equipment.slot
-            prayer_bonus = item.equipment.prayer
-
-            if prayer_bonus > prayer_items[item_slot]["prayer_bonus"]:
-                prayer_items[item_slot] = {"prayer_bonus": prayer_bonus, "name": item.name}
+    for item in equipable_items:
+        prayer_items[item.equipment.slot] = {"prayer_bonus": 0, "name": None}
+
+    # Loop through all equipable items
+    for item in equipable_items:
+        item_slot = item.equipment.slot
+        prayer_bonus = item.equipment.prayer
+
+        if prayer_bonus > prayer_items[item_slot]["prayer_bonus"]:
+            prayer_items[item_slot] = {"prayer_bonus": prayer_bonus, "name": item.name}
 
     for item_slot, info_dict in prayer_items.items():
         print(f"{item_slot:<10} {info_dict['prayer_bonus']:<10} {info_dict['name']}")
@@ -35,11 +35,10 @@ if __name__ == "__main__":
 
     top_attack_slash = defaultdict(list)
 
-    # Loop the item database
-    for item in all_db_items:
-        if item.equipable_by_player:  # If item is equipable, continue processing
-            # Append equipable item slash bonus, and item name
-            top_attack_slash[item.equipment.attack_slash].append(item.name)
+    # Query the item database for every item equipable by the player
+    for item in all_db_items.query(equipable_by_player=True):
+        # Append equipable item slash bonus, and item name
+        top_attack_slash[item.equipment.attack_slash].append(item.name)
 
     # Loop sorted dictionary
     for slash_attack_bonus, items in sorted(top_attack_slash.items(), reverse=True):
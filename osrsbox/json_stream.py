@@ -0,0 +1,154 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Incremental parsing of the osrsbox-db complete JSON files (for example,
+`items-complete.json`), decoding one entry at a time from a bounded buffer
+instead of decoding the entire file into memory.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import re
+import json
+from pathlib import Path
+from typing import Any, Generator, Tuple
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that can continue a JSON number, such as `1.5e10`
+NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
+
+# The number of characters read from the file at a time
+CHUNK_SIZE = 1 << 16
+
+
+class JsonObjectStream:
+    """This class reads the top-level JSON object in a file, one key and value at a time.
+
+    Characters are read from the file into a buffer in chunks. Each key and value
+    is decoded with `json.JSONDecoder.raw_decode`, and when a value is incomplete
+    (it runs past the end of the buffer) more of the file is read and the value is
+    decoded again. Characters of decoded entries are dropped from the buffer, so
+    memory use depends on the size of the largest entry, not the size of the file.
+
+    :param path_to_json_file: The path to the JSON file.
+    :param chunk_size: The number of characters to read from the file at a time.
+    """
+    def __init__(self, path_to_json_file: Path, chunk_size: int = CHUNK_SIZE):
+        self.path = Path(path_to_json_file)
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        """Iterate (loop) over each key and decoded value of the top-level JSON object."""
+        with open(self.path, encoding="utf-8") as input_json_file:
+            self.file = input_json_file
+            self.buffer = ""
+            self.position = 0
+            self.eof = False
+
+            self._expect("{")
+            if self._peek() == "}":
+                return
+
+            while True:
+                key = self._decode()
+                if not isinstance(key, str):
+                    raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+                self._expect(":")
+                value = self._decode()
+                yield key, value
+
+                separator = self._peek()
+                self.position += 1
+                if separator == "}":
+                    return
+                if separator != ",":
+                    raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+
+    def _read(self, size: int) -> bool:
+        """Read more characters from the file into the buffer, dropping decoded characters.
+
+        :param size: The number of characters to read.
+        :return: A boolean to indicate if any characters were read.
+        """
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        chunk = self.file.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and get the next character, reading more of the file if needed.
+
+        :return: The next non-whitespace character.
+        :raises ValueError: The file ended before the JSON object.
+        """
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read(self.chunk_size):
+                raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+
+    def _expect(self, character: str) -> None:
+        """Skip whitespace and a single expected character.
+
+        :param character: The expected character.
+        :raises ValueError: A different character was found.
+        """
+        if self._peek() != character:
+            raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+        self.position += 1
+
+    def _decode(self) -> Any:
+        """Decode the next JSON value, reading more of the file until it is complete.
+
+        :return: The decoded JSON value.
+        :raises ValueError: Invalid JSON found.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                value, end = None, None
+
+            # A number that ends at the end of the buffer, or before a number character
+            # (such as `1.` from `1.5`), may continue in the file
+            if end is not None and (self.eof or (end < len(self.buffer) and
+                                                 self.buffer[end] not in NUMBER_CHARACTERS)):
+                self.position = end
+                return value
+
+            # Read at least as much as is buffered, so large values are not decoded too many times
+            if not self._read(max(self.chunk_size, len(self.buffer))) and end is None:
+                raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting")
+
+
+def iter_json_object(path_to_json_file: Path, chunk_size: int = CHUNK_SIZE) -> Generator[Tuple[str, Any], None, None]:
+    """Iterate (loop) over each key and decoded value of the top-level object in a JSON file.
+
+    :param path_to_json_file: The path to the JSON file.
+    :param chunk_size: The number of characters to read from the file at a time.
+    :return: A generator of (key, value) tuples, in file order.
+    """
+    return iter(JsonObjectStream(path_to_json_file, chunk_size))
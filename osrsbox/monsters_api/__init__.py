@@ -18,12 +18,42 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
+from pathlib import Path
+from typing import Generator, Union
+
+from osrsbox.json_stream import iter_json_object
+from osrsbox.parallel_loader import read_json_file
 from osrsbox.monsters_api import all_monsters
+from osrsbox.monsters_api.monster_properties import MonsterProperties
 
 
-def load() -> all_monsters.AllMonsters:
+def load(snapshot: bool = False) -> all_monsters.AllMonsters:
     """Load the osrsbox monster database.
 
+    :param snapshot: Whether to use (and save) a binary snapshot of the monster database, default is False.
     :return: An AllMonsters object containing the entire monster database.
     """
-    return all_monsters.AllMonsters()
+    return all_monsters.AllMonsters(snapshot=snapshot)
+
+
+def iter_monsters(path: Union[Path, str] = all_monsters.PATH_TO_MONSTERS_COMPLETE) -> Generator[MonsterProperties, None, None]:
+    """Iterate (loop) over the monster database, without loading the entire database.
+
+    Monsters are decoded from the JSON file one at a time, and each MonsterProperties
+    object is built when it is reached, so memory use does not grow with the size
+    of the database. Monsters are returned in file order for a single JSON file,
+    and sorted by ID for a directory of JSON files.
+
+    :param path: The path to the `monsters-complete.json` file, or `monsters-json` directory.
+    :return: A generator of MonsterProperties objects.
+    :raises ValueError: Valid input not found.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for json_file in sorted(path.glob("*.json"), key=lambda x: int(x.stem)):
+            yield all_monsters.AllMonsters._build_monster(read_json_file(json_file))
+    elif path.is_file():
+        for _, monster_json in iter_json_object(path):
+            yield all_monsters.AllMonsters._build_monster(monster_json)
+    else:
+        raise ValueError("Error: Valid input not found. Exiting.")
@@ -23,8 +23,14 @@ from pathlib import Path
 from typing import Dict
 from typing import List
 from typing import Union
+from typing import Optional
 from typing import Generator
 
+from osrsbox.query_index import QueryIndex
+from osrsbox.ngram_index import NgramIndex, TrigramSimilarityIndex
+from osrsbox.parallel_loader import load_json_files
+from osrsbox.snapshot import load_snapshot, save_snapshot
+from osrsbox.monsters_api.monster_drop import MonsterDrop
 from osrsbox.monsters_api.monster_properties import MonsterProperties
 
 PATH_TO_MONSTERS_COMPLETE = Path(__file__).absolute().parent / ".." / ".." / "docs" / "monsters-complete.json"
@@ -33,15 +39,31 @@ if not PATH_TO_MONSTERS_COMPLETE.is_file():
     if not PATH_TO_MONSTERS_COMPLETE.is_file():
         raise ValueError("Error: Default monsters database file not found. Exiting")
 
+# The dataclasses stored in a monsters database snapshot
+SNAPSHOT_SCHEMA = (MonsterProperties, MonsterDrop)
+
 
 class AllMonsters:
     """This class handles loading of the osrsbox-db monsters database.
 
+    When snapshots are enabled and a single JSON file is loaded, a binary snapshot
+    of the loaded monsters is saved next to the JSON file, and used on the next load
+    if the JSON file is unchanged. Snapshots are pickle files, so only enable them
+    if other users cannot write to the JSON file directory (see snapshot.py).
+
     :param input_data_file_or_directory: The osrsbox-db monsters folder of JSON files, or single JSON file.
+    :param snapshot: Whether to use (and save) a binary snapshot of a single JSON file, default is False.
+    :param workers: The number of worker processes used to read a directory of JSON files.
     """
-    def __init__(self, input_data_file_or_directory: Path = PATH_TO_MONSTERS_COMPLETE):
+    def __init__(self, input_data_file_or_directory: Path = PATH_TO_MONSTERS_COMPLETE,
+                 snapshot: bool = False, workers: int = 1):
         self.all_monsters: List[MonsterProperties] = list()
         self.all_monsters_dict: Dict[int, MonsterProperties] = dict()
+        self.snapshot = snapshot
+        self.workers = workers
+        self.name_search_index: Optional[NgramIndex] = None
+        self.name_similarity_index: Optional[TrigramSimilarityIndex] = None
+        self.query_index: Optional[QueryIndex] = None
         self.load_all_monsters(input_data_file_or_directory)
 
     def __iter__(self) -> Generator[MonsterProperties, None, None]:
@@ -64,6 +86,70 @@ class AllMonsters:
         """
         return len(self.all_monsters)
 
+    def search_monster_names(self, keyword: str) -> List[MonsterProperties]:
+        """Keyword search monsters and get the a list of MonsterProperties objects.
+
+        This function performs a search of all monster names in the database. The name
+        and wiki_name properties are searched. Results are returned as a list of
+        MonsterProperties objects. The only transformation performed is converting the
+        search keyword and monster name/wiki_name to lower case. A trigram index of
+        the monster names is built on the first search.
+
+        :param keyword: The keyword to search for.
+        :return: A list of MonsterProperties objects found from the keyword search.
+        """
+        if self.name_search_index is None:
+            name_search_index = NgramIndex()
+            for monster in self.all_monsters:
+                name_search_index.add(monster.id, monster.name, monster.wiki_name)
+            self.name_search_index = name_search_index
+
+        return [self.all_monsters_dict[monster_id] for monster_id in self.name_search_index.search(keyword)]
+
+    def fuzzy_search_monster_names(self, query: str, k: int = 10) -> List[MonsterProperties]:
+        """Fuzzy search monsters and get a ranked list of MonsterProperties objects.
+
+        This function performs a typo-tolerant search of all monster names in the
+        database. The name and wiki_name properties are searched, and monsters are
+        ranked by the trigram similarity of the most similar name to the query. A
+        trigram index of the monster names is built on the first search.
+
+        :param query: The text to search for.
+        :param k: The maximum number of monsters to return.
+        :return: A list of MonsterProperties objects, most similar first.
+        """
+        if self.name_similarity_index is None:
+            name_similarity_index = TrigramSimilarityIndex()
+            for monster in self.all_monsters:
+                name_similarity_index.add(monster.id, monster.name, monster.wiki_name)
+            self.name_similarity_index = name_similarity_index
+
+        return [self.all_monsters_dict[monster_id] for monster_id, _ in self.name_similarity_index.search(query, k)]
+
+    def query(self, **predicates) -> List[MonsterProperties]:
+        """Query monsters by property values and get a list of MonsterProperties objects.
+
+        Each keyword is a property name, with an optional operator separated by `__`.
+        Nested properties are also separated by `__`. The supported operators are:
+        `eq` (the default), `in` (value in a collection), `contains` (list property
+        contains a value), `lt`, `le`, `gt`, `ge` and `range` (inclusive (low, high)
+        tuple). For example:
+
+            all_db_monsters.query(slayer_masters__contains="duradel", combat_level__ge=100)
+            all_db_monsters.query(members=False, attack_type__contains="stab", hitpoints__lt=50)
+
+        Secondary indexes for each queried property are built on first use, and
+        the results of each keyword are intersected. Results are sorted by ID.
+
+        :param predicates: Keyword predicates of `property__operator=value`.
+        :return: A list of MonsterProperties objects matching every predicate.
+        :raises ValueError: Unknown property name, or invalid value for the operator.
+        """
+        if self.query_index is None:
+            self.query_index = QueryIndex(lambda: self.all_monsters)
+
+        return [self.all_monsters_dict[entry_id] for entry_id in self.query_index.query(**predicates)]
+
     def load_all_monsters(self, input_data_file_or_directory: Union[Path, str]) -> None:
         """Load the monsters database via a JSON file, or directory of JSON files.
 
@@ -99,11 +185,8 @@ class AllMonsters:
         except IndexError as e:
             raise ValueError("Error: No files found in directory, check the supplied path. Exiting.") from e
 
-        # Loop through every monster in JSON file
-        for json_file in json_files:
-            with open(json_file) as input_json_file:
-                temp = json.load(input_json_file)
-
+        # Read and decode every JSON file, sorted by file name for a deterministic load order
+        for temp in load_json_files(json_files, workers=self.workers):
             self._load_monster(temp)
 
     def _load_monsters_from_file(self, path_to_json_file: Path) -> None:
@@ -111,24 +194,46 @@ class AllMonsters:
 
         :param path_to_json_file: The path to the `monster-complete.json` file.
         """
+        # Use the binary snapshot of the JSON file, if available
+        if self.snapshot:
+            snapshot_monsters = load_snapshot(path_to_json_file, SNAPSHOT_SCHEMA)
+            if snapshot_monsters is not None:
+                for monster_def in snapshot_monsters:
+                    self.all_monsters.append(monster_def)
+                    self.all_monsters_dict[monster_def.id] = monster_def
+                return
+
         with open(path_to_json_file) as input_json_file:
             temp = json.load(input_json_file)
 
         for entry in temp:
             self._load_monster(temp[entry])
 
+        if self.snapshot:
+            save_snapshot(path_to_json_file, SNAPSHOT_SCHEMA, self.all_monsters)
+
     def _load_monster(self, monster_json: Dict) -> None:
         """Convert the `monster_json` into a :class:`MonsterProperties` and store it.
 
         :param monster_json: A dict from an open and loaded JSON file.
         :raises ValueError: Cannot populate monster.
         """
-        # Load the monster using the MonsterProperties class
-        try:
-            monster_def = MonsterProperties.from_json(monster_json)
-        except TypeError as e:
-            raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting") from e
+        monster_def = self._build_monster(monster_json)
 
         # Add monsters to list
         self.all_monsters.append(monster_def)
         self.all_monsters_dict[monster_def.id] = monster_def
+
+    @staticmethod
+    def _build_monster(monster_json: Dict) -> MonsterProperties:
+        """Convert the `monster_json` into a :class:`MonsterProperties`.
+
+        :param monster_json: A dict from an open and loaded JSON file.
+        :return: The populated MonsterProperties object.
+        :raises ValueError: Cannot populate monster.
+        """
+        # Load the monster using the MonsterProperties class
+        try:
+            return MonsterProperties.from_json(monster_json)
+        except TypeError as e:
+            raise ValueError("Error: Invalid JSON structure found, check supplied input. Exiting") from e
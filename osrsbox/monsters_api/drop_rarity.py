@@ -0,0 +1,215 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A safe evaluator for monster drop rarity expressions, as written on the OSRS
+Wiki (such as `1/128`, or `1/(40*#var:herbbase) round 1` from an `#expr:`
+template). Rarities are evaluated as exact fractions, without using Python eval.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import re
+import math
+import functools
+from fractions import Fraction
+from typing import List, NamedTuple, Optional, Union
+
+# Tokens of a rarity expression: numbers, #var: variables, operators and brackets
+TOKEN_PATTERN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|#var:(\w+)|(round|div)|([-+*/()]))")
+
+# The types of a rarity expression base value (used for #var: variables)
+BaseValue = Union[str, int, float, Fraction, None]
+
+# The allowed number of decimal places of a `round` operator
+MAX_ROUND_DIGITS = 15
+
+# The maximum number of memoized rarity expressions, the least recently used are discarded
+RARITY_CACHE_SIZE = 4096
+
+
+class DropRarity(NamedTuple):
+    """An evaluated drop rarity.
+
+    :param fraction: The exact drop rarity.
+    :param value: The drop rarity as a float, as stored in the monster database.
+    """
+    fraction: Fraction
+    value: float
+
+
+def tokenize(expression: str) -> List[str]:
+    """Split a rarity expression into tokens.
+
+    :param expression: The rarity expression.
+    :return: A list of tokens, variables are returned as `#var`.
+    :raises ValueError: The expression contains an unsupported character.
+    """
+    tokens = list()
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if not match:
+            raise ValueError(f"Error: Unsupported rarity expression: {expression}. Exiting.")
+        number, variable, keyword, operator = match.groups()
+        if number is not None:
+            tokens.append(number)
+        elif variable is not None:
+            tokens.append("#var")
+        else:
+            tokens.append(keyword or operator)
+        position = match.end()
+    return tokens
+
+
+def round_half_away(value: Fraction, digits: Fraction) -> Fraction:
+    """Round a fraction to a number of decimal places, rounding halves away from zero (as the wiki does).
+
+    :param value: The value to round.
+    :param digits: The number of decimal places, a whole number from 0 to MAX_ROUND_DIGITS.
+    :return: The rounded value.
+    :raises ValueError: The number of decimal places is not supported.
+    """
+    if digits.denominator != 1 or not 0 <= digits <= MAX_ROUND_DIGITS:
+        raise ValueError(f"Error: Unsupported number of decimal places in rarity expression: {digits}. Exiting.")
+    scale = Fraction(10) ** int(digits)
+    rounded = math.floor(abs(value) * scale + Fraction(1, 2)) / scale
+    return rounded if value >= 0 else -rounded
+
+
+class ExpressionParser:
+    """This class evaluates a list of rarity expression tokens, using recursive descent.
+
+    The operators (lowest to highest precedence) are `round`, `+` and `-`,
+    `*`, `/` and `div`, then unary `+` and `-`. Brackets can be used to
+    group an expression.
+
+    :param tokens: The expression tokens.
+    :param base: The value of any `#var:` variable in the expression.
+    """
+    def __init__(self, tokens: List[str], base: Optional[Fraction]):
+        self.tokens = tokens
+        self.base = base
+        self.position = 0
+
+    def parse(self) -> Fraction:
+        """Evaluate the expression tokens.
+
+        :return: The expression value.
+        :raises ValueError: The expression is not valid.
+        """
+        value = self.parse_round()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Error: Unexpected token in rarity expression: {self.tokens[self.position]}. Exiting.")
+        return value
+
+    def peek(self) -> Optional[str]:
+        """Return the next token, without consuming it, or None at the end of the expression."""
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self) -> str:
+        """Consume and return the next token.
+
+        :raises ValueError: The expression ended early.
+        """
+        token = self.peek()
+        if token is None:
+            raise ValueError("Error: Incomplete rarity expression. Exiting.")
+        self.position += 1
+        return token
+
+    def parse_round(self) -> Fraction:
+        """Evaluate a `round` expression, the lowest precedence operator."""
+        value = self.parse_sum()
+        while self.peek() == "round":
+            self.take()
+            value = round_half_away(value, self.parse_sum())
+        return value
+
+    def parse_sum(self) -> Fraction:
+        """Evaluate an addition or subtraction."""
+        value = self.parse_product()
+        while self.peek() in ("+", "-"):
+            if self.take() == "+":
+                value += self.parse_product()
+            else:
+                value -= self.parse_product()
+        return value
+
+    def parse_product(self) -> Fraction:
+        """Evaluate a multiplication or division."""
+        value = self.parse_unary()
+        while self.peek() in ("*", "/", "div"):
+            if self.take() == "*":
+                value *= self.parse_unary()
+                continue
+            divisor = self.parse_unary()
+            if divisor == 0:
+                raise ValueError("Error: Division by zero in rarity expression. Exiting.")
+            value /= divisor
+        return value
+
+    def parse_unary(self) -> Fraction:
+        """Evaluate a unary plus or minus."""
+        if self.peek() in ("+", "-"):
+            if self.take() == "-":
+                return -self.parse_unary()
+            return self.parse_unary()
+        return self.parse_value()
+
+    def parse_value(self) -> Fraction:
+        """Evaluate a number, #var: variable or bracketed expression."""
+        token = self.take()
+        if token == "(":
+            value = self.parse_round()
+            if self.take() != ")":
+                raise ValueError("Error: Unmatched bracket in rarity expression. Exiting.")
+            return value
+        if token == "#var":
+            if self.base is None:
+                raise ValueError("Error: No base value for #var: in rarity expression. Exiting.")
+            return self.base
+        if token[0].isdigit() or token[0] == ".":
+            return Fraction(token)
+        raise ValueError(f"Error: Unexpected token in rarity expression: {token}. Exiting.")
+
+
+@functools.lru_cache(maxsize=RARITY_CACHE_SIZE)
+def evaluate_rarity(expression: str, base: BaseValue = None) -> DropRarity:
+    """Evaluate a drop rarity expression, such as `1/(40*#var:herbbase) round 1`.
+
+    Any `#expr:` prefix is ignored, and every `#var:` variable is replaced by
+    the base value. Results are memoized on the expression and base value
+    (up to RARITY_CACHE_SIZE results), as the same rarities are used by many
+    monsters.
+
+    :param expression: The rarity expression.
+    :param base: The value of any `#var:` variable, a number or another rarity expression.
+    :return: The evaluated drop rarity.
+    :raises ValueError: The expression (or base value) is not a valid rarity expression.
+    """
+    if isinstance(base, str):
+        base = evaluate_rarity(base).fraction
+    elif base is not None:
+        base = Fraction(base)
+
+    tokens = tokenize(expression.replace("#expr:", ""))
+    fraction = ExpressionParser(tokens, base).parse()
+    return DropRarity(fraction, float(fraction))
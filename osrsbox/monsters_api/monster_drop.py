@@ -21,6 +21,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from dataclasses import dataclass, asdict
 from typing import Dict, Optional
 
+from osrsbox.monsters_api.drop_rarity import evaluate_rarity
+
 
 @dataclass
 class MonsterDrop:
@@ -28,16 +30,23 @@ class MonsterDrop:
 
     The MonsterDrop class is the object that retains all drop properties related
     to items dropped by a specific monster. This includes item properties (id,
-    name) and drop properties (quantity, rarity, and drop requirements).
+    name) and drop properties (quantity, rarity, and drop requirements). The
+    rarity is always numeric (a float out of 1.0), so it can be compared and
+    sorted without evaluating a rarity expression.
     """
     id: int = None
     name: str = None
     members: str = None
     quantity: str = None
     noted: bool = None
-    rarity: str = None
+    rarity: Optional[float] = None
     drop_requirements: Optional[str] = None
 
+    def __post_init__(self):
+        """Convert a rarity expression (such as `1/128`) to the numeric drop rarity."""
+        if isinstance(self.rarity, str):
+            self.rarity = evaluate_rarity(self.rarity).value
+
     def construct_json(self) -> Dict:
         """Construct dictionary/JSON of drop entry in a list for exporting or printing.
 
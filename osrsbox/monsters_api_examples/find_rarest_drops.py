@@ -34,7 +34,6 @@ if __name__ == "__main__":
 
     rarest_drop = defaultdict(list)
     rarest_drop_rate_float = 1.0
-    rarest_drop_rate_fraction = None
 
     # Loop through all monsters in the database and print the monster name for each monster
     for monster in all_db_monsters:
@@ -42,13 +41,13 @@ if __name__ == "__main__":
             for drop in monster.drops:
                 if not drop.rarity:
                     continue
-                drop_rate = eval(drop.rarity)
+                # The drop rarity is already numeric, there is no need to evaluate it
+                drop_rate = drop.rarity
                 rarest_drop[drop_rate].append(monster)
                 if drop_rate < rarest_drop_rate_float:
                     rarest_drop_rate_float = drop_rate
-                    rarest_drop_rate_fraction = drop.rarity
 
     print("%f" % rarest_drop_rate_float)
-    print(rarest_drop_rate_fraction)
+    print("1/%.1f" % (1 / rarest_drop_rate_float))
     for monster in rarest_drop[rarest_drop_rate_float]:
         print(monster.name)
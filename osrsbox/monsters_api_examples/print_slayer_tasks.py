@@ -41,12 +41,10 @@ if __name__ == "__main__":
     # Load all monsters
     all_db_monsters = monsters_api.load()
 
-    # Loop through all monsters in the database
-    monster_set = set()
-    for monster in all_db_monsters:
-        if monster.slayer_monster:
-            for slayer_master in monster.slayer_masters:
-                slayer_masters_assignments[slayer_master].add(monster.name)
+    # Query for every slayer monster in the database
+    for monster in all_db_monsters.query(slayer_monster=True):
+        for slayer_master in monster.slayer_masters:
+            slayer_masters_assignments[slayer_master].add(monster.name)
 
     for slayer_master, assignments in slayer_masters_assignments.items():
         print(slayer_master)
@@ -0,0 +1,225 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+N-gram inverted indexes for searching item and monster names. NgramIndex is
+used for case-insensitive substring search, TrigramSimilarityIndex is used for
+ranked fuzzy (typo-tolerant) search.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import re
+import heapq
+from array import array
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple
+
+WORD = re.compile(r"[a-z0-9]+")
+
+
+class NgramIndex:
+    """This class handles substring search of short texts using an n-gram inverted index.
+
+    Each document has an ID number and one or more texts (for example, the `name`
+    and `wiki_name` of an item). Every n-gram of the lower case texts maps to a
+    posting list of document IDs. A search only checks the documents in the
+    shortest posting list of the keyword n-grams, so the cost scales with the
+    number of matches instead of the number of documents. Documents must be added
+    in ascending ID order, and search results are returned in the same order.
+
+    :param n: The n-gram length.
+    """
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.texts: Dict[int, Tuple[str, ...]] = dict()
+        self.postings: Dict[str, array] = dict()
+
+    def __len__(self) -> int:
+        """Return the count of the total number of indexed documents.
+
+        :return: The total number of indexed documents.
+        """
+        return len(self.texts)
+
+    def ngrams(self, text: str) -> Set[str]:
+        """Split a lower case text into a set of n-grams.
+
+        :param text: The text to split.
+        :return: A set of n-grams.
+        """
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def add(self, doc_id: int, *texts: Optional[str]) -> None:
+        """Add a document to the index.
+
+        :param doc_id: The document ID number.
+        :param texts: The document texts, None values are ignored.
+        """
+        lower_texts = tuple(text.lower() for text in texts if text)
+        self.texts[doc_id] = lower_texts
+
+        doc_ngrams = set()
+        for text in lower_texts:
+            doc_ngrams.update(self.ngrams(text))
+        for ngram in doc_ngrams:
+            try:
+                self.postings[ngram].append(doc_id)
+            except KeyError:
+                self.postings[ngram] = array("i", [doc_id])
+
+    def search(self, keyword: str) -> List[int]:
+        """Find every document where the keyword is a substring of any document text.
+
+        :param keyword: The keyword to search for (case insensitive).
+        :return: A list of matching document IDs.
+        """
+        keyword = keyword.lower()
+
+        if len(keyword) < self.n:
+            # Keyword is too short to have an n-gram, check every document
+            candidates = self.texts
+        else:
+            keyword_postings = list()
+            for ngram in self.ngrams(keyword):
+                posting = self.postings.get(ngram)
+                if posting is None:
+                    # An n-gram is not in any document, so nothing can match
+                    return list()
+                keyword_postings.append(posting)
+            candidates = min(keyword_postings, key=len)
+
+        doc_results = list()
+        for doc_id in candidates:
+            if any(keyword in text for text in self.texts[doc_id]):
+                doc_results.append(doc_id)
+
+        return doc_results
+
+
+def word_trigrams(text: str) -> Set[str]:
+    """Split a text into a set of word trigrams, including word boundaries.
+
+    The text is lower cased and split into alphanumeric words. Each word is
+    padded with one leading and one trailing space before splitting, so that the
+    start and end of words are included. For example, the word `whip` is split
+    into: ` wh`, `whi`, `hip`, `ip `.
+
+    :param text: The text to split.
+    :return: A set of trigrams.
+    """
+    trigrams = set()
+    for word in WORD.findall(text.lower()):
+        padded = " " + word + " "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class TrigramSimilarityIndex:
+    """This class handles ranked fuzzy search of short texts using trigram similarity.
+
+    The similarity of two texts is the Jaccard similarity of their word trigram
+    sets: the number of shared trigrams, divided by the number of trigrams in
+    either text. Each unique text is stored once, and each trigram maps to a
+    posting list of the texts that include it, so a search only counts texts that
+    share at least one trigram with the query. Texts are then scored in order of
+    shared trigrams, and scoring stops when no remaining text can be in the top
+    results. Documents must be added in ascending ID order.
+    """
+    def __init__(self):
+        self.text_ids: Dict[str, int] = dict()
+        self.text_sizes: List[int] = list()
+        self.text_docs: List[int] = list()
+        self.postings: Dict[str, List[int]] = dict()
+
+    def __len__(self) -> int:
+        """Return the count of the total number of unique indexed texts.
+
+        :return: The total number of unique indexed texts.
+        """
+        return len(self.text_docs)
+
+    def add(self, doc_id: int, *texts: Optional[str]) -> None:
+        """Add a document to the index.
+
+        Texts shared by several documents (for example, an item and the noted
+        version of an item) are only stored for the first (lowest ID) document.
+
+        :param doc_id: The document ID number.
+        :param texts: The document texts, None values are ignored.
+        """
+        for text in texts:
+            if not text:
+                continue
+            text = text.lower()
+            if text in self.text_ids:
+                continue
+
+            trigrams = word_trigrams(text)
+            text_id = len(self.text_docs)
+            self.text_ids[text] = text_id
+            self.text_sizes.append(len(trigrams))
+            self.text_docs.append(doc_id)
+            for trigram in trigrams:
+                try:
+                    self.postings[trigram].append(text_id)
+                except KeyError:
+                    self.postings[trigram] = [text_id]
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """Find the documents with the most similar text to the query.
+
+        Each document is returned once, using the similarity of its most similar
+        text. Results with equal similarity are sorted by document ID.
+
+        :param query: The text to search for (case insensitive).
+        :param k: The maximum number of results, no results are returned when k is less than 1.
+        :return: A list of (document ID, similarity) tuples, most similar first.
+        """
+        if k < 1:
+            return list()
+
+        query_trigrams = word_trigrams(query)
+        query_size = len(query_trigrams)
+
+        # Count the shared trigrams for every text that shares at least one
+        shared_counts = Counter(chain.from_iterable(self.postings[trigram] for trigram in query_trigrams
+                                                    if trigram in self.postings))
+
+        doc_similarity: Dict[int, float] = dict()
+        # Min heap of the first similarity of each document, heap[0] is a lower
+        # bound of the k-th best similarity once k documents have been scored
+        top_similarities: List[float] = list()
+        for text_id, shared in shared_counts.most_common():
+            # A text can never be more similar than shared / query_size, so stop
+            # when the remaining texts cannot beat the current top results
+            if len(top_similarities) >= k and shared / query_size < top_similarities[0]:
+                break
+            similarity = shared / (query_size + self.text_sizes[text_id] - shared)
+            doc_id = self.text_docs[text_id]
+            if doc_id not in doc_similarity:
+                doc_similarity[doc_id] = similarity
+                if len(top_similarities) < k:
+                    heapq.heappush(top_similarities, similarity)
+                elif similarity > top_similarities[0]:
+                    heapq.heapreplace(top_similarities, similarity)
+            elif similarity > doc_similarity[doc_id]:
+                doc_similarity[doc_id] = similarity
+
+        doc_results = sorted(doc_similarity.items(), key=lambda x: (-x[1], x[0]))
+        return doc_results[:k]
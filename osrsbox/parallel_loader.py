@@ -0,0 +1,69 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Read and decode a directory of JSON files (for example, `items-json`) using a
+pool of worker processes.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# The number of chunks given to each worker, more chunks balance the load better
+CHUNKS_PER_WORKER = 4
+
+
+def read_json_file(path_to_json_file: Path) -> Dict:
+    """Read and decode a single JSON file.
+
+    :param path_to_json_file: The path to the JSON file.
+    :return: A dict of the decoded JSON.
+    """
+    with open(path_to_json_file) as input_json_file:
+        return json.load(input_json_file)
+
+
+def load_json_files(json_files: List[Path], workers: int = 1) -> List[Dict]:
+    """Read and decode a list of JSON files, in parallel when more than one worker is used.
+
+    The files are sorted by path before loading, and the decoded JSON is returned in
+    the same sorted order for any number of workers. Every decoded dict is sent back
+    from a worker to this process, which can cost as much as the decoding, so check
+    `scripts/benchmarks/benchmark_directory_load.py` before using more than one worker.
+
+    :param json_files: A list of paths to JSON files.
+    :param workers: The number of worker processes, 1 loads the files in this process.
+    :return: A list of dicts of the decoded JSON, sorted by file path.
+    :raises ValueError: Invalid number of workers.
+    """
+    if workers < 1:
+        raise ValueError("Error: The number of workers must be at least 1. Exiting.")
+
+    json_files = sorted(json_files)
+
+    if workers == 1 or len(json_files) < 2:
+        return [read_json_file(json_file) for json_file in json_files]
+
+    # Send the files in chunks, so each worker is not waiting on one file at a time
+    chunksize = max(1, len(json_files) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map returns results in the same order as the input files
+        return list(executor.map(read_json_file, json_files, chunksize=chunksize))
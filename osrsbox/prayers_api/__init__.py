@@ -21,9 +21,10 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from osrsbox.prayers_api import all_prayers
 
 
-def load() -> all_prayers.AllPrayers:
+def load(snapshot: bool = False) -> all_prayers.AllPrayers:
     """Load the prayers database.
 
+    :param snapshot: Whether to use (and save) a binary snapshot of the prayer database, default is False.
     :return all_prayers: An AllPrayers object containing the entire prayer database.
     """
-    return all_prayers.AllPrayers()
+    return all_prayers.AllPrayers(snapshot=snapshot)
@@ -22,6 +22,7 @@ import json
 from pathlib import Path
 from typing import Dict, List, Union, Generator
 
+from osrsbox.snapshot import load_snapshot, save_snapshot
 from osrsbox.prayers_api.prayer_properties import PrayerProperties
 
 PATH_TO_PRAYERS_COMPLETE_JSON = Path(__file__).absolute().parent / ".." / ".." / "docs" / "prayers-complete.json"
@@ -30,15 +31,25 @@ if not PATH_TO_PRAYERS_COMPLETE_JSON.is_file():
     if not PATH_TO_PRAYERS_COMPLETE_JSON.is_file():
         raise ValueError("Error: Default prayer database file not found. Exiting")
 
+# The dataclasses stored in a prayers database snapshot
+SNAPSHOT_SCHEMA = (PrayerProperties,)
+
 
 class AllPrayers:
     """This class handles loading of the osrsbox-db prayers database.
 
+    When snapshots are enabled and a single JSON file is loaded, a binary snapshot
+    of the loaded prayers is saved next to the JSON file, and used on the next load
+    if the JSON file is unchanged. Snapshots are pickle files, so only enable them
+    if other users cannot write to the JSON file directory (see snapshot.py).
+
     :param input_data_file_or_directory: The osrsbox-db prayers folder of JSON files, or single JSON file.
+    :param snapshot: Whether to use (and save) a binary snapshot of a single JSON file, default is False.
     """
-    def __init__(self, input_data_file_or_directory: Path = PATH_TO_PRAYERS_COMPLETE_JSON):
+    def __init__(self, input_data_file_or_directory: Path = PATH_TO_PRAYERS_COMPLETE_JSON, snapshot: bool = False):
         self.all_prayers: List[PrayerProperties] = list()
         self.all_prayers_dict: Dict[int, PrayerProperties] = dict()
+        self.snapshot = snapshot
         self.load_all_prayers(input_data_file_or_directory)
 
     def __iter__(self) -> Generator[PrayerProperties, None, None]:
@@ -121,12 +132,24 @@ class AllPrayers:
 
         :param path_to_json_file: The path to the `prayers-complete.json` file.
         """
+        # Use the binary snapshot of the JSON file, if available
+        if self.snapshot:
+            snapshot_prayers = load_snapshot(path_to_json_file, SNAPSHOT_SCHEMA)
+            if snapshot_prayers is not None:
+                for prayer_def in snapshot_prayers:
+                    self.all_prayers.append(prayer_def)
+                    self.all_prayers_dict[prayer_def.id] = prayer_def
+                return
+
         with open(path_to_json_file) as input_json_file:
             temp = json.load(input_json_file)
 
         for entry in temp:
             self._load_prayer(temp[entry])
 
+        if self.snapshot:
+            save_snapshot(path_to_json_file, SNAPSHOT_SCHEMA, self.all_prayers)
+
     def _load_prayer(self, prayer_json: Dict) -> None:
         """Convert the `prayer_json` into a :class:`PrayerProperties` and store it.
 
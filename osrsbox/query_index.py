@@ -0,0 +1,190 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Secondary indexes for querying the properties of items and monsters, without
+scanning the entire database for every query.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+# Query operators that use a hash index, and operators that use a sorted index
+HASH_OPERATORS = ("eq", "in", "contains")
+SORTED_OPERATORS = ("lt", "le", "gt", "ge", "range")
+
+
+def get_field(entry: Any, field: str) -> Any:
+    """Get the value of a (possibly nested) field, such as `equipment__slot`.
+
+    :param entry: The object to get the field value from.
+    :param field: The field name, nested field names are separated by `__`.
+    :return: The field value, or None if a parent field is None.
+    :raises ValueError: Unknown field name.
+    """
+    value = entry
+    for name in field.split("__"):
+        if value is None:
+            return None
+        try:
+            value = getattr(value, name)
+        except AttributeError as e:
+            raise ValueError(f"Error: Unknown query field: {field}. Exiting.") from e
+    return value
+
+
+def parse_predicate(predicate: str) -> Tuple[str, str]:
+    """Split a query keyword into a field name and operator, such as `combat_level__ge`.
+
+    :param predicate: The query keyword, the operator is `eq` if not supplied.
+    :return: A tuple of (field name, operator).
+    """
+    field, _, operator = predicate.rpartition("__")
+    if field and operator in HASH_OPERATORS + SORTED_OPERATORS:
+        return field, operator
+    return predicate, "eq"
+
+
+class QueryIndex:
+    """This class handles queries of object properties using lazily built secondary indexes.
+
+    A hash index (value to a list of IDs) is built for each field queried with
+    `eq`, `in` or `contains`. For list fields (such as `slayer_masters`) each list
+    element is indexed. A sorted index (sorted values and matching IDs) is built
+    for each field queried with `lt`, `le`, `gt`, `ge` or `range`. Each index is
+    built on the first query of the field, with a single pass over the entries.
+
+    A query is a set of keyword predicates, for example:
+    `query(members=False, equipment__slot__in=("weapon", "2h"), equipment__attack_slash__ge=50)`.
+    The IDs matching each predicate are found using the indexes, then intersected
+    (smallest first) to find the IDs matching every predicate.
+
+    :param entries: A function returning an iterable of the objects to index, each with an `id` property.
+    """
+    def __init__(self, entries: Callable[[], Iterable[Any]]):
+        self.entries = entries
+        self.hash_indexes: Dict[str, Dict[Any, array]] = dict()
+        self.sorted_indexes: Dict[str, Tuple[List[Any], array]] = dict()
+
+    def query(self, **predicates: Any) -> List[int]:
+        """Find the IDs of every object matching all predicates.
+
+        :param predicates: Keyword predicates of `field__operator=value`.
+        :return: A sorted list of the matching IDs.
+        :raises ValueError: Unknown field name, or invalid value for the operator.
+        """
+        if not predicates:
+            return sorted(entry.id for entry in self.entries())
+
+        matches = [self._match(*parse_predicate(predicate), value) for predicate, value in predicates.items()]
+        matches.sort(key=len)
+
+        results = set(matches[0])
+        for match in matches[1:]:
+            if not results:
+                break
+            results.intersection_update(match)
+
+        return sorted(results)
+
+    def _match(self, field: str, operator: str, value: Any) -> Set[int]:
+        """Find the IDs of every object matching a single predicate.
+
+        :param field: The field name.
+        :param operator: The query operator.
+        :param value: The value to compare against.
+        :return: A set of the matching IDs.
+        :raises ValueError: Invalid value for the operator.
+        """
+        if operator in HASH_OPERATORS:
+            hash_index = self._get_hash_index(field)
+            try:
+                if operator == "in":
+                    return {entry_id for v in value for entry_id in hash_index.get(v, ())}
+                return set(hash_index.get(value, ()))
+            except TypeError as e:
+                raise ValueError(f"Error: Invalid query value for: {field}__{operator}. Exiting.") from e
+
+        values, entry_ids = self._get_sorted_index(field)
+        try:
+            if operator == "lt":
+                start, end = 0, bisect_left(values, value)
+            elif operator == "le":
+                start, end = 0, bisect_right(values, value)
+            elif operator == "gt":
+                start, end = bisect_right(values, value), len(values)
+            elif operator == "ge":
+                start, end = bisect_left(values, value), len(values)
+            else:
+                low, high = value
+                start, end = bisect_left(values, low), bisect_right(values, high)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Error: Invalid query value for: {field}__{operator}. Exiting.") from e
+        return set(entry_ids[start:end])
+
+    def _get_hash_index(self, field: str) -> Dict[Any, array]:
+        """Get the hash index for a field, building it on first use.
+
+        :param field: The field name.
+        :return: A dictionary mapping each field value to an array of IDs.
+        :raises ValueError: Unknown field name, or field values cannot be indexed.
+        """
+        try:
+            return self.hash_indexes[field]
+        except KeyError:
+            pass
+
+        hash_index: Dict[Any, array] = dict()
+        try:
+            for entry in self.entries():
+                value = get_field(entry, field)
+                # Index each element of a list field, so that `contains` can be used
+                for v in (value if isinstance(value, list) else (value,)):
+                    try:
+                        hash_index[v].append(entry.id)
+                    except KeyError:
+                        hash_index[v] = array("i", [entry.id])
+        except TypeError as e:
+            raise ValueError(f"Error: Query field cannot be indexed: {field}. Exiting.") from e
+
+        self.hash_indexes[field] = hash_index
+        return hash_index
+
+    def _get_sorted_index(self, field: str) -> Tuple[List[Any], array]:
+        """Get the sorted index for a field, building it on first use. None values are not indexed.
+
+        :param field: The field name.
+        :return: A tuple of (sorted field values, array of IDs in the same order).
+        :raises ValueError: Unknown field name, or field values cannot be sorted.
+        """
+        try:
+            return self.sorted_indexes[field]
+        except KeyError:
+            pass
+
+        pairs = [(get_field(entry, field), entry.id) for entry in self.entries()]
+        try:
+            pairs = sorted((value, entry_id) for value, entry_id in pairs if value is not None)
+        except TypeError as e:
+            raise ValueError(f"Error: Query field cannot be sorted: {field}. Exiting.") from e
+
+        sorted_index = ([value for value, _ in pairs], array("i", [entry_id for _, entry_id in pairs]))
+        self.sorted_indexes[field] = sorted_index
+        return sorted_index
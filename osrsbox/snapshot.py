@@ -0,0 +1,202 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Binary (pickle) snapshots of loaded osrsbox-db databases. A snapshot is saved
+next to the JSON file it was loaded from (for example, `items-complete.json`
+is saved to `items-complete.json.snapshot`), and is only used when the JSON
+file size, modification time and a hash of its first and last blocks match the
+snapshot header. These checks detect a changed JSON file (a stale snapshot),
+without hashing the whole file on every load.
+
+Snapshots are opt-in (use `snapshot=True` when loading a database). A pickle
+can run code when it is loaded, so anyone who can write the snapshot file could
+run code in the process that loads it, and the header checks do not prevent
+this (the header is in the same file). Only enable snapshots when the database
+directory is not writable by other users. To limit the risk, the snapshot
+header is JSON (not a pickle), and only the database dataclasses can be
+unpickled.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import gc
+import os
+import json
+import pickle
+import hashlib
+import dataclasses
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Bump this number if the layout of the snapshot file changes
+SNAPSHOT_VERSION = 3
+
+# The maximum size of the JSON snapshot header line
+MAX_HEADER_SIZE = 1 << 16
+
+# The size of the first and last blocks of a JSON file that are hashed
+SAMPLE_BLOCK_SIZE = 1 << 16
+
+
+def snapshot_path(path_to_json_file: Path) -> Path:
+    """Determine the snapshot file path for a JSON file.
+
+    :param path_to_json_file: The path to the JSON file.
+    :return: The path to the snapshot file.
+    """
+    return path_to_json_file.with_name(path_to_json_file.name + ".snapshot")
+
+
+def file_hash(path_to_file: Path) -> str:
+    """Calculate the SHA256 hash of a file.
+
+    :param path_to_file: The path to the file.
+    :return: The hex digest of the file contents.
+    """
+    sha256 = hashlib.sha256()
+    with open(path_to_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def sample_hash(path_to_file: Path, size: int) -> str:
+    """Calculate the SHA256 hash of the first and last blocks of a file.
+
+    :param path_to_file: The path to the file.
+    :param size: The size of the file.
+    :return: The hex digest of the first and last SAMPLE_BLOCK_SIZE bytes of the file.
+    """
+    sha256 = hashlib.sha256()
+    with open(path_to_file, "rb") as f:
+        sha256.update(f.read(SAMPLE_BLOCK_SIZE))
+        if size > SAMPLE_BLOCK_SIZE:
+            f.seek(max(SAMPLE_BLOCK_SIZE, size - SAMPLE_BLOCK_SIZE))
+            sha256.update(f.read(SAMPLE_BLOCK_SIZE))
+    return sha256.hexdigest()
+
+
+def file_header(path_to_json_file: Path) -> Dict:
+    """Determine the snapshot header entries that identify the contents of a JSON file.
+
+    :param path_to_json_file: The path to the JSON file.
+    :return: A dictionary of the file size, modification time and sample hash.
+    """
+    stat = path_to_json_file.stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sample_sha256": sample_hash(path_to_json_file, stat.st_size)
+    }
+
+
+def schema_fields(schema: Tuple) -> Dict:
+    """Determine the field names of the dataclasses stored in a snapshot.
+
+    :param schema: A tuple of dataclass types stored in the snapshot.
+    :return: A dictionary of dataclass name to a list of field names.
+    """
+    return {cls.__qualname__: [field.name for field in dataclasses.fields(cls)] for cls in schema}
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """This class unpickles snapshot data, only allowing the dataclasses of the snapshot schema.
+
+    Built-in containers and values (lists, dictionaries, strings, numbers and
+    None) do not need a class lookup. Any other class or function in the pickled
+    data raises an UnpicklingError, instead of being imported and called.
+
+    :param file: The binary file to unpickle from.
+    :param schema: A tuple of dataclass types stored in the snapshot.
+    """
+    def __init__(self, file, schema: Tuple):
+        super().__init__(file)
+        self.allowed_classes = {(cls.__module__, cls.__qualname__): cls for cls in schema}
+
+    def find_class(self, module: str, name: str) -> Any:
+        try:
+            return self.allowed_classes[(module, name)]
+        except KeyError:
+            raise pickle.UnpicklingError(f"Error: {module}.{name} is not allowed in a snapshot.")
+
+
+def load_snapshot(path_to_json_file: Path, schema: Tuple) -> Optional[Any]:
+    """Load the snapshot for a JSON file, if it exists and is still valid.
+
+    The JSON header is checked against the JSON file before any data is
+    unpickled, and the data must be a list of the first dataclass of the schema
+    (such as ItemProperties). The garbage collector is paused while unpickling,
+    as it would otherwise repeatedly scan the many new objects.
+
+    :param path_to_json_file: The path to the JSON file the snapshot was made from.
+    :param schema: A tuple of dataclass types stored in the snapshot, the entry type first.
+    :return: The snapshot data, or None if there is no valid snapshot.
+    """
+    gc_enabled = gc.isenabled()
+    try:
+        with open(snapshot_path(path_to_json_file), "rb") as f:
+            header = json.loads(f.readline(MAX_HEADER_SIZE))
+            if (header["version"] != SNAPSHOT_VERSION or
+                    header["schema"] != schema_fields(schema) or
+                    header["file"] != file_header(path_to_json_file)):
+                return None
+            gc.disable()
+            data = SnapshotUnpickler(f, schema).load()
+        if not isinstance(data, list) or not all(type(entry) is schema[0] for entry in data):
+            return None
+        return data
+    except (OSError, EOFError, ValueError, KeyError, TypeError, AttributeError, pickle.UnpicklingError):
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def save_snapshot(path_to_json_file: Path, schema: Tuple, data: Any) -> bool:
+    """Save a snapshot for a JSON file.
+
+    The snapshot is written to a temporary file, then moved into place, so that
+    other processes never read a partially written snapshot.
+
+    :param path_to_json_file: The path to the JSON file the data was loaded from.
+    :param schema: A tuple of dataclass types stored in the snapshot, the entry type first.
+    :param data: The data to save, a list of the entry type.
+    :return: A boolean to indicate if the snapshot was saved.
+    """
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "schema": schema_fields(schema),
+        "file": file_header(path_to_json_file)
+    }
+
+    out_file_path = snapshot_path(path_to_json_file)
+    temp_file_path = out_file_path.with_name(f"{out_file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file_path, out_file_path)
+    except OSError:
+        # Read-only install location, skip saving the snapshot
+        try:
+            temp_file_path.unlink()
+        except OSError:
+            pass
+        return False
+
+    return True
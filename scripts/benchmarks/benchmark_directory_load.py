@@ -0,0 +1,74 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Benchmark loading the `items-json` and `monsters-json` directories with
+different numbers of worker processes.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import timeit
+import argparse
+from pathlib import Path
+from typing import List
+
+import config
+from osrsbox.items_api.all_items import AllItems
+from osrsbox.monsters_api.all_monsters import AllMonsters
+
+
+def main(repeat: int, workers: List[int]):
+    databases = {
+        "items": (AllItems, Path(config.DOCS_PATH / "items-json")),
+        "monsters": (AllMonsters, Path(config.DOCS_PATH / "monsters-json")),
+    }
+
+    print(f"CPU count: {os.cpu_count()}")
+    print(f"{'database':<10} {'workers':>8} {'time (s)':>10} {'speedup':>9}")
+    for name, (loader, path) in databases.items():
+        # The serial load is the baseline, and the expected result for every worker count
+        expected = [entry.construct_json() for entry in loader(path, workers=1)]
+        serial_time = None
+        for worker_count in workers:
+            loaded = [entry.construct_json() for entry in loader(path, workers=worker_count)]
+            if loaded != expected:
+                raise ValueError(f"Error: {name} loaded with {worker_count} workers does not match. Exiting.")
+
+            load_time = min(timeit.repeat(lambda: loader(path, workers=worker_count), number=1, repeat=repeat))
+            if serial_time is None:
+                serial_time = load_time
+            print(f"{name:<10} {worker_count:>8} {load_time:>10.4f} {serial_time / load_time:>8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel directory load times.")
+    parser.add_argument('--repeat',
+                        default=3,
+                        type=int,
+                        required=False,
+                        help='The number of times to repeat each load.')
+    parser.add_argument('--workers',
+                        default=[1, 2, 4, 8],
+                        type=int,
+                        nargs="+",
+                        required=False,
+                        help='The worker counts to benchmark, the first is used as the baseline.')
+    args = parser.parse_args()
+
+    main(args.repeat, args.workers)
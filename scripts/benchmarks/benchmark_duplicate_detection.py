@@ -0,0 +1,113 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Benchmark duplicate item detection, as used by BuildItem.check_duplicate_item,
+with a scan of every known item compared to the DuplicateIndex. The items are
+checked in ID order for increasing database sizes, to show how the total time
+grows with the number of items.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import time
+import argparse
+from pathlib import Path
+from typing import List
+
+import config
+from builders.duplicate_index import DuplicateIndex
+from osrsbox.items_api.all_items import AllItems
+from osrsbox.items_api.item_properties import ItemProperties
+
+# The same properties as builders.items.build_item.CORRELATION_PROPERTIES
+CORRELATION_PROPERTIES = ("wiki_name", "noted", "placeholder", "equipable", "equipable_by_player", "equipable_weapon")
+
+
+def scan_duplicates(items: List[ItemProperties]) -> List[bool]:
+    """Check each item for duplicates by scanning every known item (the previous implementation).
+
+    :param items: The items to check, in build order.
+    :return: A list of duplicate results, one for each item.
+    """
+    known_items = list()
+    results = list()
+    for item in items:
+        duplicate = False
+        correlation_properties = {cprop: False for cprop in CORRELATION_PROPERTIES}
+        for known_item in known_items:
+            if item.name != known_item.name:
+                continue
+            for cprop in correlation_properties:
+                if getattr(item, cprop) == getattr(known_item, cprop):
+                    correlation_properties[cprop] = True
+            if all(value is True for value in correlation_properties.values()):
+                duplicate = True
+        known_items.append(item)
+        results.append(duplicate)
+    return results
+
+
+def index_duplicates(items: List[ItemProperties]) -> List[bool]:
+    """Check each item for duplicates using a DuplicateIndex of the known items.
+
+    :param items: The items to check, in build order.
+    :return: A list of duplicate results, one for each item.
+    """
+    known_items = DuplicateIndex(CORRELATION_PROPERTIES)
+    results = list()
+    for item in items:
+        results.append(known_items.is_duplicate(item))
+        known_items.append(item)
+    return results
+
+
+def main(sizes: List[int]):
+    all_db_items = AllItems(Path(config.DOCS_PATH / "items-complete.json"))
+    items = all_db_items.all_items
+
+    # The database duplicate property was generated by the previous implementation
+    if index_duplicates(items) != [item.duplicate for item in items]:
+        raise ValueError("Error: DuplicateIndex results do not match the items database. Exiting.")
+
+    print(f"{'items':>7} {'scan (s)':>10} {'index (s)':>10} {'scan us/item':>13} {'index us/item':>14} {'same':>5}")
+    for size in sizes:
+        subset = items[:size]
+
+        start = time.perf_counter()
+        scan_results = scan_duplicates(subset)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index_results = index_duplicates(subset)
+        index_time = time.perf_counter() - start
+
+        print(f"{len(subset):>7} {scan_time:>10.3f} {index_time:>10.4f} {scan_time / len(subset) * 1e6:>13.1f} "
+              f"{index_time / len(subset) * 1e6:>14.2f} {str(scan_results == index_results):>5}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark duplicate item detection.")
+    parser.add_argument('--sizes',
+                        default=[2500, 5000, 10000, 20000],
+                        type=int,
+                        nargs="+",
+                        required=False,
+                        help='The number of items to check for each run.')
+    args = parser.parse_args()
+
+    main(args.sizes)
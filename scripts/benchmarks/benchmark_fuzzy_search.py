@@ -0,0 +1,108 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Benchmark ranked fuzzy search of item names using the trigram similarity
+index, compared to a linear scan that scores every item name.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import timeit
+import argparse
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import config
+from osrsbox.items_api.all_items import AllItems
+from osrsbox.ngram_index import word_trigrams
+
+QUERIES = [
+    "dragn scimmy",
+    "abysal wip",
+    "bandos chestplat",
+    "rune platbody",
+    "armadyl crosbow",
+    "saradomin godsword",
+    "amulet of glory",
+    "dragon",
+]
+
+
+def linear_search(all_db_items: AllItems, query: str, k: int) -> List[Tuple[int, float]]:
+    """Score every item name and wiki_name against the query, without an index.
+
+    As with the index, a name shared by several items (for example, noted items)
+    only counts for the first (lowest ID) item.
+
+    :param all_db_items: The loaded items database.
+    :param query: The text to search for.
+    :param k: The maximum number of results.
+    :return: A list of (item ID, similarity) tuples, most similar first.
+    """
+    query_trigrams = word_trigrams(query)
+    doc_similarity: Dict[int, float] = dict()
+    seen_names = set()
+    for item in all_db_items:
+        for name in (item.name, item.wiki_name):
+            if not name or name.lower() in seen_names:
+                continue
+            seen_names.add(name.lower())
+            name_trigrams = word_trigrams(name)
+            shared = len(query_trigrams & name_trigrams)
+            if not shared:
+                continue
+            similarity = shared / len(query_trigrams | name_trigrams)
+            if similarity > doc_similarity.get(item.id, -1.0):
+                doc_similarity[item.id] = similarity
+    return sorted(doc_similarity.items(), key=lambda x: (-x[1], x[0]))[:k]
+
+
+def main(repeat: int, k: int):
+    all_db_items = AllItems(Path(config.DOCS_PATH / "items-complete.json"))
+
+    build_time = timeit.timeit(lambda: all_db_items.fuzzy_search_item_names(QUERIES[0], k), number=1)
+    print(f"Index build and first query: {build_time * 1000:.2f} ms")
+
+    print(f"{'query':<20} {'linear (ms)':>12} {'index (ms)':>11} {'speedup':>9} {'same':>5}  top result")
+    for query in QUERIES:
+        index_results = [(item.id, item.name) for item in all_db_items.fuzzy_search_item_names(query, k)]
+        linear_results = [(item_id, all_db_items[item_id].name) for item_id, _ in linear_search(all_db_items, query, k)]
+
+        linear_time = min(timeit.repeat(lambda: linear_search(all_db_items, query, k), number=1, repeat=repeat))
+        index_time = min(timeit.repeat(lambda: all_db_items.fuzzy_search_item_names(query, k),
+                                       number=10, repeat=repeat)) / 10
+
+        print(f"{query:<20} {linear_time * 1000:>12.3f} {index_time * 1000:>11.3f} "
+              f"{linear_time / index_time:>8.1f}x {str(index_results == linear_results):>5}  {index_results[0][1]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy item name search.")
+    parser.add_argument('--repeat',
+                        default=5,
+                        type=int,
+                        required=False,
+                        help='The number of times to repeat each search.')
+    parser.add_argument('--k',
+                        default=10,
+                        type=int,
+                        required=False,
+                        help='The number of results to return for each search.')
+    args = parser.parse_args()
+
+    main(args.repeat, args.k)
@@ -0,0 +1,81 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Benchmark the load time of the items, monsters and prayers databases when
+parsing the JSON files, compared to loading the binary snapshot files. Each
+load is timed with the garbage collector enabled (as in a normal process), and
+the previously loaded database is freed outside of the timed load.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import time
+import argparse
+from pathlib import Path
+from typing import Callable
+
+import config
+from osrsbox.items_api.all_items import AllItems
+from osrsbox.monsters_api.all_monsters import AllMonsters
+from osrsbox.prayers_api.all_prayers import AllPrayers
+
+
+def time_load(loader: Callable, repeat: int) -> float:
+    """Time a database load.
+
+    :param loader: A function that loads the database.
+    :param repeat: The number of times to repeat the load.
+    :return: The fastest load time, in seconds.
+    """
+    load_times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        database = loader()
+        load_times.append(time.perf_counter() - start)
+        del database
+    return min(load_times)
+
+
+def main(repeat: int):
+    databases = {
+        "items": (AllItems, Path(config.DOCS_PATH / "items-complete.json")),
+        "monsters": (AllMonsters, Path(config.DOCS_PATH / "monsters-complete.json")),
+        "prayers": (AllPrayers, Path(config.DOCS_PATH / "prayers-complete.json")),
+    }
+
+    print(f"{'database':<10} {'json (s)':>10} {'snapshot (s)':>14} {'speedup':>9}")
+    for name, (loader, path) in databases.items():
+        # Make sure a valid snapshot exists before timing snapshot loads
+        loader(path, snapshot=True)
+
+        json_time = time_load(lambda: loader(path, snapshot=False), repeat)
+        snapshot_time = time_load(lambda: loader(path, snapshot=True), repeat)
+
+        print(f"{name:<10} {json_time:>10.4f} {snapshot_time:>14.4f} {json_time / snapshot_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark database load times.")
+    parser.add_argument('--repeat',
+                        default=5,
+                        type=int,
+                        required=False,
+                        help='The number of times to repeat each load.')
+    args = parser.parse_args()
+
+    main(args.repeat)
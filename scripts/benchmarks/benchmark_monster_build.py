@@ -0,0 +1,153 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Benchmark a full monster build (without exporting or validating), reporting
+the time spent in each BuildMonster stage, and the time spent populating the
+embedded drop tables from the already parsed monster templates.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import io
+import json
+import time
+import argparse
+import contextlib
+from pathlib import Path
+from collections import Counter
+
+import config
+from builders.monsters import build_monster, drop_tables
+from builders.duplicate_index import DuplicateIndex
+from osrsbox import items_api
+from scripts.wiki import page_text_store
+
+
+def time_drop_tables(builder: build_monster.BuildMonster, repeat: int) -> float:
+    """Time populating every embedded drop table of a monster, using the parsed monster templates.
+
+    :param builder: A BuildMonster instance, after parse_monster_drops.
+    :param repeat: The number of times to populate the drop tables.
+    :return: The time to populate the drop tables once, in seconds.
+    """
+    templates = builder.monster_templates
+    monster_wikitext_lower = builder.monster_wikitext[2].lower()
+
+    # The same drop tables (and template name checks) as BuildMonster.parse_monster_drops
+    drop_table_calls = [
+        ("talismandroptable2", drop_tables.talisman, (templates,)),
+        ("catacombsdroptable", drop_tables.catacombs, (builder.monster_dict["name"],
+                                                       builder.monster_dict["hitpoints"], templates)),
+        ("herbdroptable2", drop_tables.herb, (builder.monster_dict["members"], templates)),
+        ("usefulherbdroptable2", drop_tables.usefulherb, (templates,)),
+        ("fixedallotmentseeddroptable2", drop_tables.fixedallotmentseed, (templates,)),
+        ("dropsallotmenttable", drop_tables.fixedallotmentseed, (templates,)),
+        ("treeherbseeddroptable2", drop_tables.treeseed, (templates,)),
+        ("rareseeddroptable2", drop_tables.rareseed, (templates,)),
+        ("manyseeddroptable2", drop_tables.commonseed, (templates,)),
+        ("hopsdroptable2", drop_tables.hopsseed, (templates,))
+    ]
+    calls = [(function, args) for template_name, function, args in drop_table_calls
+             if template_name in monster_wikitext_lower]
+    if not calls:
+        return 0
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for function, args in calls:
+            function(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(count: int, repeat: int):
+    # Load the same inputs as builders/monsters/builder.py
+    all_db_items = items_api.load()
+    item_name_index = build_monster.build_item_name_index(all_db_items)
+    all_wikitext_raw = page_text_store.load_page_text(Path(config.DATA_WIKI_PATH / "page-text-monsters.json"))
+    with open(Path(config.DATA_WIKI_PATH / "processed-wikitext-monsters.json")) as f:
+        all_wikitext_processed = json.load(f)
+    with open(Path(config.DATA_MONSTERS_PATH / "monsters-cache-data.json")) as f:
+        all_monster_cache_data = json.load(f)
+
+    known_monsters = DuplicateIndex(build_monster.CORRELATION_PROPERTIES)
+    timings = Counter()
+    built_count = 0
+    drop_table_count = 0
+    for monster_id in list(all_monster_cache_data)[:count]:
+        builder = build_monster.BuildMonster(monster_id=monster_id,
+                                             all_monster_cache_data=all_monster_cache_data,
+                                             all_wikitext_processed=all_wikitext_processed,
+                                             all_wikitext_raw=all_wikitext_raw,
+                                             all_db_monsters=dict(),
+                                             all_db_items=all_db_items,
+                                             item_name_index=item_name_index,
+                                             known_monsters=known_monsters,
+                                             schema_data=None,
+                                             schema_validator=None,
+                                             export=False,
+                                             verbose=False)
+
+        # Ignore any builder output, only the timings are printed
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            status = builder.preprocessing()
+            timings["preprocessing"] += time.perf_counter() - start
+            if not status:
+                continue
+
+            start = time.perf_counter()
+            builder.populate_monster()
+            known_monsters.append(builder.check_duplicate_monster())
+            timings["populate_monster"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            builder.parse_monster_drops()
+            timings["parse_monster_drops"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            builder.generate_monster_object()
+            timings["generate_monster_object"] += time.perf_counter() - start
+
+            drop_table_time = time_drop_tables(builder, repeat)
+            if drop_table_time:
+                timings["drop tables (included above)"] += drop_table_time
+                drop_table_count += 1
+        built_count += 1
+
+    total = sum(value for stage, value in timings.items() if stage != "drop tables (included above)")
+    print(f"Built {built_count} monsters ({drop_table_count} with embedded drop tables) in {total:.1f} seconds")
+    print(f"{'stage':<30} {'total (s)':>10} {'per monster (ms)':>17}")
+    for stage, value in timings.items():
+        print(f"{stage:<30} {value:>10.2f} {value / max(built_count, 1) * 1e3:>17.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark a full monster build.")
+    parser.add_argument('--count',
+                        default=None,
+                        type=int,
+                        required=False,
+                        help='The number of monsters to build, defaults to every monster.')
+    parser.add_argument('--repeat',
+                        default=100,
+                        type=int,
+                        required=False,
+                        help='The number of times to populate the drop tables of each monster.')
+    args = parser.parse_args()
+
+    main(args.count, args.repeat)
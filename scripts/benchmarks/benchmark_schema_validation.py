@@ -0,0 +1,96 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Benchmark the per-record cost of validating the items and monsters databases
+against the JSON schemas, using a new Cerberus Validator for every record (as
+the builders did), a single reused Cerberus Validator, and the compiled
+SchemaValidator (single record and batch modes).
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+import timeit
+import argparse
+from pathlib import Path
+
+import config
+from builders.schema_validator import SchemaValidator
+
+
+def main(count: int, repeat: int):
+    databases = {
+        "items": (Path(config.DATA_SCHEMAS_PATH / "schema-items.json"), Path(config.DOCS_PATH / "items-complete.json")),
+        "monsters": (Path(config.DATA_SCHEMAS_PATH / "schema-monsters.json"),
+                     Path(config.DOCS_PATH / "monsters-complete.json")),
+    }
+
+    print(f"{'database':<10} {'records':>8} {'new cerberus (us)':>18} {'cerberus (us)':>14} "
+          f"{'compiled (us)':>14} {'batch (us)':>11} {'speedup':>8}")
+    for name, (schema_path, data_path) in databases.items():
+        with open(schema_path) as f:
+            schema = json.load(f)
+        with open(data_path) as f:
+            documents = list(json.load(f).values())[:count]
+
+        # Check that the compiled validator gives the same verdicts as Cerberus
+        validator = config.MyValidator(schema)
+        schema_validator = SchemaValidator(schema)
+        for document in documents:
+            if schema_validator.validate(document) != validator.validate(document):
+                raise ValueError(f"Error: Validation mismatch for: {document['id']}. Exiting.")
+        if schema_validator.check is None:
+            print(f"{name}: schema uses a rule that cannot be compiled, using Cerberus.")
+
+        def new_cerberus():
+            for document in documents:
+                config.MyValidator(schema).validate(document)
+
+        def cerberus():
+            for document in documents:
+                validator.validate(document)
+
+        def compiled():
+            for document in documents:
+                schema_validator.validate(document)
+
+        def batch():
+            schema_validator.validate_many(documents)
+
+        timings = [min(timeit.repeat(function, number=1, repeat=repeat)) / len(documents) * 1e6
+                   for function in (new_cerberus, cerberus, compiled, batch)]
+
+        print(f"{name:<10} {len(documents):>8} {timings[0]:>18.1f} {timings[1]:>14.1f} "
+              f"{timings[2]:>14.2f} {timings[3]:>11.2f} {timings[0] / timings[2]:>7.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark schema validation of the items and monsters databases.")
+    parser.add_argument('--count',
+                        default=2000,
+                        type=int,
+                        required=False,
+                        help='The number of records to validate from each database.')
+    parser.add_argument('--repeat',
+                        default=3,
+                        type=int,
+                        required=False,
+                        help='The number of times to repeat each validation.')
+    args = parser.parse_args()
+
+    main(args.count, args.repeat)
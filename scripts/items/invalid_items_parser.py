@@ -29,6 +29,7 @@ from pathlib import Path
 
 import config
 from builders.items import build_item
+from scripts.wiki import page_text_store
 
 # Configure logging
 log_file_path = Path(Path(__file__).stem+".log")
@@ -48,8 +49,7 @@ def main():
 
     # Load the item wikitext file
     wiki_text_file_path = Path(config.DATA_WIKI_PATH / "page-text-items.json")
-    with open(wiki_text_file_path) as f:
-        all_wikitext_raw = json.load(f)
+    all_wikitext_raw = page_text_store.load_page_text(wiki_text_file_path)
 
     # Temp loading of item ID -> wikitext
     processed_wikitextfile_path = Path(config.DATA_WIKI_PATH / "processed-wikitext-items.json")
@@ -22,6 +22,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import json
+import argparse
 import collections
 from pathlib import Path
 
@@ -31,11 +32,14 @@ from osrsbox import monsters_api
 from osrsbox import prayers_api
 
 
-def generate_items_complete():
-    """Generate the `docs/items-complete.json` file."""
+def generate_items_complete(workers: int = 1):
+    """Generate the `docs/items-complete.json` file.
+
+    :param workers: The number of worker processes used to load the `items-json` files.
+    """
     # Read in the item database content
     path_to_items_json = Path(config.DOCS_PATH / "items-json")
-    all_db_items = items_api.all_items.AllItems(path_to_items_json)
+    all_db_items = items_api.all_items.AllItems(path_to_items_json, workers=workers)
 
     items = {}
 
@@ -77,11 +81,14 @@ def generate_item_slot_files():
             json.dump(json_out, f)
 
 
-def generate_monsters_complete():
-    """Generate the `docs/monsters-complete.json` file."""
+def generate_monsters_complete(workers: int = 1):
+    """Generate the `docs/monsters-complete.json` file.
+
+    :param workers: The number of worker processes used to load the `monsters-json` files.
+    """
     # Read in the item database content
     path_to_monsters_json = Path(config.DOCS_PATH / "monsters-json")
-    all_db_monsters = monsters_api.all_monsters.AllMonsters(path_to_monsters_json)
+    all_db_monsters = monsters_api.all_monsters.AllMonsters(path_to_monsters_json, workers=workers)
 
     monsters = {}
 
@@ -123,17 +130,29 @@ def generate_prayers_complete():
         json.dump(prayers, f)
 
 
-def main():
-    """The main function for generating the static JSON files."""
+def main(workers: int = 1):
+    """The main function for generating the static JSON files.
+
+    :param workers: The number of worker processes used to load the JSON directories.
+    """
     print("Generating items-complete.json file...")
-    generate_items_complete()
+    generate_items_complete(workers)
     print("Generating items-json-slot JSON files...")
     generate_item_slot_files()
     print("Generating monsters-complete.json file...")
-    generate_monsters_complete()
+    generate_monsters_complete(workers)
     print("Generating prayers-complete.json file...")
     generate_prayers_complete()
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Generate the static JSON files.")
+    parser.add_argument('--workers',
+                        default=1,
+                        type=int,
+                        required=False,
+                        help='The number of worker processes used to load the JSON directories '
+                             '(check scripts/benchmarks/benchmark_directory_load.py for any speedup first).')
+    args = parser.parse_args()
+
+    main(args.workers)
@@ -4,7 +4,9 @@ Email:   phoil@osrsbox.com
 Website: https://www.osrsbox.com
 
 Description:
-Script to update OSRS Wiki data dump.
+Script to update OSRS Wiki data dump. Use the --delta option to only extract
+the pages changed since the last extraction (using the OSRS Wiki recent
+changes), the timestamp is then only used if a full extraction is needed.
 
 Copyright (c) 2019, PH01L
 
@@ -22,23 +24,43 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import argparse
+from typing import List
 
 from scripts.wiki import extract_wiki_data
 
 
+def update_wiki_data(categories: List, last_extraction_date: str, delta: bool):
+    """Update the OSRS Wiki page titles and wiki text of a list of categories.
+
+    :param categories: A List containing categories.
+    :param last_extraction_date: The date (as a string) of the last extraction, used for a full extraction.
+    :param delta: Only extract the pages changed since the last sync point, if possible.
+    """
+    if delta and extract_wiki_data.sync_wiki_data(categories):
+        return
+    if not last_extraction_date:
+        raise SystemExit(">>> ERROR: A full extraction is needed, but no timestamp was provided. Exiting.")
+    extract_wiki_data.extract_wiki_data(categories, last_extraction_date)
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Update OSRS Wiki data.")
     parser.add_argument('timestamp',
+                        nargs='?',
+                        default=None,
                         help='A timestamp to start data collection from')
+    parser.add_argument('--delta',
+                        action='store_true',
+                        help='Only extract pages changed since the last sync point')
     args = parser.parse_args()
 
     last_extraction_date = args.timestamp
     print(f">>> WIKI DATA ITEMS: Extracting page titles and wiki text...")
     categories = ["Items", "Pets"]
-    extract_wiki_data.extract_wiki_data(categories, last_extraction_date)
+    update_wiki_data(categories, last_extraction_date, args.delta)
     print(f">>> WIKI DATA MONSTERS: Extracting page titles and wiki text...")
     categories = ["Monsters"]
-    extract_wiki_data.extract_wiki_data(categories, last_extraction_date)
+    update_wiki_data(categories, last_extraction_date, args.delta)
     # print(f">>> WIKI DATA QUESTS: Extracting page titles and wiki text...")
     # categories = ["Quests", "Miniquests", "Special_quests"]
-    # extract_wiki_data.extract_wiki_data(categories, last_extraction_date)
+    # update_wiki_data(categories, last_extraction_date, args.delta)
@@ -24,36 +24,55 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import sys
-import json
 import datetime
-import itertools
 from pathlib import Path
 from typing import List
 
 import config
+from scripts.wiki.extraction_checkpoint import ExtractionCheckpoint
+from scripts.wiki.page_text_store import PageTextStore, journal_path, load_page_text
+from scripts.wiki.wiki_api_client import WikiApiClient
 from scripts.wiki.wiki_page_titles import WikiPageTitles
-from scripts.wiki.wiki_page_text import WikiPageText
+from scripts.wiki.wiki_page_text import WikiPageTextBatch
+from scripts.wiki.wiki_recent_changes import WikiRecentChanges, load_sync_point, save_sync_point
 
 
 OSRS_WIKI_API_URL = "https://oldschool.runescape.wiki/api.php"
 
 
-def extract_wiki_data(categories: List, last_extraction_date: str):
+def extract_wiki_data(categories: List, last_extraction_date: str, base_url: str = OSRS_WIKI_API_URL,
+                      wiki_data_path: Path = config.DATA_WIKI_PATH):
     """The main function for extracting OSRS Wiki category page titles and page wiki text.
 
+    The extraction progress is saved in a checkpoint file, and the extracted wiki
+    text in a page text journal. If an extraction is interrupted, running it
+    again (with the same categories and last extraction date) resumes where it
+    stopped, without querying the completed category pages, revision timestamps
+    or wiki text again.
+
     :param categories: A List containing categories.
     :param last_extraction_date: The date (as a string) of the last extraciton.
+    :param base_url: The OSRS Wiki URL used for API queries.
+    :param wiki_data_path: The directory of the page titles, page text and checkpoint files.
     """
     # The first category argument, used to build the output file name
     primary_category = categories[0].lower()
 
     # Specify the name for the page titles output JSON file
     titles_file_path = f"page-titles-{primary_category}.json"
-    titles_file_path = Path(config.DATA_WIKI_PATH / titles_file_path)
+    titles_file_path = Path(wiki_data_path / titles_file_path)
 
     # Specify the name for the wiki text output JSON file
     text_file_path = f"page-text-{primary_category}.json"
-    text_file_path = Path(config.DATA_WIKI_PATH / text_file_path)
+    text_file_path = Path(wiki_data_path / text_file_path)
+
+    # Specify the name for the extraction checkpoint file, removed when the extraction is complete
+    checkpoint_file_path = f"extract-checkpoint-{primary_category}.jsonl"
+    checkpoint_file_path = Path(wiki_data_path / checkpoint_file_path)
+
+    # Specify the name for the sync point file, the time the extraction was started
+    sync_point_file_path = f"sync-point-{primary_category}.json"
+    sync_point_file_path = Path(wiki_data_path / sync_point_file_path)
 
     # STAGE ZERO: SET SCRIPT CONFIGURATION
 
@@ -64,18 +83,32 @@ def extract_wiki_data(categories: List, last_extraction_date: str):
     # Boolean to trigger load page titles from file, or run fresh page title extraction
     load_files = False
 
+    # Load the checkpoint of an interrupted extraction, or start a new checkpoint
+    checkpoint = ExtractionCheckpoint(checkpoint_file_path, categories, last_extraction_date)
+    if checkpoint.resumed:
+        print(f">>> Resuming interrupted extraction from checkpoint: {checkpoint_file_path}")
+
     # Set the revision date, extract wiki pages only after this date
     last_extraction_date = datetime.datetime.strptime(last_extraction_date,
                                                       '%Y-%m-%dT%H:%M:%SZ')
 
+    # Create a shared client for all OSRS Wiki API requests (a pool of 4 workers, at most 5 requests per second)
+    client = WikiApiClient(base_url,
+                           user_agent,
+                           user_email,
+                           max_workers=4,
+                           requests_per_second=5.0)
+
     # STAGE ONE: EXTRACT PAGE TITLES
 
     print(">>> Starting wiki page titles extraction...")
     # Create object to handle page titles extraction
-    wiki_page_titles = WikiPageTitles(OSRS_WIKI_API_URL,
+    wiki_page_titles = WikiPageTitles(base_url,
                                       categories,
                                       user_agent,
-                                      user_email)
+                                      user_email,
+                                      client=client,
+                                      checkpoint=None if load_files else checkpoint)
 
     # Load previously extracted page titles from JSON, or extract from OSRS Wiki API
     if load_files:
@@ -86,14 +119,8 @@ def extract_wiki_data(categories: List, last_extraction_date: str):
         # Extract page titles using supplied categories
         wiki_page_titles.extract_page_titles()
         # Extract page revision date
-        # Loop 50 page titles at a time, the max number for a revisions request using page titles
-        for page_title_list in itertools.zip_longest(*[iter(wiki_page_titles.page_titles)] * 50):
-            # Remove None entries from the list of page titles
-            page_title_list = filter(None, page_title_list)
-            # Join the page titles list using the pipe (|) separator
-            page_titles_string = "|".join(page_title_list)
-            # Extract the page revision date
-            wiki_page_titles.extract_last_revision_timestamp(page_titles_string)
+        # Query 50 page titles at a time, the max number for a revisions request using page titles
+        wiki_page_titles.extract_last_revision_timestamps(batch_size=50)
         # Save all page titles and
         wiki_page_titles.export_page_titles_in_json(titles_file_path)
 
@@ -103,47 +130,149 @@ def extract_wiki_data(categories: List, last_extraction_date: str):
 
     # STAGE TWO: EXTRACT WIKI USING PAGE TITLES
 
-    # Open page title JSON file, to check if page needs to have wiki text extracted
+    # Open page text JSON file (and journal), to check if page needs to have wiki text extracted
     json_data = dict()
 
-    if text_file_path.exists():
-        with open(text_file_path, mode='r') as existing_out_file:
-            json_data = json.load(existing_out_file)
+    if text_file_path.exists() or journal_path(text_file_path).exists():
+        json_data = load_page_text(text_file_path)
 
-    page_titles_count = 1
-    print(">>> Starting wiki text extraction for extracted page titles...")
-    for page_title, page_revision_date in wiki_page_titles.page_titles.items():
-        print(f"  > Progress: {page_titles_count:4d} of {page_titles_total:4d} - Processing: {page_title}")
+    # Append the wiki text of each completed batch to the page text journal
+    page_text_store = PageTextStore(text_file_path)
 
-        # If update_wiki_data.py ever fails:
-        # 1) Set load_files (above) to True
-        # 2) Uncomment code below, and set item ID to last failed item
-        # 3) Use this script: python extract_wiki_data -c Items Pets
-        # if int(page_titles_count) < 5400:
-        #     page_titles_count += 1
-        #     continue
+    # Determine the page titles that need to have wiki text extracted
+    extract_page_titles = list()
+    for page_title, page_revision_date in wiki_page_titles.page_titles.items():
+        # Check if the page was already extracted by an interrupted extraction
+        if page_title in page_text_store and page_text_store.timestamps[page_title] == page_revision_date:
+            continue
 
         # Convert revision date to datetime object
-        last_revision_date = datetime.datetime.strptime(wiki_page_titles[page_title],
+        last_revision_date = datetime.datetime.strptime(page_revision_date,
                                                         '%Y-%m-%dT%H:%M:%SZ')
 
         # Check if page title is already present in JSON output file, also check revision date
         if page_title in json_data and last_revision_date < last_extraction_date:
             # If the last revision was before last extract, skip
-            page_titles_count += 1
             continue
 
-        # Create object to extract page wiki text
-        wiki_page_text = WikiPageText(OSRS_WIKI_API_URL,
-                                      page_title,
-                                      user_agent,
-                                      user_email)
+        extract_page_titles.append(page_title)
+
+    # Create object to extract wiki text for many pages using batched queries
+    wiki_page_text = WikiPageTextBatch(base_url,
+                                       extract_page_titles,
+                                       user_agent,
+                                       user_email,
+                                       client=client)
+
+    page_titles_count = 0
+    print(f">>> Starting wiki text extraction for {len(extract_page_titles)} page titles...")
+    for page_title_list in wiki_page_text.extract_pages_wiki_text():
+        wiki_page_text.export_wiki_text_to_store(page_text_store, page_title_list)
+        page_titles_count += len(page_title_list)
+        print(f"  > Progress: {page_titles_count:4d} of {len(extract_page_titles):4d} - Processed: {page_title_list[-1]}")
+
+    # Merge the page text journal into the JSON output file, the extraction is complete
+    page_text_store.compact()
+    checkpoint.remove()
+    save_sync_point(sync_point_file_path, checkpoint.sync_point)
+
+    client.close()
+    print(f">>> OSRS Wiki API requests: {client.metrics}")
+
+
+def sync_wiki_data(categories: List, base_url: str = OSRS_WIKI_API_URL,
+                   wiki_data_path: Path = config.DATA_WIKI_PATH) -> bool:
+    """Update extracted OSRS Wiki page titles and page wiki text with the changes since the last sync point.
+
+    Instead of querying every page title in the categories, the recent changes
+    feed is queried for pages that were edited, created, moved or deleted since
+    the sync point saved by the last extraction (or sync). Only the wiki text of
+    changed pages in the categories is extracted, and the page titles and page
+    text files are updated. A full extraction (extract_wiki_data) is needed when
+    there are no extracted files, or the recent changes feed does not go back to
+    the sync point.
+
+    Any failed API request stops the sync without saving a new sync point, so
+    the next sync queries the same changes again. The recent changes feed only
+    lists changes to a page itself, so a page that joins or leaves a category
+    without an edit to the page (such as through an edited template) is not
+    picked up until the next full extraction.
+
+    :param categories: A List containing categories.
+    :param base_url: The OSRS Wiki URL used for API queries.
+    :param wiki_data_path: The directory of the page titles, page text and sync point files.
+    :return: A boolean to indicate if the extracted data was updated, False if a full extraction is needed.
+    :raises SystemExit: An API request failed.
+    """
+    # The first category argument, used to build the file names
+    primary_category = categories[0].lower()
+    titles_file_path = Path(wiki_data_path / f"page-titles-{primary_category}.json")
+    text_file_path = Path(wiki_data_path / f"page-text-{primary_category}.json")
+    sync_point_file_path = Path(wiki_data_path / f"sync-point-{primary_category}.json")
 
-        # If the page title has not been extracted, extract wiki text and save to JSON file
-        wiki_page_text.extract_page_wiki_text()
-        wiki_page_text.export_wiki_text_to_json(text_file_path)
+    # Specify the custom user agent for all requests
+    user_agent = "osrsbox-agent"
+    user_email = "phoil@osrsbox.com"
 
-        page_titles_count += 1
+    last_sync_point = load_sync_point(sync_point_file_path)
+    if last_sync_point is None or not titles_file_path.exists() or not text_file_path.exists():
+        print(">>> No sync point, or no extracted page titles and wiki text, a full extraction is needed.")
+        return False
+    sync_point = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    client = WikiApiClient(base_url,
+                           user_agent,
+                           user_email,
+                           max_workers=4,
+                           requests_per_second=5.0)
+
+    # Extract the pages changed since the last sync point
+    wiki_recent_changes = WikiRecentChanges(base_url, user_agent, user_email, client=client)
+    if not wiki_recent_changes.is_available(last_sync_point):
+        print(f">>> Recent changes do not go back to the sync point ({last_sync_point}), a full extraction is needed.")
+        client.close()
+        return False
+    wiki_recent_changes.extract_recent_changes(last_sync_point)
+
+    wiki_page_titles = WikiPageTitles(base_url, categories, user_agent, user_email, client=client)
+    wiki_page_titles.load_page_titles(titles_file_path)
+
+    # A changed page is extracted if it is in the categories, or removed if it has left the categories
+    changed_titles = list(wiki_recent_changes.changed_titles)
+    category_members = wiki_recent_changes.filter_category_members(changed_titles, categories)
+    extract_page_titles = [page_title for page_title in changed_titles if page_title in category_members]
+    remove_page_titles = [page_title for page_title in changed_titles if page_title not in category_members]
+    remove_page_titles += sorted(wiki_recent_changes.deleted_titles)
+    remove_page_titles = [page_title for page_title in remove_page_titles if page_title in wiki_page_titles.page_titles]
+    print(f">>> Changes since {last_sync_point}: {len(extract_page_titles)} changed pages, "
+          f"{len(remove_page_titles)} removed pages")
+
+    # Extract the wiki text of changed pages, and remove deleted (or moved) pages
+    page_text_store = PageTextStore(text_file_path)
+    wiki_page_text = WikiPageTextBatch(base_url, extract_page_titles, user_agent, user_email, client=client)
+    for page_title_list in wiki_page_text.extract_pages_wiki_text():
+        wiki_page_text.export_wiki_text_to_store(page_text_store, page_title_list)
+    for page_title, page_revision_date in wiki_page_text.revision_timestamps.items():
+        if page_revision_date is None:
+            # The page was deleted after the recent changes were extracted
+            page_text_store.remove(page_title)
+        else:
+            wiki_page_titles.page_titles[page_title] = page_revision_date
+    for page_title in remove_page_titles:
+        page_text_store.remove(page_title)
+    page_text_store.compact()
+
+    # Update the page titles and revision timestamps
+    for page_title in remove_page_titles + extract_page_titles:
+        if wiki_page_text.revision_timestamps.get(page_title) is None:
+            wiki_page_titles.page_titles.pop(page_title, None)
+    wiki_page_titles.export_page_titles_in_json(titles_file_path)
+
+    save_sync_point(sync_point_file_path, sync_point)
+
+    client.close()
+    print(f">>> OSRS Wiki API requests: {client.metrics}")
+    return True
 
 
 if __name__ == "__main__":
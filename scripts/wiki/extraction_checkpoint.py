@@ -0,0 +1,148 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A checkpoint of the progress of an OSRS Wiki extraction, so an interrupted
+extraction can resume where it stopped. The checkpoint is an append-only JSON
+Lines file, with one record for every completed API query:
+    {"categories": [...], "last_extraction_date": "..."} - the extraction settings
+    {"sync_point": "2020-05-01T12:00:00Z"} - the time the extraction was started
+    {"category": "Items", "titles": [...], "continue": {...}} - a page of category members
+    {"timestamps": {"Abyssal whip": "2020-05-01T12:00:00Z"}} - a batch of revision timestamps
+The category "continue" entry is the continuation token of the next category
+query, or null when the category is complete. The completed wiki text is not
+saved in the checkpoint, it is saved in the page text journal (see
+page_text_store.py).
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import json
+import datetime
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from scripts.wiki.page_text_store import read_journal
+
+LOG = logging.getLogger(__name__)
+
+
+class ExtractionCheckpoint:
+    """This class saves, and loads, the progress of an OSRS Wiki extraction.
+
+    A checkpoint saved with different extraction settings (categories, or last
+    extraction date) is discarded.
+
+    :param path_to_checkpoint: The path to the checkpoint file.
+    :param categories: A list of the extracted OSRS Wiki categories.
+    :param last_extraction_date: The date (as a string) of the last extraction.
+    """
+    def __init__(self, path_to_checkpoint: Path, categories: List[str], last_extraction_date: str):
+        self.path_to_checkpoint = Path(path_to_checkpoint)
+        self.settings = {"categories": list(categories), "last_extraction_date": last_extraction_date}
+        self.category_titles: Dict[str, List[str]] = {category: list() for category in categories}
+        self.category_continue: Dict[str, Optional[Dict]] = {category: dict() for category in categories}
+        self.timestamps: Dict[str, str] = dict()
+        self.sync_point = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        self.lock = threading.Lock()
+        self.checkpoint_file = None
+
+        self.resumed = self._load()
+        if not self.resumed:
+            self.remove()
+            self._append(self.settings)
+            self._append({"sync_point": self.sync_point})
+
+    def _load(self) -> bool:
+        """Load a saved checkpoint.
+
+        :return: A boolean to indicate if a checkpoint with the same extraction settings was loaded.
+        """
+        records = read_journal(self.path_to_checkpoint)
+        first_record = next(records, None)
+        if first_record is None:
+            return False
+        _, end, settings = first_record
+        if settings != self.settings:
+            LOG.warning(f"Discarding checkpoint with different extraction settings: {self.path_to_checkpoint}")
+            records.close()
+            return False
+
+        for _, end, record in records:
+            if "category" in record:
+                self.category_titles[record["category"]].extend(record["titles"])
+                self.category_continue[record["category"]] = record["continue"]
+            elif "timestamps" in record:
+                self.timestamps.update(record["timestamps"])
+            elif "sync_point" in record:
+                self.sync_point = record["sync_point"]
+
+        # Remove any incomplete record, so new records are appended after the last complete record
+        if self.path_to_checkpoint.stat().st_size != end:
+            with open(self.path_to_checkpoint, mode="r+b") as checkpoint_file:
+                checkpoint_file.truncate(end)
+        return True
+
+    def is_category_complete(self, category: str) -> bool:
+        """Check if all page titles of a category have been extracted.
+
+        :param category: A string representing the OSRS Wiki category.
+        """
+        return self.category_continue[category] is None
+
+    def save_category(self, category: str, page_titles: List[str], last_continue: Optional[Dict]):
+        """Save a page of extracted category page titles.
+
+        :param category: A string representing the OSRS Wiki category.
+        :param page_titles: The page titles in the page of category members.
+        :param last_continue: The 'continue' entry of the next category query, or None if the category is complete.
+        """
+        with self.lock:
+            self.category_titles[category].extend(page_titles)
+            self.category_continue[category] = last_continue
+            self._append({"category": category, "titles": page_titles, "continue": last_continue})
+
+    def save_timestamps(self, timestamps: Dict[str, str]):
+        """Save a batch of extracted page revision timestamps.
+
+        :param timestamps: A dictionary of page title to last revision timestamp.
+        """
+        with self.lock:
+            self.timestamps.update(timestamps)
+            self._append({"timestamps": timestamps})
+
+    def remove(self):
+        """Remove the checkpoint file, when an extraction is complete."""
+        if self.checkpoint_file is not None:
+            self.checkpoint_file.close()
+            self.checkpoint_file = None
+        if self.path_to_checkpoint.exists():
+            self.path_to_checkpoint.unlink()
+
+    def _append(self, record: Dict):
+        if self.checkpoint_file is None:
+            self.checkpoint_file = open(self.path_to_checkpoint, mode="ab")
+        self.checkpoint_file.write(self._serialize(record))
+        self.checkpoint_file.flush()
+        os.fsync(self.checkpoint_file.fileno())
+
+    @staticmethod
+    def _serialize(record: Dict) -> bytes:
+        return (json.dumps(record) + "\n").encode()
@@ -0,0 +1,218 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+An append-only store for extracted OSRS Wiki page text. Each extracted page is
+appended to a JSON Lines journal (next to the page text JSON file), instead of
+rewriting the whole JSON file after every page. A compaction step merges the
+journal into the page text JSON file. Use load_page_text to read the page text
+of either form (the JSON file, the journal, or both). A page can be removed by
+appending a deleted record. Example usage:
+    page_text_store = PageTextStore(Path("page-text-items.json"))
+    page_text_store.append("Abyssal whip", "2020-05-01T12:00:00Z", wikitext)
+    page_text_store.compact()
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Generator, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+
+def journal_path(path_to_json: Path) -> Path:
+    """Return the path of the page text journal for a page text JSON file.
+
+    :param path_to_json: The path to the page text JSON file, for example `page-text-items.json`.
+    :return: The path to the journal, for example `page-text-items.jsonl`.
+    """
+    path_to_json = Path(path_to_json)
+    return path_to_json.with_suffix(".jsonl")
+
+
+def read_journal(path_to_journal: Path) -> Generator[Tuple[int, int, Dict], None, None]:
+    """Read every complete record from a page text journal (or any other JSON Lines journal).
+
+    A record that was only partly written (for example, when an extraction was
+    interrupted) is ignored.
+
+    :param path_to_journal: The path to the journal.
+    :return: A generator of the start and end file offsets, and the record (title, timestamp and wikitext), of each entry.
+    """
+    if not path_to_journal.exists():
+        return
+    with open(path_to_journal, mode="rb") as journal_file:
+        offset = 0
+        for line in journal_file:
+            try:
+                record = json.loads(line) if line.endswith(b"\n") else None
+            except ValueError:
+                record = None
+            if record is None:
+                LOG.warning(f"Ignoring an incomplete journal record at offset {offset}: {path_to_journal}")
+                break
+            yield offset, offset + len(line), record
+            offset += len(line)
+
+
+def load_page_text(path_to_json: Path) -> Dict[str, str]:
+    """Load extracted page text, from a page text JSON file and any page text journal.
+
+    Journal records are newer than the JSON file, so replace any JSON entry
+    with the same page title.
+
+    :param path_to_json: The path to the page text JSON file.
+    :return: A dictionary of page title to wikitext.
+    :raises FileNotFoundError: Neither the JSON file or the journal exist.
+    """
+    path_to_json = Path(path_to_json)
+    path_to_journal = journal_path(path_to_json)
+    if not path_to_json.exists() and not path_to_journal.exists():
+        raise FileNotFoundError(f"Error: No page text file or journal found: {path_to_json}. Exiting.")
+
+    page_text = dict()
+    if path_to_json.exists():
+        with open(path_to_json) as f:
+            page_text = json.load(f)
+    for _, _, record in read_journal(path_to_journal):
+        if record.get("deleted"):
+            page_text.pop(record["title"], None)
+        else:
+            page_text[record["title"]] = record["wikitext"]
+    return page_text
+
+
+class PageTextStore:
+    """This class appends extracted page text to a journal, and compacts the journal into a JSON file.
+
+    The journal is indexed in memory by page title, using the file offset of the
+    newest record of each page.
+
+    :param path_to_json: The path to the page text JSON file, the journal is kept next to it.
+    """
+    def __init__(self, path_to_json: Path):
+        self.path_to_json = Path(path_to_json)
+        self.path_to_journal = journal_path(self.path_to_json)
+        self.index: Dict[str, int] = dict()
+        self.timestamps: Dict[str, Optional[str]] = dict()
+
+        end = 0
+        for offset, end, record in read_journal(self.path_to_journal):
+            if record.get("deleted"):
+                self.index.pop(record["title"], None)
+                self.timestamps.pop(record["title"], None)
+            else:
+                self.index[record["title"]] = offset
+                self.timestamps[record["title"]] = record["timestamp"]
+
+        # Remove any incomplete record, so new records are appended after the last complete record
+        if self.path_to_journal.exists() and self.path_to_journal.stat().st_size != end:
+            with open(self.path_to_journal, mode="r+b") as journal_file:
+                journal_file.truncate(end)
+
+        self.journal_file = None
+
+    def __contains__(self, page_title: str) -> bool:
+        """Check if a page title has a record in the journal."""
+        return page_title in self.index
+
+    def __len__(self) -> int:
+        """Return the number of page titles in the journal."""
+        return len(self.index)
+
+    def get(self, page_title: str) -> Optional[str]:
+        """Read the newest wikitext of a page title from the journal.
+
+        :param page_title: The page title.
+        :return: The wikitext, or None if the page title is not in the journal.
+        """
+        if page_title not in self.index:
+            return None
+        self.flush()
+        with open(self.path_to_journal, mode="rb") as journal_file:
+            journal_file.seek(self.index[page_title])
+            return json.loads(journal_file.readline())["wikitext"]
+
+    def append(self, page_title: str, timestamp: Optional[str], wikitext: Optional[str]):
+        """Append the extracted wikitext of a page to the journal.
+
+        The wikitext is saved as a string (None is saved as "None"), the same as
+        the page text JSON file.
+
+        :param page_title: The page title.
+        :param timestamp: The revision timestamp of the page (in ISO 8601 format), or None if not known.
+        :param wikitext: The page wikitext.
+        """
+        if self.journal_file is None:
+            self.journal_file = open(self.path_to_journal, mode="ab")
+        record = {"title": page_title, "timestamp": timestamp, "wikitext": str(wikitext)}
+        self.index[page_title] = self.journal_file.tell()
+        self.timestamps[page_title] = timestamp
+        self.journal_file.write(self._serialize(record))
+
+    def remove(self, page_title: str):
+        """Append a deleted record to the journal, to remove a page (such as a deleted or moved wiki page).
+
+        :param page_title: The page title.
+        """
+        if self.journal_file is None:
+            self.journal_file = open(self.path_to_journal, mode="ab")
+        self.journal_file.write(self._serialize({"title": page_title, "deleted": True}))
+        self.index.pop(page_title, None)
+        self.timestamps.pop(page_title, None)
+
+    def flush(self):
+        """Flush appended records to the journal file."""
+        if self.journal_file is not None:
+            self.journal_file.flush()
+            os.fsync(self.journal_file.fileno())
+
+    def close(self):
+        """Flush and close the journal file."""
+        if self.journal_file is not None:
+            self.flush()
+            self.journal_file.close()
+            self.journal_file = None
+
+    def compact(self):
+        """Merge the journal into the page text JSON file, then remove the journal.
+
+        The JSON file is written to a temporary file first, and then replaced, so
+        an interrupted compaction never leaves a partly written JSON file. Nothing
+        is written when there is no journal.
+        """
+        self.close()
+        if not self.path_to_journal.exists():
+            return
+        page_text = load_page_text(self.path_to_json)
+
+        temp_path = self.path_to_json.with_suffix(".json.tmp")
+        with open(temp_path, mode="w") as out_file:
+            out_file.write(json.dumps(page_text, indent=4))
+        os.replace(temp_path, self.path_to_json)
+
+        self.path_to_journal.unlink()
+        self.index = dict()
+        self.timestamps = dict()
+
+    @staticmethod
+    def _serialize(record: Dict) -> bytes:
+        return (json.dumps(record) + "\n").encode()
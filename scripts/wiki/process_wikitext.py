@@ -32,6 +32,7 @@ import collections
 from pathlib import Path
 
 import config
+from scripts.wiki import page_text_store
 from scripts.wiki.wikitext_parser import WikitextIDParser
 
 logging.basicConfig(filename=Path(__file__).stem+".log",
@@ -40,8 +41,7 @@ logging.info(">>> Starting process_wikitext.py...")
 
 # Load the wiki text file
 wiki_text_file_path = Path(config.DATA_WIKI_PATH / "page-text-items.json")
-with open(wiki_text_file_path) as wiki_text_file:
-    wiki_text = json.load(wiki_text_file)
+wiki_text = page_text_store.load_page_text(wiki_text_file_path)
 
 # Call WikitextID Parser to map:
 # 1. ID to infobox template version
@@ -68,8 +68,7 @@ logging.info(">>> Starting process_wikitext_monsters.py...")
 
 # Load the wiki text file
 wiki_text_file_path = Path(config.DATA_WIKI_PATH / "page-text-monsters.json")
-with open(wiki_text_file_path) as wiki_text_file:
-    wiki_text = json.load(wiki_text_file)
+wiki_text = page_text_store.load_page_text(wiki_text_file_path)
 
 # Call WikitextID Parser to map:
 # 1. ID to infobox template version
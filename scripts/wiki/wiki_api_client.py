@@ -0,0 +1,254 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+A shared HTTP client for OSRS Wiki API queries. All requests use one session
+(reusing connections), are spaced by a global rate limit, are retried with an
+exponential backoff, and have their latency recorded. Independent queries can
+be run concurrently using a bounded pool of worker threads.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import time
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+LOG = logging.getLogger(__name__)
+
+# HTTP status codes (and MediaWiki API error codes) that are retried
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_API_ERROR_CODES = {"maxlag", "ratelimited", "readonly"}
+
+# The default clients, shared by every caller that does not provide a client
+DEFAULT_CLIENTS: Dict[Tuple[str, str, str], "WikiApiClient"] = dict()
+DEFAULT_CLIENTS_LOCK = threading.Lock()
+
+
+class RateLimiter:
+    """This class spaces requests from every thread by a minimum interval.
+
+    :param requests_per_second: The maximum number of requests per second.
+    """
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self.next_request_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request is allowed."""
+        with self.lock:
+            now = time.monotonic()
+            request_time = max(now, self.next_request_time)
+            self.next_request_time = request_time + self.interval
+        if request_time > now:
+            time.sleep(request_time - now)
+
+
+class RequestMetrics:
+    """This class records the latency of every request, and the number of retries and failures."""
+    def __init__(self):
+        self.latencies: List[float] = list()
+        self.retries = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def record(self, latency: float):
+        with self.lock:
+            self.latencies.append(latency)
+
+    def summary(self) -> Dict:
+        """Summarise the recorded request latencies.
+
+        :return: A dictionary of the request count, retries, failures and latency statistics (in seconds).
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+        summary = {"requests": len(latencies), "retries": self.retries, "failures": self.failures}
+        if latencies:
+            summary.update({
+                "total": sum(latencies),
+                "mean": sum(latencies) / len(latencies),
+                "p50": latencies[len(latencies) // 2],
+                "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "max": latencies[-1]
+            })
+        return summary
+
+    def __str__(self) -> str:
+        summary = self.summary()
+        if not summary["requests"]:
+            return "0 requests"
+        return (f"{summary['requests']} requests ({summary['retries']} retries, {summary['failures']} failures), "
+                f"latency mean {summary['mean'] * 1e3:.0f}ms, p50 {summary['p50'] * 1e3:.0f}ms, "
+                f"p95 {summary['p95'] * 1e3:.0f}ms, max {summary['max'] * 1e3:.0f}ms")
+
+
+class WikiApiClient:
+    """This class handles HTTP requests to the OSRS Wiki API.
+
+    :param base_url: The OSRS Wiki URL used for API queries.
+    :param user_agent: A custom user-agent name to be used for the API request.
+    :param user_email: A custom user-agent email to be used for the API request.
+    :param max_workers: The maximum number of concurrent requests.
+    :param requests_per_second: The maximum number of requests per second, from all workers.
+    :param max_retries: The number of times a failed request is retried.
+    :param backoff_factor: The delay (in seconds) before the first retry, doubled for each retry.
+    :param timeout: The timeout (in seconds) of each request.
+    """
+    def __init__(self, base_url: str, user_agent: str, user_email: str, max_workers: int = 4,
+                 requests_per_second: float = 5.0, max_retries: int = 5, backoff_factor: float = 1.0,
+                 timeout: float = 60.0):
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        # One session, with a connection pool large enough for every worker
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'From': user_email
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.metrics = RequestMetrics()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def get(self, request: Dict) -> Dict:
+        """Perform an OSRS Wiki API GET request, retrying any failed request.
+
+        :param request: A dictionary of the OSRS Wiki API request parameters.
+        :return: The JSON response.
+        :raises SystemExit: The request failed after every retry.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.wait()
+            start = time.perf_counter()
+            retry_after = None
+            try:
+                response = self.session.get(self.base_url, params=request, timeout=self.timeout)
+                if response.status_code in RETRY_STATUS_CODES:
+                    retry_after = response.headers.get("Retry-After")
+                    reason = f"HTTP status {response.status_code}"
+                else:
+                    response.raise_for_status()
+                    result = response.json()
+                    error_code = result.get("error", dict()).get("code")
+                    if error_code not in RETRY_API_ERROR_CODES:
+                        return result
+                    reason = f"API error {error_code}"
+            except (requests.exceptions.RequestException, ValueError) as e:
+                reason = str(e)
+            finally:
+                self.metrics.record(time.perf_counter() - start)
+
+            if attempt == self.max_retries:
+                break
+            with self.metrics.lock:
+                self.metrics.retries += 1
+            delay = self.backoff_factor * 2 ** attempt
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            LOG.warning(f"Request failed ({reason}), retrying in {delay} seconds: {request}")
+            time.sleep(delay)
+
+        with self.metrics.lock:
+            self.metrics.failures += 1
+        raise SystemExit(f">>> ERROR: Get request error ({reason}). Exiting.")
+
+    def query(self, request: Dict, last_continue: Optional[Dict] = None) -> Generator[Dict, None, None]:
+        """Perform an OSRS Wiki API query, following any 'continue' entries in the responses.
+
+        :param request: A dictionary of the OSRS Wiki API request parameters.
+        :param last_continue: A 'continue' entry to start the query from, such as a saved checkpoint.
+        :return: A generator of each JSON response.
+        """
+        last_continue = last_continue or {}
+
+        while True:
+            # Clone original request, and insert the 'continue' section
+            req = request.copy()
+            req.update(last_continue)
+
+            result = self.get(req)
+            yield result
+            if "continue" not in result:
+                break
+
+            last_continue = result["continue"]
+
+    def map(self, function: Callable, iterable: Iterable) -> Generator:
+        """Run a function for every entry using the worker pool, returning results in order.
+
+        :param function: The function to run, which performs any API requests using this client.
+        :param iterable: The function arguments.
+        :return: A generator of the function results, in the same order as the arguments.
+        """
+        futures = [self.executor.submit(function, entry) for entry in iterable]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        """Stop the worker pool and close all connections."""
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+
+def make_client(base_url: str, user_agent: str, user_email: str, client: Optional[WikiApiClient]) -> WikiApiClient:
+    """Return a provided OSRS Wiki API client, or a shared client with the default settings.
+
+    A single default client is created for each base URL and user-agent, so
+    the connection pool, worker pool and rate limit are shared by every caller
+    that does not provide a client. The default clients are closed on exit.
+
+    :param base_url: The OSRS Wiki URL used for API queries.
+    :param user_agent: A custom user-agent name to be used for the API request.
+    :param user_email: A custom user-agent email to be used for the API request.
+    :param client: A shared client, or None.
+    :return: An OSRS Wiki API client.
+    """
+    if client is not None:
+        return client
+    with DEFAULT_CLIENTS_LOCK:
+        key = (base_url, user_agent, user_email)
+        if key not in DEFAULT_CLIENTS:
+            DEFAULT_CLIENTS[key] = WikiApiClient(base_url, user_agent, user_email)
+        return DEFAULT_CLIENTS[key]
+
+
+@atexit.register
+def close_default_clients():
+    """Close every default client created by make_client."""
+    with DEFAULT_CLIENTS_LOCK:
+        for client in DEFAULT_CLIENTS.values():
+            client.close()
+        DEFAULT_CLIENTS.clear()
@@ -18,14 +18,17 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
-import json
 import logging
-from pathlib import Path
+from typing import Dict, Generator, List, Optional, Tuple
 
-import requests
+from scripts.wiki.page_text_store import PageTextStore
+from scripts.wiki.wiki_api_client import WikiApiClient, make_client
 
 LOG = logging.getLogger(__name__)
 
+# The maximum number of page titles in a revisions content query (the API limit for normal users)
+MAX_TITLES_PER_REQUEST = 50
+
 
 class WikiPageText:
     """This class handles extraction of wiki text using an OSRS Wiki API query.
@@ -34,14 +37,13 @@ class WikiPageText:
     :param page_title: OSRS Wiki page titles used for API query.
     :param user_agent: A custom user-agent name to be used for the API request.
     :param user_email: A custom user-agent email to be used for the API request.
+    :param client: A shared OSRS Wiki API client, or None to use the default client.
     """
-    def __init__(self, base_url: str, page_title: str, user_agent: str, user_email: str):
+    def __init__(self, base_url: str, page_title: str, user_agent: str, user_email: str,
+                 client: Optional[WikiApiClient] = None):
         self.base_url = base_url
         self.page_title = page_title
-        self.custom_agent = {
-            'User-Agent': user_agent,
-            'From': user_email
-        }
+        self.client = make_client(base_url, user_agent, user_email, client)
         self.wiki_text = None
 
     def extract_page_wiki_text(self):
@@ -59,12 +61,7 @@ class WikiPageText:
         }
 
         # Perform HTTP GET request
-        try:
-            page_data = requests.get(self.base_url,
-                                     headers=self.custom_agent,
-                                     params=request).json()
-        except requests.exceptions.RequestException as e:
-            raise SystemExit(">>> ERROR: Get request error. Exiting.") from e
+        page_data = self.client.get(request)
 
         try:
             # Try to extract the wiki text from the HTTP response
@@ -75,28 +72,124 @@ class WikiPageText:
 
         self.wiki_text = wiki_text
 
-    def export_wiki_text_to_json(self, out_file_name: str):
-        """Export all extracted wiki text to a JSON file.
+    def export_wiki_text_to_store(self, page_text_store: PageTextStore):
+        """Export the extracted wiki text to a page text store.
+
+        Querying the OSRS Wiki constantly is a bad approach. This function appends
+        the extracted wiki text to the page text journal, to save re-querying the
+        API. The page text JSON file is written when the store is compacted.
+
+        :param page_text_store: The page text store to save wiki text to.
+        """
+        page_text_store.append(self.page_title, None, self.wiki_text)
+
+
+class WikiPageTextBatch:
+    """This class handles extraction of wiki text for many pages using batched OSRS Wiki API queries.
+
+    Instead of one parse query per page, the revision content (and revision
+    timestamp) of up to MAX_TITLES_PER_REQUEST pages is requested at once.
+
+    :param base_url: The OSRS Wiki URL used for API queries.
+    :param page_titles: OSRS Wiki page titles used for API queries.
+    :param user_agent: A custom user-agent name to be used for the API request.
+    :param user_email: A custom user-agent email to be used for the API request.
+    :param client: A shared OSRS Wiki API client, or None to use the default client.
+    """
+    def __init__(self, base_url: str, page_titles: List[str], user_agent: str, user_email: str,
+                 client: Optional[WikiApiClient] = None):
+        self.base_url = base_url
+        self.page_titles = list(page_titles)
+        self.client = make_client(base_url, user_agent, user_email, client)
+        self.wiki_text: Dict[str, Optional[str]] = dict()
+        self.revision_timestamps: Dict[str, Optional[str]] = dict()
+
+    def extract_pages_wiki_text(self) -> Generator[List[str], None, None]:
+        """Extract wiki text from OSRS Wiki for all page titles, one batch at a time.
+
+        The batches are queried concurrently using the OSRS Wiki API client, and
+        completed in the same order as the page titles. Pages that do not exist
+        (or have no revisions) have wiki text of None, the same as a failed
+        WikiPageText extraction.
+
+        :return: A generator of each completed batch of page titles, used to report progress.
+        """
+        batches = [self.page_titles[start:start + MAX_TITLES_PER_REQUEST]
+                   for start in range(0, len(self.page_titles), MAX_TITLES_PER_REQUEST)]
+        results = self.client.map(self._query_batch_wiki_text, batches)
+        for page_titles, (wiki_text, revision_timestamps) in zip(batches, results):
+            self.wiki_text.update(wiki_text)
+            self.revision_timestamps.update(revision_timestamps)
+            yield page_titles
+
+    def extract_batch_wiki_text(self, page_titles: List[str]):
+        """Extract wiki text from OSRS Wiki for one batch of page titles.
+
+        :param page_titles: A list of at most MAX_TITLES_PER_REQUEST page titles.
+        """
+        wiki_text, revision_timestamps = self._query_batch_wiki_text(page_titles)
+        self.wiki_text.update(wiki_text)
+        self.revision_timestamps.update(revision_timestamps)
+
+    def _query_batch_wiki_text(self, page_titles: List[str]) -> Tuple[Dict, Dict]:
+        """Query the wiki text and revision timestamp of one batch of page titles.
+
+        :param page_titles: A list of at most MAX_TITLES_PER_REQUEST page titles.
+        :return: A dictionary of wiki text, and a dictionary of revision timestamps, keyed by page title.
+        """
+        wiki_text = dict.fromkeys(page_titles)
+        revision_timestamps = dict.fromkeys(page_titles)
+
+        # Map any normalized page titles in the response back to the requested page title
+        requested_titles = {page_title: page_title for page_title in page_titles}
+
+        for result in self._extract_batch_wiki_text_callback(page_titles):
+            for entry in result.get("normalized", list()):
+                requested_titles[entry["to"]] = entry["from"]
+
+            for page in result["pages"].values():
+                page_title = requested_titles.get(page["title"], page["title"])
+                if "revisions" not in page:
+                    # Page is missing, or the revision content is in a continued response
+                    continue
+                revision = page["revisions"][0]
+                wiki_text[page_title] = revision["slots"]["main"].get("*")
+                revision_timestamps[page_title] = revision["timestamp"]
+
+        return wiki_text, revision_timestamps
+
+    def _extract_batch_wiki_text_callback(self, page_titles: List[str]) -> Generator[Dict, None, None]:
+        """Query callback function for an OSRS Wiki revisions content query.
+
+        The API stops adding revision content when a response gets too large,
+        and returns a 'continue' entry. The same query is then repeated with the
+        continue entry (by the OSRS Wiki API client), until the batch is complete.
+
+        :param page_titles: A list of at most MAX_TITLES_PER_REQUEST page titles.
+        """
+        request = {
+            "action": "query",
+            "prop": "revisions",
+            "rvprop": "content|timestamp",
+            "rvslots": "main",
+            "format": "json",
+            "titles": "|".join(page_titles)
+        }
+
+        for result in self.client.query(request):
+            if "error" in result:
+                raise SystemExit(f">>> ERROR: API request error: {result['error']}. Exiting.")
+            if "query" in result:
+                yield result["query"]
 
-        Querying the OSRS Wiki constantly is a bad approach. This function writes any
-        extracted wiki text to a file to save re-querying the API. This function
-        attempts to overwrite pre-existing wiki text entry in a file, where the key
-        is the page title, and the value is the wiki text.
+    def export_wiki_text_to_store(self, page_text_store: PageTextStore, page_titles: Optional[List[str]] = None):
+        """Export extracted wiki text, and the revision timestamps, to a page text store.
 
-        :param out_file_name: The file name to save wiki text to.
+        :param page_text_store: The page text store to save wiki text to.
+        :param page_titles: The page titles to export (such as a completed batch), defaults to all page titles.
         """
-        # Create dictionary for export
-        json_data = {self.page_title: str(self.wiki_text)}
-
-        out_file_name = Path(out_file_name)
-
-        # Write dictionary to JSON file
-        if not out_file_name.exists():
-            with open(out_file_name, mode='w') as out_file:
-                out_file.write(json.dumps(json_data, indent=4))
-        else:
-            with open(out_file_name) as feeds_json:
-                feeds = json.load(feeds_json)
-            feeds[self.page_title] = str(self.wiki_text)
-            with open(out_file_name, mode='w') as out_file:
-                out_file.write(json.dumps(feeds, indent=4))
+        if page_titles is None:
+            page_titles = list(self.wiki_text)
+        for page_title in page_titles:
+            page_text_store.append(page_title, self.revision_timestamps[page_title], self.wiki_text[page_title])
+        page_text_store.flush()
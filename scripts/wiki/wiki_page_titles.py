@@ -23,8 +23,11 @@ import logging
 from pathlib import Path
 from typing import Dict
 from typing import Generator
+from typing import List
+from typing import Optional
 
-import requests
+from scripts.wiki.extraction_checkpoint import ExtractionCheckpoint
+from scripts.wiki.wiki_api_client import WikiApiClient, make_client
 
 LOG = logging.getLogger(__name__)
 
@@ -36,14 +39,15 @@ class WikiPageTitles:
     :param categories: A list of OSRS Wiki categories.
     :param user_agent: A custom user-agent name to be used for the API request.
     :param user_email: A custom user-agent email to be used for the API request.
+    :param client: A shared OSRS Wiki API client, or None to use the default client.
+    :param checkpoint: An extraction checkpoint, to save (and resume) the extraction progress.
     """
-    def __init__(self, base_url: str, categories: list, user_agent: str, user_email: str):
+    def __init__(self, base_url: str, categories: list, user_agent: str, user_email: str,
+                 client: Optional[WikiApiClient] = None, checkpoint: Optional[ExtractionCheckpoint] = None):
         self.base_url = base_url
         self.categories = categories
-        self.custom_agent = {
-            'User-Agent': user_agent,
-            'From': user_email
-        }
+        self.client = make_client(base_url, user_agent, user_email, client)
+        self.checkpoint = checkpoint
         self.page_titles: Dict[str, str] = dict()
 
     def __iter__(self) -> Generator[str, None, None]:
@@ -93,9 +97,13 @@ class WikiPageTitles:
         from the OSRS Wiki using the MediaWiki API. You can all it using one category,
         for example: `Items`. Or you can use a list of category strings, for example:
         `Items, Pets, Furniture`.
+
+        The categories are queried concurrently using the OSRS Wiki API client, and
+        the page titles are added in the same order as the list of categories.
         """
-        for category in self.categories:
-            self.extract_page_titles_from_category(category)
+        for page_titles in self.client.map(self._query_page_titles_from_category, self.categories):
+            for page_title in page_titles:
+                self.page_titles[page_title] = None
 
     def extract_page_titles_from_category(self, category: str):
         """Query a specific category in the OSRS Wiki and populate a list of page tiles.
@@ -106,58 +114,69 @@ class WikiPageTitles:
 
         :param category: A string representing the OSRS Wiki category to extract.
         """
+        for page_title in self._query_page_titles_from_category(category):
+            self.page_titles[page_title] = None
+
+    def _query_page_titles_from_category(self, category: str) -> List[str]:
+        """Query a specific category in the OSRS Wiki and return a list of page titles.
+
+        When a checkpoint is used, each page of category members is saved, and
+        the query resumes from the last saved 'continue' entry.
+
+        :param category: A string representing the OSRS Wiki category to extract.
+        :return: A list of page titles in the category.
+        """
+        page_titles = list()
+        last_continue = None
+        if self.checkpoint:
+            page_titles = list(self.checkpoint.category_titles[category])
+            if self.checkpoint.is_category_complete(category):
+                return page_titles
+            last_continue = self.checkpoint.category_continue[category]
+
         # Start construct MediaWiki request
         request = {'list': 'categorymembers'}
 
-        for result in self._extract_page_titles_from_category_callback(request, category):
+        for result in self._extract_page_titles_from_category_callback(request, category, last_continue):
             # Process JSON result data
-            for entry in result['categorymembers']:
+            result_page_titles = list()
+            for entry in result['query']['categorymembers']:
                 page_title = entry["title"]
                 if page_title.startswith("File:"):
                     continue
 
                 # Log the page title, and append to list
-                self.page_titles[page_title] = None
+                result_page_titles.append(page_title)
+
+            page_titles.extend(result_page_titles)
+            if self.checkpoint:
+                self.checkpoint.save_category(category, result_page_titles, result.get('continue'))
+
+        return page_titles
 
-    def _extract_page_titles_from_category_callback(self, request: Dict, category: str):
+    def _extract_page_titles_from_category_callback(self, request: Dict, category: str,
+                                                    last_continue: Optional[Dict] = None):
         """Query callback function for OSRS Wiki category query.
 
         A callback function for using MediaWiki generators. Since the category query is a
         list function, you can use a generator to continue queries when the returned data
-        is longer than the maximum returned query.
+        is longer than the maximum returned query. Each result with a "query" entry is
+        returned, including the 'continue' entry of the next query.
 
         :param request: A dictionary to be populated with the OSRS Wiki API request.
         :param category: A string representing the OSRS Wiki category to extract.
+        :param last_continue: A 'continue' entry to start the query from.
         """
         request['cmtitle'] = 'Category:' + category
         request['action'] = 'query'
         request['format'] = 'json'
         request['cmlimit'] = '500'
 
-        last_continue = {}
-
-        while True:
-            # Clone original request
-            req = request.copy()
-
-            # Insert the 'continue' section to the request
-            req.update(last_continue)
-
-            # Perform HTTP GET request
-            try:
-                result = requests.get(self.base_url,
-                                      headers=self.custom_agent,
-                                      params=req).json()
-            except requests.exceptions.RequestException as e:
-                raise SystemExit(">>> ERROR: Get request error. Exiting.") from e
-
+        for result in self.client.query(request, last_continue):
             # Handle HTTP response
             if 'query' in result:
-                # If "query" entry is in JSON result, extract the query response
-                yield result['query']
-            if 'continue' not in result:
-                # If "continue" entry is not JSON result, there are no more page titles in category
-                break
+                # If "query" entry is in JSON result, return the query response
+                yield result
             if 'errors' in result:
                 print(result['errors'])
                 break
@@ -165,9 +184,6 @@ class WikiPageTitles:
                 print(result['warnings'])
                 break
 
-            # Update the last fetched page title to continue query
-            last_continue = result['continue']
-
     def extract_last_revision_timestamp(self, page_titles_string: str) -> Dict:
         """Extract the last revision timestamp for page titles from OSRS Wiki.
 
@@ -182,6 +198,40 @@ class WikiPageTitles:
         :param page_titles_string: A string of pipe separated wiki page titles.
         :return pages_revision_data:
         """
+        pages_revision_data = self._query_last_revision_timestamp(page_titles_string)
+        self._update_last_revision_timestamp(pages_revision_data)
+        return pages_revision_data
+
+    def extract_last_revision_timestamps(self, batch_size: int = 50):
+        """Extract the last revision timestamp for all page titles from OSRS Wiki.
+
+        The page titles are split into batches of pipe separated page titles, and
+        the batches are queried concurrently using the OSRS Wiki API client. Only
+        page titles without a revision timestamp (or a timestamp saved in the
+        checkpoint) are queried.
+
+        :param batch_size: The number of page titles per API query, the maximum is 50.
+        """
+        if self.checkpoint:
+            for page_title, page_revision_date in self.checkpoint.timestamps.items():
+                if page_title in self.page_titles:
+                    self.page_titles[page_title] = page_revision_date
+
+        page_titles = [page_title for page_title, page_revision_date in self.page_titles.items()
+                       if page_revision_date is None]
+        page_titles_strings = ["|".join(page_titles[start:start + batch_size])
+                               for start in range(0, len(page_titles), batch_size)]
+        for pages_revision_data in self.client.map(self._query_last_revision_timestamp, page_titles_strings):
+            timestamps = self._update_last_revision_timestamp(pages_revision_data)
+            if self.checkpoint:
+                self.checkpoint.save_timestamps(timestamps)
+
+    def _query_last_revision_timestamp(self, page_titles_string: str) -> Dict:
+        """Query the last revision timestamp for page titles from OSRS Wiki.
+
+        :param page_titles_string: A string of pipe separated wiki page titles.
+        :return pages_revision_data: The returned page revision data, keyed by page ID.
+        """
         # Construct query for fetching page revisions
         request = {
             'action': 'query',
@@ -191,12 +241,17 @@ class WikiPageTitles:
             'rvprop': 'timestamp'
         }
 
-        page_data = requests.get(self.base_url,
-                                 headers=self.custom_agent,
-                                 params=request).json()
+        page_data = self.client.get(request)
+        return page_data["query"]["pages"]
 
+    def _update_last_revision_timestamp(self, pages_revision_data: Dict) -> Dict[str, str]:
+        """Add the last revision timestamp of queried page titles to the page titles.
+
+        :param pages_revision_data: The returned page revision data, keyed by page ID.
+        :return: A dictionary of the queried page titles to last revision timestamp.
+        """
+        timestamps = dict()
         # Loop returned page revision data
-        pages_revision_data = page_data["query"]["pages"]
         for page_id in pages_revision_data:
             # Extract page title from the response
             page_title = pages_revision_data[page_id]["title"]
@@ -204,8 +259,9 @@ class WikiPageTitles:
             page_revision_date = pages_revision_data[page_id]["revisions"][0]["timestamp"]
             # Add revision date to page_titles dict
             self.page_titles[page_title] = page_revision_date
+            timestamps[page_title] = page_revision_date
 
-        return pages_revision_data
+        return timestamps
 
     def export_page_titles_in_json(self, out_file_name: str):
         """Export all extracted page titles and revision timestamp to a JSON file.
@@ -0,0 +1,195 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Extract the pages that have been edited, created, moved or deleted on the OSRS
+Wiki since a sync point, using the MediaWiki recent changes feed. This is used
+to update extracted wiki data without querying every page title of a category.
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+import logging
+import functools
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from scripts.wiki.wiki_api_client import WikiApiClient, make_client
+
+LOG = logging.getLogger(__name__)
+
+
+def load_sync_point(in_file_name: Path) -> Optional[str]:
+    """Load the sync point (the time of the last extraction) of extracted wiki data.
+
+    :param in_file_name: The sync point JSON file.
+    :return: The sync point timestamp (in ISO 8601 format), or None if there is no sync point.
+    """
+    in_file_name = Path(in_file_name)
+    if not in_file_name.exists():
+        return None
+    with open(in_file_name) as f:
+        return json.load(f)["timestamp"]
+
+
+def save_sync_point(out_file_name: Path, timestamp: str):
+    """Save the sync point (the time of the last extraction) of extracted wiki data.
+
+    :param out_file_name: The sync point JSON file.
+    :param timestamp: The sync point timestamp (in ISO 8601 format).
+    """
+    with open(out_file_name, mode='w') as out_file:
+        out_file.write(json.dumps({"timestamp": timestamp}, indent=4))
+
+
+def check_query_result(result: Dict) -> Dict:
+    """Check an OSRS Wiki API query response, so a failed query is never treated as an empty result.
+
+    :param result: The JSON response.
+    :return: The 'query' section of the response.
+    :raises SystemExit: The response is an API error, or has no 'query' section.
+    """
+    if 'error' in result:
+        raise SystemExit(f">>> ERROR: API request error: {result['error']}. Exiting.")
+    if 'query' not in result:
+        raise SystemExit(f">>> ERROR: API response has no query results: {result}. Exiting.")
+    return result['query']
+
+
+class WikiRecentChanges:
+    """This class handles extraction of recently changed pages using an OSRS Wiki API query.
+
+    After extract_recent_changes, changed_titles contains the pages that were
+    edited, created, restored or moved to (and need wiki text extracted), and
+    deleted_titles contains the pages that were deleted or moved from.
+
+    :param base_url: The OSRS Wiki URL used for API queries.
+    :param user_agent: A custom user-agent name to be used for the API request.
+    :param user_email: A custom user-agent email to be used for the API request.
+    :param client: A shared OSRS Wiki API client, or None to use the default client.
+    """
+    def __init__(self, base_url: str, user_agent: str, user_email: str, client: Optional[WikiApiClient] = None):
+        self.base_url = base_url
+        self.client = make_client(base_url, user_agent, user_email, client)
+        self.changed_titles: Dict[str, None] = dict()
+        self.deleted_titles: Set[str] = set()
+
+    def is_available(self, since: str) -> bool:
+        """Check if the recent changes feed includes every change since a sync point.
+
+        The OSRS Wiki only keeps recent changes for a limited time. If the oldest
+        recent change is newer than the sync point, some changes are missing.
+
+        :param since: The sync point timestamp (in ISO 8601 format).
+        :return: A boolean to indicate if the recent changes feed starts before the sync point.
+        :raises SystemExit: The API request failed.
+        """
+        request = {
+            'action': 'query',
+            'list': 'recentchanges',
+            'rcdir': 'newer',
+            'rcprop': 'timestamp',
+            'rclimit': '1',
+            'format': 'json'
+        }
+        result = self.client.get(request)
+        recent_changes = check_query_result(result).get('recentchanges', list())
+        return bool(recent_changes) and recent_changes[0]['timestamp'] <= since
+
+    def extract_recent_changes(self, since: str):
+        """Extract the pages in the main namespace that have changed since a sync point.
+
+        The changes are processed in chronological order, so a page that was
+        deleted and then restored (or created again) is a changed page.
+
+        :param since: The sync point timestamp (in ISO 8601 format).
+        :raises SystemExit: An API request failed.
+        """
+        request = {
+            'action': 'query',
+            'list': 'recentchanges',
+            'rcstart': since,
+            'rcdir': 'newer',
+            'rcnamespace': '0',
+            'rctype': 'edit|new|log',
+            'rcprop': 'title|timestamp|loginfo',
+            'rclimit': '500',
+            'format': 'json'
+        }
+
+        for result in self.client.query(request):
+            for change in check_query_result(result)['recentchanges']:
+                page_title = change['title']
+                if change['type'] in ('edit', 'new'):
+                    self._changed(page_title)
+                elif change.get('logtype') == 'move':
+                    self._deleted(page_title)
+                    self._changed(change['logparams']['target_title'])
+                elif change.get('logtype') == 'delete' and change.get('logaction') == 'delete':
+                    self._deleted(page_title)
+                elif change.get('logtype') == 'delete' and change.get('logaction') == 'restore':
+                    self._changed(page_title)
+
+    def _changed(self, page_title: str):
+        self.changed_titles[page_title] = None
+        self.deleted_titles.discard(page_title)
+
+    def _deleted(self, page_title: str):
+        self.changed_titles.pop(page_title, None)
+        self.deleted_titles.add(page_title)
+
+    def filter_category_members(self, page_titles: List[str], categories: List[str]) -> Set[str]:
+        """Find the page titles that are members of any of the provided categories.
+
+        :param page_titles: A list of page titles.
+        :param categories: A list of OSRS Wiki categories.
+        :return: The page titles that are category members.
+        :raises SystemExit: An API request failed.
+        """
+        request_categories = "|".join(f"Category:{category}" for category in categories)
+        page_titles_strings = ["|".join(page_titles[start:start + 50]) for start in range(0, len(page_titles), 50)]
+
+        query_category_members = functools.partial(self._query_category_members, request_categories=request_categories)
+
+        members = set()
+        for page_titles_members in self.client.map(query_category_members, page_titles_strings):
+            members.update(page_titles_members)
+        return members
+
+    def _query_category_members(self, page_titles_string: str, request_categories: str) -> Set[str]:
+        """Query which of a batch of page titles are members of any of the provided categories.
+
+        :param page_titles_string: A string of pipe separated wiki page titles.
+        :param request_categories: A string of pipe separated category page titles.
+        :return: The page titles that are category members.
+        """
+        request = {
+            'action': 'query',
+            'prop': 'categories',
+            'clcategories': request_categories,
+            'cllimit': 'max',
+            'titles': page_titles_string,
+            'format': 'json'
+        }
+
+        members = set()
+        for result in self.client.query(request):
+            for page in check_query_result(result).get('pages', dict()).values():
+                if page.get('categories'):
+                    members.add(page['title'])
+        return members
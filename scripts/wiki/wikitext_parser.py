@@ -42,6 +42,14 @@ Extract the item IDs from an infobox, including version support. Returns a dicti
 of item ID -> version number. For example: {12647: '1', 12654: '2'}
     versioned_ids = infobox_parser.extract_infobox_ids()
 
+4) InfoboxCache: A cache of the infobox templates extracted from wikitext pages,
+keyed by a hash of the page wikitext, so that unchanged pages are only parsed
+once. The cache can be saved to, and loaded from, a JSON file. Example usage:
+    infobox_cache = InfoboxCache(Path("infobox-cache-items.json"))
+    infobox_parser = WikitextTemplateParser(wikitext, infobox_cache)
+    has_infobox = infobox_parser.extract_infobox("infobox item")
+    infobox_cache.save()
+
 Copyright (c) 2019, PH01L
 
 ###############################################################################
@@ -57,15 +65,25 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
+import os
 import json
+import hashlib
 import logging
 from pathlib import Path
-from typing import Union, List, Dict
+from typing import Union, List, Dict, NamedTuple, Optional
 
 import mwparserfromhell
 
+from scripts.wiki import page_text_store
+
 logger = logging.getLogger(__name__)
 
+# Bump this number if the layout of the infobox cache file changes
+INFOBOX_CACHE_VERSION = 1
+
+# Only templates with this text in the name are stored in the infobox cache
+INFOBOX_TEMPLATE_TYPE = "infobox"
+
 
 def extract_wikitext_template(wikitext: str, template_type: str, multiple: bool = True) -> List:
     """Parse raw wikitext and extract a specified template.
@@ -97,7 +115,22 @@ def extract_wikitext_template(wikitext: str, template_type: str, multiple: bool
         return templates
 
     # Loop through templates in wikicode from wiki page...
-    filtered_templates = wikicode.filter_templates()
+    return filter_wikitext_templates(wikicode.filter_templates(), template_type, multiple)
+
+
+def filter_wikitext_templates(filtered_templates: List, template_type: str, multiple: bool = True) -> List:
+    """Extract a specified template from already parsed wikitext templates.
+
+    This is the same as `extract_wikitext_template`, for wikitext that is
+    already parsed, so the wikitext can be parsed once and searched for
+    multiple template types.
+
+    :param filtered_templates: The templates from a mwparserfromhell filter_templates call.
+    :param template_type: The type of template to extract.
+    :param multiple: whether or not to extract multiple templates, default is True.
+    :return: A list of mwpaserfromhell templates.
+    """
+    templates = list()
     for template in filtered_templates:
         template_name = template.name.strip()
         template_name = template_name.lower()
@@ -129,8 +162,7 @@ class WikitextIDParser:
         raw wikitext.
         """
         # Read in the wiki text data dump
-        with open(self.wikitext_file_path) as wikitext_file:
-            wikitext_dump = json.load(wikitext_file)
+        wikitext_dump = page_text_store.load_page_text(self.wikitext_file_path)
 
         # Loop all items in the OSRS Wiki data dump
         for name, wikitext in wikitext_dump.items():
@@ -157,9 +189,175 @@ class WikitextIDParser:
                     logger.debug("process_osrswiki_data_dump: Did NOT find infobox template...")
 
 
+class InfoboxParameter(NamedTuple):
+    """A single parameter of a cached infobox template."""
+    name: str
+    value: str
+
+
+class InfoboxTemplate:
+    """This class is a lightweight, read-only copy of an extracted infobox template.
+
+    The parameter values are the raw wikitext strings from the mwparserfromhell
+    template. The `get` and `has` methods behave the same as a mwparserfromhell
+    template, so a cached template can be used in place of a parsed template.
+
+    :param name: The template name.
+    :param params: A dictionary of stripped parameter name to raw parameter value.
+    """
+    def __init__(self, name: str, params: Dict[str, str]):
+        self.name = name
+        self.params = params
+
+    @classmethod
+    def from_template(cls, template: mwparserfromhell.nodes.template.Template) -> "InfoboxTemplate":
+        """Copy the name and parameters of a mwparserfromhell template.
+
+        If a parameter name is repeated, the last value is used (the same as
+        the MediaWiki parser, and mwparserfromhell `get`).
+
+        :param template: A mediawiki wiki text template.
+        :return: A cached infobox template.
+        """
+        params = dict()
+        for param in template.params:
+            params[str(param.name).strip()] = str(param.value)
+        return cls(str(template.name), params)
+
+    def get(self, name: str) -> InfoboxParameter:
+        """Get the parameter with the specified name.
+
+        :param name: The parameter name.
+        :return: The parameter, with `name` and `value` properties.
+        :raises ValueError: No parameter has this name.
+        """
+        name = str(name).strip()
+        try:
+            return InfoboxParameter(name, self.params[name])
+        except KeyError:
+            raise ValueError(name)
+
+    def has(self, name: str) -> bool:
+        """Determine if the template has a parameter with the specified name.
+
+        :param name: The parameter name.
+        :return: A boolean to indicate if the parameter exists.
+        """
+        return str(name).strip() in self.params
+
+    def __str__(self) -> str:
+        params = "".join(f"|{name}={value}" for name, value in self.params.items())
+        return f"{{{{{self.name}{params}}}}}"
+
+
+class InfoboxCache:
+    """This class caches the infobox templates extracted from wikitext pages.
+
+    Each page is keyed by the SHA256 hash of the wikitext, and stores every
+    infobox template on the page, in the same order as mwparserfromhell
+    `filter_templates`. A page is only parsed the first time it is seen, so pages
+    shared by many items or monsters (such as versioned infoboxes) are parsed
+    once per build, and unchanged pages are not parsed again in later builds.
+
+    :param path_to_cache: The path to the cache JSON file, or None for an in memory cache.
+    """
+    def __init__(self, path_to_cache: Optional[Path] = None):
+        self.path = path_to_cache
+        self.header = {
+            "version": INFOBOX_CACHE_VERSION,
+            "mwparserfromhell": mwparserfromhell.__version__
+        }
+        self.pages: Dict[str, List[InfoboxTemplate]] = dict()
+        self.new_pages: Dict[str, List[InfoboxTemplate]] = dict()
+        self.used_pages = set()
+
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        """Return the count of the total number of cached pages.
+
+        :return: The total number of cached pages.
+        """
+        return len(self.pages)
+
+    def extract_infobox(self, wikitext: str, template_type: str) -> Optional[InfoboxTemplate]:
+        """Get the first infobox template of the specified type from the wikitext.
+
+        :param wikitext: The raw wikitext.
+        :param template_type: The type of infobox to extract, must include `infobox`.
+        :return: The cached infobox template, or None if the page has no matching template.
+        """
+        page_hash = hashlib.sha256(wikitext.encode("utf-8")).hexdigest()
+        try:
+            templates = self.pages[page_hash]
+        except KeyError:
+            templates = [InfoboxTemplate.from_template(template)
+                         for template in extract_wikitext_template(wikitext, INFOBOX_TEMPLATE_TYPE)]
+            self.pages[page_hash] = templates
+            self.new_pages[page_hash] = templates
+        self.used_pages.add(page_hash)
+
+        for template in templates:
+            if template_type in template.name.strip().lower():
+                return template
+        return None
+
+    def pop_new_pages(self) -> Dict[str, List[InfoboxTemplate]]:
+        """Get the pages added to the cache since the last call, such as in a worker process.
+
+        :return: A dictionary of page hash to the page infobox templates.
+        """
+        new_pages = self.new_pages
+        self.new_pages = dict()
+        return new_pages
+
+    def update(self, pages: Dict[str, List[InfoboxTemplate]]) -> None:
+        """Add pages to the cache, such as the new pages from a worker process.
+
+        :param pages: A dictionary of page hash to the page infobox templates.
+        """
+        self.pages.update(pages)
+        self.used_pages.update(pages)
+
+    def save(self, prune: bool = False) -> None:
+        """Save the cache, replacing the previous cache file.
+
+        :param prune: Whether to remove the pages not used since the cache was loaded.
+        """
+        pages = self.pages
+        if prune:
+            pages = {page_hash: templates for page_hash, templates in pages.items()
+                     if page_hash in self.used_pages}
+
+        cache = {
+            "header": self.header,
+            "pages": {page_hash: [(template.name, template.params) for template in templates]
+                      for page_hash, templates in pages.items()}
+        }
+
+        temp_file_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_file_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(temp_file_path, self.path)
+
+    def _load(self) -> None:
+        """Load the previous cache, if it exists and the header matches."""
+        try:
+            with open(self.path) as f:
+                cache = json.load(f)
+            if cache["header"] == self.header:
+                self.pages = {page_hash: [InfoboxTemplate(name, params) for name, params in templates]
+                              for page_hash, templates in cache["pages"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            # No usable cache, every page will be parsed
+            pass
+
+
 class WikitextTemplateParser:
-    def __init__(self, wikitext):
+    def __init__(self, wikitext, infobox_cache: Optional[InfoboxCache] = None):
         self.wikitext = wikitext  # the raw wikitext
+        self.infobox_cache = infobox_cache  # an optional cache of extracted infobox templates
         self.template = None  # the extacted template
         self.is_versioned = False  # is the template representing multiple entities
 
@@ -187,9 +385,21 @@ class WikitextTemplateParser:
         template. If there are multiple templates, only the first is used. This is
         usually fine, as there is only one infobox with a unique name per page.
 
+        If an infobox cache is set, the template is extracted from the cache, and
+        the wikitext is only parsed if the page is not already cached.
+
         :param template_type: The type of infobox to extract.
         :return: A boolean representing sucessful processing.
         """
+        page_wikitext = self.page_wikitext()
+        if self.infobox_cache is not None and page_wikitext is not None and INFOBOX_TEMPLATE_TYPE in template_type:
+            self.template = self.infobox_cache.extract_infobox(page_wikitext, template_type)
+            if not self.template:
+                logger.debug("extract_infobox: Did not find a matching template.")
+                return False
+            logger.debug("extract_infobox: Found a cached template.")
+            return True
+
         try:
             wikicode = mwparserfromhell.parse(self.wikitext)
         except KeyError:
@@ -222,6 +432,21 @@ class WikitextTemplateParser:
         # If we got this far, return true
         return True
 
+    def page_wikitext(self) -> Optional[str]:
+        """Helper method to get the raw page wikitext, used as the infobox cache key.
+
+        The wikitext is either the raw wikitext string of a page, or a processed
+        wikitext entry (from `processed-wikitext-*.json`), which is a list of the
+        wiki page name, version number and wikitext.
+
+        :return: The raw page wikitext, or None if the wikitext is not a known format.
+        """
+        if isinstance(self.wikitext, str):
+            return self.wikitext
+        if isinstance(self.wikitext, (list, tuple)) and len(self.wikitext) == 3 and isinstance(self.wikitext[2], str):
+            return self.wikitext[2]
+        return None
+
     def determine_infobox_versions(self) -> bool:
         """Determine if the infobox template is versioned.
 
@@ -18,6 +18,11 @@ REQUIRED = [
     'dataclasses;python_version<"3.7"'
 ]
 
+# Name of any optional third party packages, for example: pip install osrsbox[numpy]
+EXTRAS = {
+    'numpy': ['numpy'],
+}
+
 # Import the README and use it as the long-description.
 readme_location = Path(__file__).parent
 readme_location = Path(readme_location / "README.md")
@@ -37,6 +42,7 @@ setup(
     url=URL,
     packages=find_packages(),
     install_requires=REQUIRED,
+    extras_require=EXTRAS,
     include_package_data=True,
     license='GPLv3',
     classifiers=[
@@ -18,8 +18,14 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
-import pytest
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
 
 
 PROJECT_ROOT_PATH = Path(__file__).absolute().parent.parent
@@ -34,3 +40,72 @@ def path_to_docs_dir() -> Path:
 @pytest.fixture(scope="session")
 def path_to_cache_dir() -> Path:
     return TEST_PATH / "cache"
+
+
+class StandInWiki:
+    """A local stand-in for the OSRS Wiki API, which replays recorded API responses.
+
+    Each recorded exchange is a dictionary with the "request" query parameters,
+    the JSON "response" and the HTTP "status". An exchange with a "repeat" count
+    is only replayed that many times. A request with no recorded exchange is
+    passed to the handler function (if set), or answered with a MediaWiki style
+    error. Connections are kept alive, and the client port of each request is
+    recorded.
+    """
+    def __init__(self):
+        self.exchanges: List[Dict] = list()
+        self.requests: List[Dict] = list()
+        self.client_ports: List[int] = list()
+        self.handler: Optional[Callable[[Dict], Dict]] = None
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api.php"
+
+    def record(self, request: Dict, response: Dict, status: int = 200, repeat: Optional[int] = None):
+        self.exchanges.append({"request": request, "response": response, "status": status, "repeat": repeat})
+
+    def respond(self, request: Dict, client_port: int = 0):
+        with self.lock:
+            self.requests.append(request)
+            self.client_ports.append(client_port)
+            for exchange in self.exchanges:
+                if exchange["request"] != request or exchange["repeat"] == 0:
+                    continue
+                if exchange["repeat"] is not None:
+                    exchange["repeat"] -= 1
+                return exchange["status"], exchange["response"]
+        if self.handler is not None:
+            return 200, self.handler(request)
+        return 200, {"error": {"code": "unrecorded", "info": f"No recorded response for: {request}"}}
+
+    def _make_handler(self):
+        stand_in_wiki = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                request = dict(parse_qsl(urlparse(self.path).query))
+                status, response = stand_in_wiki.respond(request, self.client_address[1])
+                body = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stand_in_wiki() -> StandInWiki:
+    wiki = StandInWiki()
+    thread = threading.Thread(target=wiki.server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield wiki
+    wiki.server.shutdown()
+    wiki.server.server_close()
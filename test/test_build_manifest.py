@@ -0,0 +1,95 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.build_manifest
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import types
+
+from builders import build_manifest
+from builders.build_manifest import BuildManifest, fingerprint, source_fingerprint
+
+HEADER = {"schema": fingerprint({"id": {"type": "integer"}}), "source": "abc123"}
+
+
+def test_fingerprint():
+    assert fingerprint({"a": 1, "b": [1, 2]}, None) == fingerprint({"b": [1, 2], "a": 1}, None)
+    assert fingerprint({"a": 1}, None) != fingerprint({"a": 1}, "")
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_source_fingerprint(tmp_path):
+    module_file_paths = [tmp_path / "module_a.py", tmp_path / "module_b.py"]
+    for module_file_path in module_file_paths:
+        module_file_path.write_text("VALUE = 1\n")
+    modules = [types.SimpleNamespace(__file__=str(module_file_path)) for module_file_path in module_file_paths]
+
+    previous_fingerprint = source_fingerprint(*modules)
+    assert source_fingerprint(*modules) == previous_fingerprint
+    module_file_paths[1].write_text("VALUE = 2\n")
+    assert source_fingerprint(*modules) != previous_fingerprint
+
+
+def test_manifest_reuse(tmp_path):
+    path_to_manifest = tmp_path / "items-build-manifest.json"
+    manifest = BuildManifest(path_to_manifest, HEADER)
+    assert not manifest.is_unchanged("4151", "fingerprint-1")
+    manifest.update("4151", "fingerprint-1")
+    manifest.update("4152", "fingerprint-2", exported=False)
+    manifest.save()
+
+    manifest = BuildManifest(path_to_manifest, dict(HEADER))
+    assert manifest.is_unchanged("4151", "fingerprint-1")
+    assert manifest.was_exported("4151")
+    assert manifest.is_unchanged("4152", "fingerprint-2")
+    assert not manifest.was_exported("4152")
+
+    # An entity with changed inputs, or a new entity, is rebuilt
+    assert not manifest.is_unchanged("4151", "fingerprint-3")
+    assert not manifest.is_unchanged("4153", "fingerprint-1")
+
+    # Only the entities updated in this build are saved
+    manifest.update("4151", "fingerprint-3")
+    manifest.save()
+    manifest = BuildManifest(path_to_manifest, HEADER)
+    assert manifest.is_unchanged("4151", "fingerprint-3")
+    assert not manifest.is_unchanged("4152", "fingerprint-2")
+
+
+def test_manifest_invalidation(tmp_path, monkeypatch):
+    path_to_manifest = tmp_path / "monsters-build-manifest.json"
+    manifest = BuildManifest(path_to_manifest, HEADER)
+    manifest.update("2", "fingerprint-1")
+    manifest.save()
+    assert BuildManifest(path_to_manifest, HEADER).is_unchanged("2", "fingerprint-1")
+
+    # A full build, or a change to the shared inputs, rebuilds every entity
+    assert not BuildManifest(path_to_manifest, HEADER, full=True).is_unchanged("2", "fingerprint-1")
+    assert not BuildManifest(path_to_manifest, dict(HEADER, source="def456")).is_unchanged("2", "fingerprint-1")
+    assert not BuildManifest(path_to_manifest, dict(HEADER, items="abc")).is_unchanged("2", "fingerprint-1")
+
+    monkeypatch.setattr(build_manifest, "MANIFEST_VERSION", build_manifest.MANIFEST_VERSION + 1)
+    assert not BuildManifest(path_to_manifest, HEADER).is_unchanged("2", "fingerprint-1")
+    monkeypatch.undo()
+
+    # An unreadable manifest rebuilds every entity
+    path_to_manifest.write_text("{")
+    assert not BuildManifest(path_to_manifest, HEADER).is_unchanged("2", "fingerprint-1")
+    assert not BuildManifest(tmp_path / "missing.json", HEADER).is_unchanged("2", "fingerprint-1")
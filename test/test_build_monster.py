@@ -0,0 +1,83 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.monsters.build_monster
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import random
+from types import SimpleNamespace
+
+from builders.monsters.build_monster import build_item_name_index
+
+
+def item(item_id, name, wiki_name):
+    return SimpleNamespace(id=item_id, name=name, wiki_name=wiki_name)
+
+
+def scan_item(all_db_items, name):
+    """The original drop item lookup: the first item in the database with a matching name or wiki_name."""
+    for db_item in all_db_items:
+        if db_item.name == name or db_item.wiki_name == name:
+            return db_item
+    return None
+
+
+def check_same_as_scan(all_db_items, names):
+    item_name_index = build_item_name_index(all_db_items)
+    for name in names:
+        assert item_name_index.get(name) is scan_item(all_db_items, name), name
+
+
+def test_build_item_name_index():
+    all_db_items = [
+        item(526, "Bones", "Bones"),
+        item(527, "Bones", "Bones"),
+        # The wiki_name of an item is the name of a later item
+        item(1, "Toolkit", "Coins"),
+        item(995, "Coins", "Coins"),
+        # The name of an item is the wiki_name of a later item
+        item(2, "Ashes", None),
+        item(592, "Dust", "Ashes"),
+        # Items with the same name and different wiki names
+        item(12647, "Kalphite princess", "Kalphite princess (Crawling)"),
+        item(12654, "Kalphite princess", "Kalphite princess (Airborne)"),
+        item(12655, "Airborne", "Kalphite princess (Crawling)")
+    ]
+    item_name_index = build_item_name_index(all_db_items)
+    assert item_name_index["Bones"].id == 526
+    assert item_name_index["Coins"].id == 1
+    assert item_name_index["Ashes"].id == 2
+    assert item_name_index["Dust"].id == 592
+    assert item_name_index["Kalphite princess (Crawling)"].id == 12647
+    assert item_name_index["Kalphite princess (Airborne)"].id == 12654
+    assert item_name_index["Airborne"].id == 12655
+    assert None not in item_name_index
+
+    # Drop item names are always strings, so None is not looked up
+    names = {db_item.name for db_item in all_db_items} | {db_item.wiki_name for db_item in all_db_items}
+    check_same_as_scan(all_db_items, (names - {None}) | {"Missing item"})
+
+
+def test_build_item_name_index_random():
+    # Names and wiki names are chosen from a small set, so most names collide
+    rng = random.Random(1234)
+    names = [f"Item {number}" for number in range(20)]
+    all_db_items = [item(item_id, rng.choice(names), rng.choice(names + [None])) for item_id in range(200)]
+    check_same_as_scan(all_db_items, names + ["Missing item"])
@@ -0,0 +1,84 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.change_report
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+
+from builders.change_report import ChangeReport, change_record, diff_fields
+
+OLD = {
+    "id": 4151,
+    "name": "Abyssal whip",
+    "cost": 120001,
+    "equipment": {"attack_slash": 82, "slot": "weapon", "requirements": {"attack": 70}},
+    "drops": [{"id": 592, "rarity": 1.0}, {"id": 995, "rarity": 0.5}],
+    "removed_property": True
+}
+
+NEW = {
+    "id": 4151,
+    "name": "Abyssal whip",
+    "cost": 120002,
+    "equipment": {"attack_slash": 82, "slot": "weapon", "requirements": {"attack": 75}},
+    "drops": [{"id": 995, "rarity": 0.25}, {"id": 592, "rarity": 1.0}],
+    "added_property": None
+}
+
+
+def test_diff_fields():
+    changes = diff_fields(OLD, NEW)
+    assert changes == [
+        {"path": "cost", "type": "changed", "old": 120001, "new": 120002},
+        {"path": "equipment.requirements.attack", "type": "changed", "old": 70, "new": 75},
+        {"path": "drops", "type": "list_changed",
+         "added": [{"id": 995, "rarity": 0.25}], "removed": [{"id": 995, "rarity": 0.5}]},
+        {"path": "added_property", "type": "added", "new": None},
+        {"path": "removed_property", "type": "removed", "old": True}
+    ]
+
+
+def test_diff_fields_ignores_list_order():
+    old = dict(OLD, drops=list(reversed(OLD["drops"])))
+    assert diff_fields(old, OLD) == list()
+
+
+def test_change_record():
+    assert change_record(4151, "Abyssal whip", OLD, dict(OLD)) is None
+    assert change_record(4151, "Abyssal whip", None, NEW) == {"id": 4151, "name": "Abyssal whip",
+                                                              "status": "new", "new": NEW}
+    record = change_record(4151, "Abyssal whip", OLD, NEW)
+    assert record["status"] == "changed"
+    assert len(record["changes"]) == 5
+
+
+def test_change_report(tmp_path):
+    path_to_report = tmp_path / "items-change-report.jsonl"
+    change_report = ChangeReport(path_to_report)
+    change_report.add(change_record(4151, "Abyssal whip", OLD, NEW))
+    change_report.add(change_record(4151, "Abyssal whip", OLD, OLD))
+    change_report.add(change_record(4152, "Abyssal whip", None, NEW))
+    change_report.close()
+
+    with open(path_to_report) as f:
+        records = [json.loads(line) for line in f]
+    assert [(record["id"], record["status"]) for record in records] == [(4151, "changed"), (4152, "new")]
+    assert change_report.counts == {"changed": 1, "new": 1}
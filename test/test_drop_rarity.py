@@ -0,0 +1,79 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: osrsbox.monsters_api.drop_rarity
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+from fractions import Fraction
+
+import pytest
+
+from builders.infobox_cleaner import clean_drop_rarity
+from osrsbox.monsters_api.drop_rarity import RARITY_CACHE_SIZE, evaluate_rarity
+from osrsbox.monsters_api.monster_drop import MonsterDrop
+
+
+@pytest.mark.parametrize("expression,base,expected", [
+    ("1/128", None, Fraction(1, 128)),
+    ("3/513", None, Fraction(3, 513)),
+    ("1/9.294", None, Fraction(1000, 9294)),
+    ("(22.5/250)/16", None, Fraction(9, 1600)),
+    ("1 - 2 * -3", None, Fraction(7)),
+    ("1/(1800 / 3500) round 1", None, Fraction(19, 10)),
+    ("12.25 round 1", None, Fraction(123, 10)),
+    ("100/3 round 0", None, Fraction(33)),
+    ("1/3 round 15", None, Fraction(333333333333333, 10 ** 15)),
+    ("#expr:1/(40*#var:herbbase) round 1", Fraction(9, 123 * 128), Fraction(437, 10)),
+    ("1/(5*#var:uht)round2", "(22.5/250)/16", Fraction(3556, 100)),
+])
+def test_evaluate_rarity(expression, base, expected):
+    rarity = evaluate_rarity(expression, base)
+    assert rarity.fraction == expected
+    assert rarity.value == float(expected)
+
+
+@pytest.mark.parametrize("expression", ["", "1/", "1/0", "(1/2", "1/#var:herbbase", "__import__('os')", "1/2)",
+                                        "1/128 round 999999999", "1/128 round 2.5", "1/128 round -1",
+                                        "1/128 round 16"])
+def test_evaluate_rarity_invalid(expression):
+    with pytest.raises(ValueError):
+        evaluate_rarity(expression)
+
+
+def test_evaluate_rarity_cache_size():
+    for denominator in range(1, RARITY_CACHE_SIZE + 100):
+        evaluate_rarity(f"1/{denominator}")
+    assert evaluate_rarity.cache_info().currsize <= RARITY_CACHE_SIZE
+
+
+def test_clean_drop_rarity():
+    assert clean_drop_rarity("Always") == 1.0
+    assert clean_drop_rarity("~1/128") == 1/128
+    assert clean_drop_rarity("{{#expr:1/(1800 / 3500) round 1}}") is None
+    assert clean_drop_rarity("1/{{#expr:1/(40*{{#var:herbbase}}) round 1}}", Fraction(9, 123 * 128)) == 10/437
+    assert clean_drop_rarity("Unknown") is None
+    assert clean_drop_rarity("1/{{#expr:128 round 999999999}}") is None
+    assert clean_drop_rarity("1/{{#expr:128 round 2.5}}") is None
+
+
+def test_monster_drop_rarity():
+    assert MonsterDrop(id=592, name="Ashes", rarity="1.0").rarity == 1.0
+    assert MonsterDrop(id=4151, name="Abyssal whip", rarity="1/512").rarity == 0.001953125
+    assert MonsterDrop(id=4151, name="Abyssal whip", rarity=0.001953125).rarity == 0.001953125
@@ -0,0 +1,83 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.monsters.drop_tables
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import mwparserfromhell
+import pytest
+
+from builders.monsters import drop_tables
+
+WIKITEXT = """
+{{DropsTableHead}}
+{{DropsLine|name=Bones|quantity=1|rarity=Always}}
+{{DropsTableBottom}}
+{{HerbDropTable2|23/128|1-2}}
+{{TreeHerbSeedDropTable2|2/101|multiplier=2-3}}
+"""
+
+
+@pytest.mark.parametrize("rarity", ["1", "1/4", "10/70", "113/4", "1/128 * 1/42.67"])
+def test_parse_rarity_factor(rarity):
+    assert drop_tables.parse_rarity_factor(rarity) == eval(rarity)
+
+
+def test_drop_tables_data():
+    for table_name, drop_table in drop_tables.DROP_TABLES.items():
+        assert callable(getattr(drop_tables, table_name))
+        assert len(drop_table.items) == len(drop_table.factors) == len(drop_table.rates)
+        for item, factor, rate in zip(drop_table.items, drop_table.factors, drop_table.rates):
+            assert list(item) == ["id", "name", "members", "quantity", "noted", "rarity", "drop_requirements"]
+            assert factor is not None or rate != drop_tables.BASE_RATE
+
+
+def test_herb():
+    templates = mwparserfromhell.parse(WIKITEXT).filter_templates()
+    items = drop_tables.herb(True, templates)
+    assert items["199"] == {
+        "id": 199,
+        "name": "Grimy guam leaf",
+        "members": True,
+        "quantity": "1-2",
+        "noted": False,
+        "rarity": 1/4 * 23/128,
+        "drop_requirements": None
+    }
+    assert len(items) == 11
+
+
+def test_treeseed():
+    templates = mwparserfromhell.parse(WIKITEXT).filter_templates()
+    items = drop_tables.treeseed(templates)
+    assert items["5295"]["quantity"] == "2-3"
+    assert items["5295"]["rarity"] == 1/8.333 * (2/101)
+    assert items[drop_tables.WATERMELON_SEED_ID]["quantity"] == "30-45"
+
+    # The drop table data is not changed by populating a drop table
+    assert drop_tables.DROP_TABLES["treeseed"].items[0]["quantity"] is None
+
+
+def test_catacombs():
+    templates = mwparserfromhell.parse("{{CatacombsDropTable|hitpoints=450|superior=yes}}").filter_templates()
+    items = drop_tables.catacombs("Skotizo", 450, templates)
+    assert items["19677"]["quantity"] == "1-4"
+    assert items["19677"]["rarity"] == 1 / (2/3 * 50)
+    assert items["19679"]["rarity"] == 1
@@ -0,0 +1,130 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.duplicate_index
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from builders.duplicate_index import DuplicateIndex
+from builders.items.build_item import CORRELATION_PROPERTIES as ITEM_CORRELATION_PROPERTIES
+from builders.monsters.build_monster import CORRELATION_PROPERTIES as MONSTER_CORRELATION_PROPERTIES
+
+
+# Use the item name as the wiki_name
+SAME_AS_NAME = object()
+
+
+def item(name, wiki_name=SAME_AS_NAME, noted=False, placeholder=False, equipable=False, equipable_by_player=False,
+         equipable_weapon=False):
+    if wiki_name is SAME_AS_NAME:
+        wiki_name = name
+    return SimpleNamespace(name=name, wiki_name=wiki_name, noted=noted, placeholder=placeholder,
+                           equipable=equipable, equipable_by_player=equipable_by_player,
+                           equipable_weapon=equipable_weapon)
+
+
+def scan_is_duplicate(entry, known_entries, correlation_properties):
+    """The original duplicate check: a cumulative scan of every known entry with the same name."""
+    correlation_results = {cprop: False for cprop in correlation_properties}
+    duplicate = False
+    for known_entry in known_entries:
+        if entry.name != known_entry.name:
+            continue
+        for cprop in correlation_results:
+            if getattr(entry, cprop) == getattr(known_entry, cprop):
+                correlation_results[cprop] = True
+        if all(value is True for value in correlation_results.values()):
+            duplicate = True
+    return duplicate
+
+
+def check_same_as_scan(entries, correlation_properties):
+    """Check every entry in build order, and compare the index to the original scan."""
+    known_entries = list()
+    duplicate_index = DuplicateIndex(correlation_properties)
+    duplicates = list()
+    for entry in entries:
+        duplicate = duplicate_index.is_duplicate(entry)
+        assert duplicate == scan_is_duplicate(entry, known_entries, correlation_properties), entry
+        duplicates.append(duplicate)
+        known_entries.append(entry)
+        duplicate_index.append(entry)
+    assert len(duplicate_index) == len(entries)
+    return duplicates
+
+
+@pytest.mark.parametrize("entries, expected_duplicates", [
+    # The same name and correlation properties
+    ([item("Logs"), item("Logs")], [False, True]),
+    # A different name is never a duplicate
+    ([item("Logs"), item("Oak logs")], [False, False]),
+    # The same name with a different wiki_name
+    ([item("Kalphite princess", "Kalphite princess (Crawling)"),
+      item("Kalphite princess", "Kalphite princess (Airborne)"),
+      item("Kalphite princess", "Kalphite princess (Airborne)")], [False, False, True]),
+    # The same name with a different noted or placeholder flag
+    ([item("Logs"), item("Logs", noted=True), item("Logs", placeholder=True), item("Logs", noted=True)],
+     [False, False, False, True]),
+    # Each property matches a different known item with the same name
+    ([item("Coif", "Coif (a)", noted=True), item("Coif", "Coif (b)"), item("Coif", "Coif (a)")],
+     [False, False, True]),
+    # Known items with a different name do not contribute matching properties
+    ([item("Coif", "Coif (a)"), item("Hat", "Coif (b)", noted=True), item("Coif", "Coif (b)", noted=True)],
+     [False, False, False]),
+    # Equipable flags are compared
+    ([item("Bronze sword", equipable=True, equipable_by_player=True, equipable_weapon=True),
+      item("Bronze sword", equipable=True, equipable_by_player=False),
+      item("Bronze sword", equipable=True, equipable_by_player=True, equipable_weapon=True)], [False, False, True]),
+    # None values are compared as values
+    ([item("Null", wiki_name=None), item("Null", wiki_name="Null (1)"), item("Null", wiki_name=None)],
+     [False, False, True])
+])
+def test_duplicate_index_items(entries, expected_duplicates):
+    assert check_same_as_scan(entries, ITEM_CORRELATION_PROPERTIES) == expected_duplicates
+
+
+def test_duplicate_index_monsters():
+    def monster(name, wiki_name, combat_level, members=True):
+        return SimpleNamespace(name=name, wiki_name=wiki_name, combat_level=combat_level, members=members)
+
+    entries = [
+        monster("Goblin", "Goblin (Level 2)", 2, False),
+        monster("Goblin", "Goblin (Level 5)", 5, False),
+        monster("Goblin", "Goblin (Level 2)", 2, False),
+        monster("Goblin", "Goblin (Level 2)", 2, True),
+        monster("Goblin", "Goblin (Level 5)", 2, True),
+        monster("Imp", "Goblin (Level 5)", 2, True)
+    ]
+    assert check_same_as_scan(entries, MONSTER_CORRELATION_PROPERTIES) == [False, False, True, False, True, False]
+
+
+def test_duplicate_index_random():
+    # Small value ranges, so many entries share a name and some of their correlation properties
+    rng = random.Random(1234)
+    entries = [item(rng.choice(["Logs", "Coif", "Null"]), wiki_name=rng.choice(["a", "b", "c", None]),
+                    noted=rng.random() < 0.3, placeholder=rng.random() < 0.2, equipable=rng.random() < 0.5,
+                    equipable_by_player=rng.random() < 0.5, equipable_weapon=rng.random() < 0.5)
+               for _ in range(500)]
+    duplicates = check_same_as_scan(entries, ITEM_CORRELATION_PROPERTIES)
+    assert 0 < sum(duplicates) < len(duplicates)
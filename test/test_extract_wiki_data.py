@@ -0,0 +1,257 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: scripts.wiki.extract_wiki_data
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+import config
+from scripts.wiki import extract_wiki_data
+from scripts.wiki.page_text_store import journal_path, load_page_text
+
+TIMESTAMP = "2020-05-01T12:00:00Z"
+LAST_EXTRACTION_DATE = "2020-01-01T00:00:00Z"
+CATEGORIES = {
+    "Items": [f"Item {number}" for number in range(1, 61)] + ["File:Item 1.png"],
+    "Pets": [f"Pet {number}" for number in range(1, 6)]
+}
+PAGE_TITLES = CATEGORIES["Items"][:-1] + CATEGORIES["Pets"]
+CATEGORY_PAGE_SIZE = 20
+TEXT_CONTINUE_SIZE = 10
+
+# Run an extraction in a separate process, so it can be killed
+EXTRACT_CODE = """
+import sys
+from pathlib import Path
+from scripts.wiki import extract_wiki_data
+extract_wiki_data.extract_wiki_data(["Items", "Pets"], sys.argv[3], base_url=sys.argv[1], wiki_data_path=Path(sys.argv[2]))
+"""
+
+
+def wiki_text(page_title):
+    return f"{{{{Infobox Item|name={page_title}}}}}"
+
+
+def stand_in_wiki_api(request):
+    """Answer category members, revision timestamp and revision content queries, like the OSRS Wiki API."""
+    if request.get("list") == "categorymembers":
+        page_titles = CATEGORIES[request["cmtitle"].replace("Category:", "")]
+        start = int(request.get("cmcontinue", 0))
+        result = {"query": {"categorymembers": [{"ns": 0, "title": page_title}
+                                                for page_title in page_titles[start:start + CATEGORY_PAGE_SIZE]]}}
+        if start + CATEGORY_PAGE_SIZE < len(page_titles):
+            result["continue"] = {"cmcontinue": str(start + CATEGORY_PAGE_SIZE), "continue": "-||"}
+        return result
+
+    page_titles = request["titles"].split("|")
+    pages = dict()
+    for page_id, page_title in enumerate(page_titles):
+        pages[str(page_id)] = {"pageid": page_id, "ns": 0, "title": page_title, "revisions": [{"timestamp": TIMESTAMP}]}
+    if request["rvprop"] == "timestamp":
+        return {"batchcomplete": "", "query": {"pages": pages}}
+
+    # The batch that includes pets is too large, so is returned in two responses
+    split = "Pet 1" in page_titles and "rvcontinue" not in request
+    for page_id, page in pages.items():
+        if split == (int(page_id) < TEXT_CONTINUE_SIZE) or "Pet 1" not in page_titles:
+            page["revisions"][0]["slots"] = {"main": {"*": wiki_text(page["title"])}}
+        else:
+            del page["revisions"]
+    if split:
+        return {"continue": {"rvcontinue": "10|1234", "continue": "||"}, "query": {"pages": pages}}
+    return {"batchcomplete": "", "query": {"pages": pages}}
+
+
+def run_killed_extraction(stand_in_wiki, tmp_path, kill_request):
+    """Run an extraction in a separate process, and kill it when a request matches kill_request."""
+    env = dict(os.environ, PYTHONPATH=str(config.PROJECT_ROOT_PATH))
+    process = subprocess.Popen([sys.executable, "-c", EXTRACT_CODE, stand_in_wiki.url, str(tmp_path),
+                                LAST_EXTRACTION_DATE],
+                               cwd=config.PROJECT_ROOT_PATH, env=env, stdout=subprocess.DEVNULL)
+
+    def handler(request):
+        if kill_request(request):
+            process.kill()
+            process.wait()
+        return stand_in_wiki_api(request)
+
+    stand_in_wiki.handler = handler
+    process.wait(timeout=60)
+    assert process.returncode != 0
+    stand_in_wiki.handler = stand_in_wiki_api
+
+
+def check_extraction_complete(tmp_path):
+    page_titles = json.loads((tmp_path / "page-titles-items.json").read_text())
+    assert page_titles == {page_title: TIMESTAMP for page_title in PAGE_TITLES}
+    page_text = json.loads((tmp_path / "page-text-items.json").read_text())
+    assert page_text == {page_title: wiki_text(page_title) for page_title in PAGE_TITLES}
+    assert not journal_path(tmp_path / "page-text-items.json").exists()
+    assert not (tmp_path / "extract-checkpoint-items.jsonl").exists()
+
+
+@pytest.fixture
+def extract(stand_in_wiki, tmp_path):
+    stand_in_wiki.handler = stand_in_wiki_api
+
+    def extract():
+        extract_wiki_data.extract_wiki_data(["Items", "Pets"], LAST_EXTRACTION_DATE,
+                                            base_url=stand_in_wiki.url, wiki_data_path=tmp_path)
+    return extract
+
+
+def test_extract_wiki_data(stand_in_wiki, tmp_path, extract):
+    extract()
+    check_extraction_complete(tmp_path)
+    # Category members (four pages of items, one of pets), revision timestamps, and wiki text requests
+    assert len(stand_in_wiki.requests) == 5 + 2 + 3
+
+
+def test_resume_category_extraction(stand_in_wiki, tmp_path, extract):
+    # Kill the extraction when requesting the last page of the items category
+    run_killed_extraction(stand_in_wiki, tmp_path, lambda request: request.get("cmcontinue") == "60")
+    killed_request_count = len(stand_in_wiki.requests)
+    assert (tmp_path / "extract-checkpoint-items.jsonl").exists()
+
+    extract()
+    check_extraction_complete(tmp_path)
+
+    # The extraction resumed from the continuation token of the last page of the items category
+    resumed_requests = stand_in_wiki.requests[killed_request_count:]
+    category_requests = [request for request in resumed_requests if request.get("cmtitle") == "Category:Items"]
+    assert [request.get("cmcontinue") for request in category_requests] == ["60"]
+    assert len(resumed_requests) == 1 + 2 + 3
+
+
+def test_resume_text_extraction(stand_in_wiki, tmp_path, extract):
+    # Kill the extraction when requesting the rest of the second batch of wiki text
+    run_killed_extraction(stand_in_wiki, tmp_path, lambda request: "rvcontinue" in request)
+    killed_request_count = len(stand_in_wiki.requests)
+
+    # The first batch of wiki text was saved before the extraction was killed
+    assert load_page_text(tmp_path / "page-text-items.json") == {page_title: wiki_text(page_title)
+                                                                 for page_title in PAGE_TITLES[:50]}
+
+    extract()
+    check_extraction_complete(tmp_path)
+
+    # Only the second batch of wiki text was extracted again
+    resumed_requests = stand_in_wiki.requests[killed_request_count:]
+    assert [request["titles"] for request in resumed_requests] == ["|".join(PAGE_TITLES[50:])] * 2
+
+
+NEW_TIMESTAMP = "2020-05-08T12:00:00Z"
+RECENT_CHANGES = [
+    {"type": "edit", "ns": 0, "title": "Item 3", "timestamp": NEW_TIMESTAMP},
+    {"type": "log", "ns": 0, "title": "Item 4", "timestamp": NEW_TIMESTAMP, "logtype": "delete",
+     "logaction": "delete"},
+    {"type": "log", "ns": 0, "title": "Item 5", "timestamp": NEW_TIMESTAMP, "logtype": "move",
+     "logaction": "move", "logparams": {"target_ns": 0, "target_title": "Item 5 (moved)"}},
+    {"type": "new", "ns": 0, "title": "Item 61", "timestamp": NEW_TIMESTAMP},
+    {"type": "new", "ns": 0, "title": "Unrelated page", "timestamp": NEW_TIMESTAMP},
+    {"type": "edit", "ns": 0, "title": "Pet 2", "timestamp": NEW_TIMESTAMP},
+    {"type": "log", "ns": 0, "title": "Item 6", "timestamp": NEW_TIMESTAMP, "logtype": "delete",
+     "logaction": "delete"},
+    {"type": "log", "ns": 0, "title": "Item 6", "timestamp": NEW_TIMESTAMP, "logtype": "delete",
+     "logaction": "restore"}
+]
+RECENT_CATEGORY_MEMBERS = {"Item 3", "Item 5 (moved)", "Item 6", "Item 61"}
+
+
+def sync_wiki_api(request):
+    """Answer recent changes, category membership and revision content queries, like the OSRS Wiki API."""
+    if request.get("list") == "recentchanges":
+        if "rcstart" not in request:
+            return {"query": {"recentchanges": [{"type": "edit", "timestamp": LAST_EXTRACTION_DATE}]}}
+        return {"batchcomplete": "", "query": {"recentchanges": RECENT_CHANGES}}
+    pages = dict()
+    for page_id, page_title in enumerate(request["titles"].split("|")):
+        pages[str(page_id)] = {"pageid": page_id, "ns": 0, "title": page_title}
+        if request.get("prop") == "categories" and page_title in RECENT_CATEGORY_MEMBERS:
+            pages[str(page_id)]["categories"] = [{"ns": 14, "title": "Category:Items"}]
+        elif request.get("prop") == "revisions":
+            pages[str(page_id)]["revisions"] = [{"timestamp": NEW_TIMESTAMP,
+                                                 "slots": {"main": {"*": wiki_text(page_title + " (new)")}}}]
+    return {"batchcomplete": "", "query": {"pages": pages}}
+
+
+def test_sync_wiki_data(stand_in_wiki, tmp_path, extract):
+    extract()
+    assert (tmp_path / "sync-point-items.json").exists()
+    extract_request_count = len(stand_in_wiki.requests)
+
+    stand_in_wiki.handler = sync_wiki_api
+    assert extract_wiki_data.sync_wiki_data(["Items", "Pets"], base_url=stand_in_wiki.url, wiki_data_path=tmp_path)
+
+    # Recent changes (and the oldest recent change), category membership, and wiki text requests
+    assert len(stand_in_wiki.requests) - extract_request_count == 4
+
+    changed_titles = ["Item 3", "Item 6", "Item 5 (moved)", "Item 61"]
+    expected_titles = [page_title for page_title in PAGE_TITLES if page_title not in ("Item 4", "Item 5", "Pet 2")]
+    expected_titles += ["Item 5 (moved)", "Item 61"]
+    page_titles = json.loads((tmp_path / "page-titles-items.json").read_text())
+    assert page_titles == {page_title: NEW_TIMESTAMP if page_title in changed_titles else TIMESTAMP
+                           for page_title in expected_titles}
+    page_text = json.loads((tmp_path / "page-text-items.json").read_text())
+    assert page_text == {page_title: wiki_text(page_title + " (new)") if page_title in changed_titles
+                         else wiki_text(page_title) for page_title in expected_titles}
+
+
+@pytest.mark.parametrize("failed_request", [
+    lambda request: request.get("list") == "recentchanges",
+    lambda request: "rcstart" in request,
+    lambda request: request.get("prop") == "categories",
+    lambda request: request.get("prop") == "revisions"
+], ids=["oldest-recent-change", "recent-changes", "category-membership", "wiki-text"])
+def test_sync_wiki_data_api_error(stand_in_wiki, tmp_path, extract, failed_request):
+    extract()
+    extracted_files = {path.name: path.read_text() for path in tmp_path.iterdir()}
+
+    def failing_wiki_api(request):
+        if failed_request(request):
+            return {"error": {"code": "internal_api_error_DBQueryError", "info": "Database query error."}}
+        return sync_wiki_api(request)
+
+    # A failed request stops the sync, and no pages are removed or sync point saved
+    stand_in_wiki.handler = failing_wiki_api
+    with pytest.raises(SystemExit):
+        extract_wiki_data.sync_wiki_data(["Items", "Pets"], base_url=stand_in_wiki.url, wiki_data_path=tmp_path)
+    assert json.loads((tmp_path / "page-titles-items.json").read_text()) == \
+        {page_title: TIMESTAMP for page_title in PAGE_TITLES}
+    assert load_page_text(tmp_path / "page-text-items.json") == \
+        {page_title: wiki_text(page_title) for page_title in PAGE_TITLES}
+    assert (tmp_path / "sync-point-items.json").read_text() == extracted_files["sync-point-items.json"]
+
+    # The next sync queries the same changes again
+    stand_in_wiki.handler = sync_wiki_api
+    assert extract_wiki_data.sync_wiki_data(["Items", "Pets"], base_url=stand_in_wiki.url, wiki_data_path=tmp_path)
+    page_titles = json.loads((tmp_path / "page-titles-items.json").read_text())
+    assert "Item 4" not in page_titles and page_titles["Item 61"] == NEW_TIMESTAMP
+
+
+def test_sync_wiki_data_full_extraction_needed(stand_in_wiki, tmp_path):
+    assert not extract_wiki_data.sync_wiki_data(["Items", "Pets"], base_url=stand_in_wiki.url, wiki_data_path=tmp_path)
+    assert not stand_in_wiki.requests
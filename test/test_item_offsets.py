@@ -0,0 +1,100 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: osrsbox.items_api.item_offsets
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import json
+import builtins
+from pathlib import Path
+
+import pytest
+
+from osrsbox.items_api import item_offsets
+from osrsbox.items_api.item_offsets import ItemOffsets
+
+ITEMS = {
+    "0": {"id": 0, "name": "Dwarf remains", "examine": "The body of a Dwarf savaged by Goblins."},
+    "1": {"id": 1, "name": "Toolkit", "examine": "Good for repairing a broken cannon."},
+    "2": {"id": 2, "name": "Cannonball", "examine": "Ammo for the Dwarf Cannon – très lourd."}
+}
+
+
+@pytest.fixture
+def path_to_items_complete(tmp_path: Path) -> Path:
+    path_to_items_complete = tmp_path / "items-complete.json"
+    path_to_items_complete.write_text(json.dumps(ITEMS, indent=4, ensure_ascii=False), encoding="utf-8")
+    return path_to_items_complete
+
+
+@pytest.fixture
+def scan_count(monkeypatch) -> list:
+    """Count the calls to scan_offsets, which builds the sidecar index."""
+    calls = list()
+    scan_offsets = item_offsets.scan_offsets
+
+    def counting_scan_offsets(path_to_json_file):
+        calls.append(path_to_json_file)
+        return scan_offsets(path_to_json_file)
+
+    monkeypatch.setattr(item_offsets, "scan_offsets", counting_scan_offsets)
+    return calls
+
+
+def test_item_offsets_read(path_to_items_complete: Path, monkeypatch):
+    offsets = ItemOffsets(path_to_items_complete)
+    assert list(offsets) == [0, 1, 2]
+
+    # Items are read from the open JSON file, which is not opened again
+    def no_open(*args, **kwargs):
+        raise AssertionError("The JSON file was opened again")
+
+    monkeypatch.setattr(builtins, "open", no_open)
+    for _ in range(2):
+        assert [offsets.read(item_id) for item_id in offsets] == list(ITEMS.values())
+    monkeypatch.undo()
+
+    offsets.close()
+    assert offsets.json_file.closed
+    with pytest.raises(ValueError):
+        offsets.read(0)
+
+
+def test_item_offsets_index(path_to_items_complete: Path, scan_count: list):
+    ItemOffsets(path_to_items_complete).close()
+    assert path_to_items_complete.with_name("items-complete.json.idx").is_file()
+    assert len(scan_count) == 1
+
+    # An unchanged JSON file uses the saved index
+    ItemOffsets(path_to_items_complete).close()
+    assert len(scan_count) == 1
+
+    # A change of the same size and modification time rebuilds the index
+    stat = path_to_items_complete.stat()
+    changed_text = path_to_items_complete.read_text(encoding="utf-8").replace("Toolkit", "Toolbox")
+    path_to_items_complete.write_text(changed_text, encoding="utf-8")
+    os.utime(path_to_items_complete, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path_to_items_complete.stat().st_size == stat.st_size
+
+    offsets = ItemOffsets(path_to_items_complete)
+    assert len(scan_count) == 2
+    assert offsets.read(1)["name"] == "Toolbox"
+    offsets.close()
@@ -22,14 +22,27 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import os
+import json
+import shutil
 from pathlib import Path
 
+import pytest
+
+from osrsbox import items_api, snapshot
 from osrsbox.items_api import all_items
 
 # The current number of items being loaded from the db
 NUMBER_OF_ITEMS = 22433
 
 
+@pytest.fixture
+def path_to_items_complete_copy(path_to_docs_dir: Path, tmp_path: Path) -> Path:
+    """A copy of `items-complete.json`, for tests that save files (an index or snapshot) next to it."""
+    path_to_items_complete = tmp_path / "items-complete.json"
+    shutil.copy(path_to_docs_dir / "items-complete.json", path_to_items_complete)
+    return path_to_items_complete
+
+
 def test_all_items_load_items_json(path_to_docs_dir: Path):
     path_to_items_json_dir_no_slash = path_to_docs_dir / "items-json"
     path_to_items_json_dir_slash = os.path.join(path_to_docs_dir, "items-json", "")
@@ -44,3 +57,185 @@ def test_all_items_load_items_complete(path_to_docs_dir: Path):
 
     all_db_items = all_items.AllItems(str(path_to_items_complete))
     assert len(all_db_items.all_items) == NUMBER_OF_ITEMS
+
+
+def test_all_items_load_lazy(path_to_docs_dir: Path, path_to_items_complete_copy: Path):
+    path_to_items_complete = path_to_items_complete_copy
+
+    all_db_items = all_items.AllItems(str(path_to_items_complete))
+    for path in (path_to_items_complete, path_to_docs_dir / "items-json"):
+        lazy_db_items = all_items.AllItems(path, lazy=True, cache_size=16)
+        assert len(lazy_db_items) == NUMBER_OF_ITEMS
+        assert lazy_db_items.lookup_by_item_id(4151) == all_db_items.lookup_by_item_id(4151)
+        assert [item.id for item in lazy_db_items] == [item.id for item in all_db_items]
+        assert len(lazy_db_items.item_cache) == 16
+    assert path_to_items_complete.with_name("items-complete.json.idx").is_file()
+
+
+def test_all_items_equipment_matrix(path_to_docs_dir: Path):
+    numpy = pytest.importorskip("numpy")
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json")
+    equipable_items = [item for item in all_db_items if item.equipable_by_player]
+
+    matrix = all_db_items.equipment_matrix()
+    assert matrix is all_db_items.equipment_matrix()
+    assert len(matrix) == len(equipable_items)
+    assert list(matrix["id"]) == [item.id for item in equipable_items]
+
+    whip = matrix[matrix["id"] == 4151][0]
+    assert whip["attack_slash"] == all_db_items[4151].equipment.attack_slash
+    assert whip["attack_speed"] == all_db_items[4151].weapon.attack_speed
+    assert all_items.EQUIPMENT_SLOTS[whip["slot"]] == "weapon"
+
+    top_slash = matrix["attack_slash"][numpy.argsort(matrix["attack_slash"])[::-1][0]]
+    assert top_slash == max(item.equipment.attack_slash for item in equipable_items)
+
+
+def test_all_items_lookup_by_item_names(path_to_docs_dir: Path, path_to_items_complete_copy: Path):
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json")
+
+    # The first (lowest ID) item with a matching name is returned
+    assert all_db_items.lookup_by_item_name("ABYSSAL WHIP").id == 4151
+    assert all_db_items.lookup_by_item_name("Coins").id == min(item.id for item in all_db_items if item.name == "Coins")
+    with pytest.raises(ValueError):
+        all_db_items.lookup_by_item_name("Not an item")
+
+    results = all_db_items.lookup_by_item_names(["abyssal whip", "Not an item", "Dragon scimitar"])
+    assert [item.id if item else None for item in results] == [4151, None, 4587]
+
+    lazy_db_items = all_items.AllItems(path_to_items_complete_copy, lazy=True)
+    assert lazy_db_items.lookup_by_item_name("Abyssal whip", use_wiki_name=True).id == 4151
+
+
+def test_all_items_search_item_names(path_to_docs_dir: Path):
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json")
+
+    for keyword in ("Dragon SCIM", "whip", "ab", "", "not an item"):
+        expected = [item for item in all_db_items
+                    if keyword.lower() in item.name.lower() or
+                    (item.wiki_name and keyword.lower() in item.wiki_name.lower())]
+        assert all_db_items.search_item_names(keyword) == expected
+
+
+def test_all_items_fuzzy_search_item_names(path_to_docs_dir: Path):
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json")
+
+    assert all_db_items.fuzzy_search_item_names("dragn scimmy")[0].id == 4587
+    assert all_db_items.fuzzy_search_item_names("abysal wip")[0].id == 4151
+    assert all_db_items.fuzzy_search_item_names("Bandos Chestplat")[0].id == 11832
+
+    results = all_db_items.fuzzy_search_item_names("dragon", k=25)
+    assert len(results) == 25
+    assert len({item.id for item in results}) == 25
+
+    assert all_db_items.fuzzy_search_item_names("") == []
+    assert all_db_items.fuzzy_search_item_names("dragon", k=0) == []
+    assert all_db_items.fuzzy_search_item_names("dragon", k=-1) == []
+
+
+def test_all_items_load_items_json_workers(path_to_docs_dir: Path):
+    path_to_items_json_dir = path_to_docs_dir / "items-json"
+    all_db_items = all_items.AllItems(path_to_items_json_dir)
+    all_db_items_workers = all_items.AllItems(path_to_items_json_dir, workers=2)
+
+    assert all_db_items_workers.all_items == all_db_items.all_items
+    assert [item.id for item in all_db_items_workers] == sorted(all_db_items.all_items_dict)
+
+    with pytest.raises(ValueError):
+        all_items.AllItems(path_to_items_json_dir, workers=0)
+
+
+def test_iter_items(path_to_docs_dir: Path):
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json", snapshot=False)
+
+    for path in (path_to_docs_dir / "items-complete.json", path_to_docs_dir / "items-json"):
+        assert list(items_api.iter_items(path)) == all_db_items.all_items
+
+    with pytest.raises(ValueError):
+        next(items_api.iter_items(path_to_docs_dir / "not-a-file.json"))
+
+
+def test_all_items_query(path_to_docs_dir: Path):
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json")
+
+    expected = [item for item in all_db_items
+                if item.equipable_by_player and not item.members and item.equipment.slot in ("weapon", "2h")]
+    assert all_db_items.query(equipable_by_player=True, members=False, equipment__slot__in=("weapon", "2h")) == expected
+
+    expected = [item for item in all_db_items
+                if item.tradeable_on_ge and item.weapon and item.weapon.weapon_type == "slashing_swords" and
+                100 <= item.cost <= 1000]
+    assert all_db_items.query(tradeable_on_ge=True, weapon__weapon_type="slashing_swords", cost__range=(100, 1000)) == expected
+
+    expected = [item for item in all_db_items
+                if item.equipment and item.equipment.attack_slash >= 80 and item.equipment.prayer > 0]
+    assert all_db_items.query(equipment__attack_slash__ge=80, equipment__prayer__gt=0) == expected
+
+    assert all_db_items.query() == all_db_items.all_items
+
+    with pytest.raises(ValueError):
+        all_db_items.query(not_a_property=True)
+    with pytest.raises(ValueError):
+        all_db_items.query(cost__range=100)
+
+
+def test_all_items_canonical_variants(path_to_docs_dir: Path):
+    all_db_items = all_items.AllItems(path_to_docs_dir / "items-complete.json")
+
+    # Abyssal whip, noted Abyssal whip and Abyssal whip placeholder
+    for item_id in (4151, 4152, 14032):
+        assert all_db_items.canonical(item_id) == 4151
+        assert all_db_items.variants(item_id) == [4151, 4152, 14032]
+
+    for item in all_db_items:
+        canonical_id = all_db_items.canonical(item.id)
+        assert canonical_id == (item.linked_id_item if item.linked_id_item is not None else item.id)
+        assert item.id in all_db_items.variants(canonical_id)
+
+    with pytest.raises(KeyError):
+        all_db_items.canonical(-1)
+    with pytest.raises(KeyError):
+        all_db_items.variants(NUMBER_OF_ITEMS * 10)
+
+
+def test_all_items_load_items_snapshot(path_to_items_complete_copy: Path):
+    path_to_items_complete = path_to_items_complete_copy
+    path_to_snapshot = snapshot.snapshot_path(path_to_items_complete)
+
+    # Snapshots are only used when enabled
+    all_db_items = all_items.AllItems(path_to_items_complete)
+    assert not path_to_snapshot.exists()
+
+    # The first load saves a snapshot, the second load uses it
+    assert all_items.AllItems(path_to_items_complete, snapshot=True).all_items == all_db_items.all_items
+    assert snapshot.load_snapshot(path_to_items_complete, all_items.SNAPSHOT_SCHEMA) == all_db_items.all_items
+    snapshot_mtime = path_to_snapshot.stat().st_mtime_ns
+    assert all_items.AllItems(path_to_items_complete, snapshot=True).all_items == all_db_items.all_items
+    assert path_to_snapshot.stat().st_mtime_ns == snapshot_mtime
+
+    # Changing the JSON file rewrites the snapshot
+    with open(path_to_items_complete) as f:
+        items = json.load(f)
+    del items["4151"]
+    with open(path_to_items_complete, "w") as f:
+        json.dump(items, f)
+    assert snapshot.load_snapshot(path_to_items_complete, all_items.SNAPSHOT_SCHEMA) is None
+    all_db_items = all_items.AllItems(path_to_items_complete)
+    assert len(all_db_items) == NUMBER_OF_ITEMS - 1
+    assert all_items.AllItems(path_to_items_complete, snapshot=True).all_items == all_db_items.all_items
+    assert snapshot.load_snapshot(path_to_items_complete, all_items.SNAPSHOT_SCHEMA) == all_db_items.all_items
+
+    # A snapshot of different dataclass fields is rejected
+    header, pickled_data = path_to_snapshot.read_bytes().split(b"\n", 1)
+    header = json.loads(header)
+    header["schema"]["ItemProperties"].append("new_property")
+    path_to_snapshot.write_bytes(json.dumps(header).encode("utf-8") + b"\n" + pickled_data)
+    assert snapshot.load_snapshot(path_to_items_complete, all_items.SNAPSHOT_SCHEMA) is None
+    assert all_items.AllItems(path_to_items_complete, snapshot=True).all_items == all_db_items.all_items
+    assert snapshot.load_snapshot(path_to_items_complete, all_items.SNAPSHOT_SCHEMA) == all_db_items.all_items
+
+    # A tampered (truncated) pickle falls back to the JSON file
+    snapshot_data = path_to_snapshot.read_bytes()
+    path_to_snapshot.write_bytes(snapshot_data[:len(snapshot_data) // 2])
+    assert snapshot.load_snapshot(path_to_items_complete, all_items.SNAPSHOT_SCHEMA) is None
+    assert all_items.AllItems(path_to_items_complete, snapshot=True).all_items == all_db_items.all_items
@@ -0,0 +1,219 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.items.builder
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+import dataclasses
+
+import pytest
+
+import config
+from osrsbox.items_api.item_properties import ItemProperties
+
+PRINCESS_WIKITEXT = """{{Infobox Pet
+|version1 = Crawling
+|version2 = Airborne
+|name = Kalphite princess
+|id1 = 12647
+|id2 = 12654
+|release = [[14 April]] [[2016]]
+|tradeable = No
+|quest = No
+|weight = 0.5
+|examine1 = It's a Kalphite princess, crawling.
+|examine2 = It's a Kalphite princess, flying.
+}}
+"""
+
+LOGS_WIKITEXT = """{{Infobox Item
+|name = Logs
+|id = 1511
+|release = [[27 February]] [[2001]]
+|tradeable = Yes
+|quest = No
+|weight = 2
+|examine = A number of wooden logs.
+}}
+"""
+
+COINS_WIKITEXT = """{{Infobox Item
+|name = Coins
+|release = [[27 February]] [[2001]]
+|tradeable = Yes
+|weight = 0
+|examine = Lovely money!
+}}
+"""
+
+
+def cache_item(item_id, name, noted=False, linked_id_item=None, linked_id_noted=None, stackable=False):
+    return {
+        "id": item_id,
+        "name": name,
+        "members": False,
+        "tradeable_on_ge": True,
+        "stackable": stackable or noted,
+        "noted": noted,
+        "noteable": linked_id_noted is not None or noted,
+        "linked_id_item": linked_id_item,
+        "linked_id_noted": linked_id_noted,
+        "linked_id_placeholder": None,
+        "placeholder": False,
+        "equipable": False,
+        "cost": 4,
+        "lowalch": 1,
+        "highalch": 2
+    }
+
+
+ITEMS_CACHE_DATA = {
+    "995": cache_item(995, "Coins", stackable=True),
+    "1511": cache_item(1511, "Logs", linked_id_noted=1512),
+    "1512": cache_item(1512, "Logs", noted=True, linked_id_item=1511),
+    "1513": cache_item(1513, "Logs"),
+    "12647": cache_item(12647, "Kalphite princess"),
+    "12654": cache_item(12654, "Kalphite princess"),
+    "12655": cache_item(12655, "Kalphite princess"),
+    "20000": cache_item(20000, "Mystery box"),
+    "20001": cache_item(20001, "Null")
+}
+
+
+@pytest.fixture
+def build_items(tmp_path, monkeypatch):
+    """Run the item builder on a small set of items, using a separate data directory for each build.
+
+    :return: A function to run a build, which returns the build directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    from builders.items import builder
+
+    def build_items(build_name, workers=1, full=False):
+        build_path = tmp_path / build_name
+        if not build_path.exists():
+            write_build_data(build_path)
+        monkeypatch.setattr(config, "DOCS_PATH", build_path / "docs")
+        monkeypatch.setattr(config, "DATA_WIKI_PATH", build_path / "data" / "wiki")
+        monkeypatch.setattr(config, "DATA_ITEMS_PATH", build_path / "data" / "items")
+        monkeypatch.setattr(config, "DATA_SCHEMAS_PATH", build_path / "data" / "schemas")
+        builder.main(export=True, workers=workers, full=full)
+        return build_path
+
+    return build_items
+
+
+def write_build_data(build_path):
+    """Write the input data files of the item builder."""
+    for directory in ["docs/items-json", "data/wiki", "data/items", "data/schemas"]:
+        (build_path / directory).mkdir(parents=True)
+
+    # The current database only has the logs item, with a different weight
+    logs = dict(ITEMS_CACHE_DATA["1511"], weight=2.5)
+    (build_path / "docs" / "items-complete.json").write_text(json.dumps({"1511": logs}))
+
+    page_text = {"Coins": COINS_WIKITEXT, "Logs": LOGS_WIKITEXT, "Kalphite princess": PRINCESS_WIKITEXT}
+    (build_path / "data" / "wiki" / "page-text-items.json").write_text(json.dumps(page_text))
+    processed_wikitext = {
+        "1511": ["Logs", "", LOGS_WIKITEXT],
+        "12647": ["Kalphite princess", "1", PRINCESS_WIKITEXT],
+        "12654": ["Kalphite princess", "2", PRINCESS_WIKITEXT]
+    }
+    (build_path / "data" / "wiki" / "processed-wikitext-items.json").write_text(json.dumps(processed_wikitext))
+
+    items_data = {
+        "items-cache-data.json": ITEMS_CACHE_DATA,
+        "invalid-items.json": {"20001": {"status": "unobtainable", "normalized_name": None}},
+        "ge-limits-names.json": {"Logs": 15000},
+        "skill-requirements.json": {},
+        "weapon-types.json": {},
+        "weapon-stances.json": {}
+    }
+    for file_name, data in items_data.items():
+        (build_path / "data" / "items" / file_name).write_text(json.dumps(data))
+
+    schema = {field.name: {"required": True, "nullable": True} for field in dataclasses.fields(ItemProperties)}
+    (build_path / "data" / "schemas" / "schema-items.json").write_text(json.dumps(schema))
+
+
+def read_build_output(build_path):
+    """Read the exported item JSON files and the change report of a build."""
+    items_json = {path.name: path.read_text() for path in (build_path / "docs" / "items-json").iterdir()}
+    change_report = (build_path / "data" / "items" / "items-change-report.jsonl").read_text()
+    return items_json, change_report
+
+
+def test_workers_same_as_serial_build(build_items, capsys):
+    serial_path = build_items("serial")
+    serial_output = capsys.readouterr().out.replace(str(serial_path), "")
+    workers_path = build_items("workers", workers=2)
+    workers_output = capsys.readouterr().out.replace(str(workers_path), "")
+
+    serial_items_json, serial_change_report = read_build_output(serial_path)
+    workers_items_json, workers_change_report = read_build_output(workers_path)
+
+    assert workers_items_json == serial_items_json
+    assert workers_change_report == serial_change_report
+    assert workers_output == serial_output
+
+    # Check the build covered lookups by ID, linked ID and name, versions, duplicates and invalid items
+    items = {item_id: json.loads(serial_items_json[f"{item_id}.json"]) for item_id in ITEMS_CACHE_DATA}
+    assert items["1512"]["wiki_name"] == "Logs" and items["1512"]["buy_limit"] is None
+    assert items["995"]["examine"] == "Lovely money!"
+    assert items["12654"]["wiki_name"] == "Kalphite princess (Airborne)"
+    assert [items[item_id]["duplicate"] for item_id in ["1511", "1512", "1513", "12647", "12654", "12655"]] == \
+        [False, False, True, False, False, True]
+    assert items["20000"]["incomplete"] and items["20001"]["incomplete"]
+
+    change_records = [json.loads(line) for line in serial_change_report.splitlines()]
+    assert len(change_records) == len(ITEMS_CACHE_DATA)
+    assert [record["status"] for record in change_records].count("changed") == 1
+
+
+def test_incremental_build(build_items, capsys, tmp_path, monkeypatch):
+    from builders import duplicate_index
+    from builders.items import builder
+
+    def build_counts(**kwargs):
+        build_items("incremental", **kwargs)
+        output = capsys.readouterr().out
+        return output.splitlines()[0]
+
+    assert build_counts() == "Building 9 items, reusing 0 unchanged items..."
+    assert build_counts() == "Building 0 items, reusing 9 unchanged items..."
+    assert build_counts(full=True) == "Building 9 items, reusing 0 unchanged items..."
+
+    # Only the item using the changed wiki page is built
+    page_text_path = tmp_path / "incremental" / "data" / "wiki" / "page-text-items.json"
+    page_text = json.loads(page_text_path.read_text())
+    page_text["Coins"] = page_text["Coins"].replace("Lovely money!", "Lots of money!")
+    page_text_path.write_text(json.dumps(page_text))
+    assert build_counts() == "Building 1 items, reusing 8 unchanged items..."
+    item_json_path = tmp_path / "incremental" / "docs" / "items-json" / "995.json"
+    assert json.loads(item_json_path.read_text())["examine"] == "Lots of money!"
+
+    # A change to the builder, or duplicate detection, source code rebuilds every item
+    for module in [builder, duplicate_index]:
+        assert build_counts() == "Building 0 items, reusing 9 unchanged items..."
+        changed_module_path = tmp_path / f"{module.__name__}.py"
+        changed_module_path.write_text(open(module.__file__).read() + "\n# A changed source file\n")
+        monkeypatch.setattr(module, "__file__", str(changed_module_path))
+        assert build_counts() == "Building 9 items, reusing 0 unchanged items..."
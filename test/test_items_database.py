@@ -25,6 +25,7 @@ import json
 from pathlib import Path
 
 import config
+from builders.schema_validator import SchemaValidator
 
 
 def test_item_database():
@@ -34,17 +35,14 @@ def test_item_database():
     with open(path_to_schema, 'r') as f:
         schema = json.loads(f.read())
 
-    # Validator object with schema attached
-    v = config.MyValidator(schema)
+    # Compiled validator object with schema attached
+    v = SchemaValidator(schema)
 
     # Set the path to the items-json folder and get all the JSON files
     path_to_items_json_dir = Path(config.DOCS_PATH / "items-json")
     fis = path_to_items_json_dir.glob("*.json")
     fis = sorted(fis)
 
-    # Validate each file
-    for json_file in fis:
-        with open(json_file) as fi:
-            item = json.load(fi)
-            # print(item["id"])
-            assert v.validate(item)
+    # Validate every file in a single batch, then report the errors of each invalid file
+    errors = v.validate_many(json.loads(json_file.read_text()) for json_file in fis)
+    assert not errors, {fis[position].name: error for position, error in errors.items()}
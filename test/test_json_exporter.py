@@ -0,0 +1,68 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.json_exporter
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import os
+import json
+
+import pytest
+
+from builders.json_exporter import JsonExporter, serialize_json
+
+ITEM = {"id": 4151, "name": "Abyssal whip", "equipment": {"slot": "weapon"}}
+
+
+def test_serialize_json_matches_export_json(tmp_path):
+    path_to_json = tmp_path / "4151.json"
+    with open(path_to_json, "w") as f:
+        json.dump(ITEM, f, indent=4)
+    assert serialize_json(ITEM) == path_to_json.read_text()
+
+
+def test_json_exporter_skips_unchanged_files(tmp_path):
+    json_exporter = JsonExporter(tmp_path)
+    json_exporter.write("4151.json", serialize_json(ITEM))
+    json_exporter.write("4152.json", serialize_json(dict(ITEM, id=4152)))
+    json_exporter.close()
+    assert (json_exporter.written_count, json_exporter.skipped_count) == (2, 0)
+    assert json.loads((tmp_path / "4151.json").read_text()) == ITEM
+
+    # Set an old modification time, to check unchanged files are not touched
+    os.utime(tmp_path / "4151.json", (0, 0))
+    os.utime(tmp_path / "4152.json", (0, 0))
+
+    json_exporter = JsonExporter(tmp_path)
+    json_exporter.write("4151.json", serialize_json(ITEM))
+    json_exporter.write("4152.json", serialize_json(dict(ITEM, id=4152, name="Changed")))
+    json_exporter.close()
+    assert (json_exporter.written_count, json_exporter.skipped_count) == (1, 1)
+    assert (tmp_path / "4151.json").stat().st_mtime == 0
+    assert (tmp_path / "4152.json").stat().st_mtime != 0
+    assert json.loads((tmp_path / "4152.json").read_text())["name"] == "Changed"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["4151.json", "4152.json"]
+
+
+def test_json_exporter_error(tmp_path):
+    json_exporter = JsonExporter(tmp_path / "missing")
+    json_exporter.write("4151.json", serialize_json(ITEM))
+    with pytest.raises(OSError):
+        json_exporter.close()
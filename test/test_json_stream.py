@@ -0,0 +1,51 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: osrsbox.json_stream
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from osrsbox.json_stream import iter_json_object
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+def test_iter_json_object(tmp_path: Path, chunk_size: int):
+    data = {
+        "1": {"name": "Dwarf remains", "cost": 1, "weight": 1.5e-2, "members": False, "examine": None},
+        "2": {"name": "Cannonball ☃", "drops": [{"id": 2, "rarity": 0.0078125}]},
+        "30": -12345678,
+    }
+    path_to_json_file = tmp_path / "complete.json"
+    path_to_json_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    assert list(iter_json_object(path_to_json_file, chunk_size)) == list(data.items())
+
+
+@pytest.mark.parametrize("text", ["", "[1, 2]", '{"1": 1', '{"1" 1}', '{1: 1}', '{"1": 1 "2": 2}'])
+def test_iter_json_object_invalid(tmp_path: Path, text: str):
+    path_to_json_file = tmp_path / "invalid.json"
+    path_to_json_file.write_text(text)
+
+    with pytest.raises(ValueError):
+        list(iter_json_object(path_to_json_file, 2))
@@ -22,8 +22,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import os
+import json
+import shutil
 from pathlib import Path
 
+from osrsbox import monsters_api, snapshot
 from osrsbox.monsters_api import all_monsters
 
 # The current number of monsters being loaded from the db
@@ -44,3 +47,95 @@ def test_all_monsters_load_monsters_complete(path_to_docs_dir: Path):
 
     all_db_monsters = all_monsters.AllMonsters(str(path_to_monsters_complete))
     assert len(all_db_monsters.all_monsters) == NUMBER_OF_MONSTERS
+
+
+def test_all_monsters_search_monster_names(path_to_docs_dir: Path):
+    all_db_monsters = all_monsters.AllMonsters(path_to_docs_dir / "monsters-complete.json")
+
+    for keyword in ("Dragon", "goblin", "ab", "", "not a monster"):
+        expected = [monster for monster in all_db_monsters
+                    if keyword.lower() in monster.name.lower() or
+                    (monster.wiki_name and keyword.lower() in monster.wiki_name.lower())]
+        assert all_db_monsters.search_monster_names(keyword) == expected
+
+
+def test_all_monsters_fuzzy_search_monster_names(path_to_docs_dir: Path):
+    all_db_monsters = all_monsters.AllMonsters(path_to_docs_dir / "monsters-complete.json")
+
+    assert all_db_monsters.fuzzy_search_monster_names("grn dragon")[0].name == "Green dragon"
+    assert all_db_monsters.fuzzy_search_monster_names("abysal demon", k=1)[0].name == "Abyssal demon"
+    assert all_db_monsters.fuzzy_search_monster_names("") == []
+    assert all_db_monsters.fuzzy_search_monster_names("grn dragon", k=0) == []
+    assert all_db_monsters.fuzzy_search_monster_names("grn dragon", k=-1) == []
+
+
+def test_all_monsters_load_monsters_json_workers(path_to_docs_dir: Path):
+    path_to_monsters_json_dir = path_to_docs_dir / "monsters-json"
+    all_db_monsters = all_monsters.AllMonsters(path_to_monsters_json_dir)
+    all_db_monsters_workers = all_monsters.AllMonsters(path_to_monsters_json_dir, workers=2)
+
+    assert all_db_monsters_workers.all_monsters == all_db_monsters.all_monsters
+    assert [monster.id for monster in all_db_monsters_workers] == sorted(all_db_monsters.all_monsters_dict)
+
+
+def test_iter_monsters(path_to_docs_dir: Path):
+    all_db_monsters = all_monsters.AllMonsters(path_to_docs_dir / "monsters-complete.json", snapshot=False)
+
+    for path in (path_to_docs_dir / "monsters-complete.json", path_to_docs_dir / "monsters-json"):
+        assert list(monsters_api.iter_monsters(path)) == all_db_monsters.all_monsters
+
+
+def test_all_monsters_query(path_to_docs_dir: Path):
+    all_db_monsters = all_monsters.AllMonsters(path_to_docs_dir / "monsters-complete.json")
+
+    expected = [monster for monster in all_db_monsters
+                if "duradel" in monster.slayer_masters and monster.combat_level >= 100]
+    assert all_db_monsters.query(slayer_masters__contains="duradel", combat_level__ge=100) == expected
+
+    expected = [monster for monster in all_db_monsters
+                if not monster.members and "stab" in monster.attack_type and monster.hitpoints < 50]
+    assert all_db_monsters.query(members=False, attack_type__contains="stab", hitpoints__lt=50) == expected
+
+
+def test_all_monsters_load_monsters_snapshot(path_to_docs_dir: Path, tmp_path: Path):
+    path_to_monsters_complete = tmp_path / "monsters-complete.json"
+    shutil.copy(path_to_docs_dir / "monsters-complete.json", path_to_monsters_complete)
+    path_to_snapshot = snapshot.snapshot_path(path_to_monsters_complete)
+
+    # Snapshots are only used when enabled
+    all_db_monsters = all_monsters.AllMonsters(path_to_monsters_complete)
+    assert not path_to_snapshot.exists()
+
+    # The first load saves a snapshot, the second load uses it
+    assert all_monsters.AllMonsters(path_to_monsters_complete, snapshot=True).all_monsters == all_db_monsters.all_monsters
+    assert snapshot.load_snapshot(path_to_monsters_complete, all_monsters.SNAPSHOT_SCHEMA) == all_db_monsters.all_monsters
+    snapshot_mtime = path_to_snapshot.stat().st_mtime_ns
+    assert all_monsters.AllMonsters(path_to_monsters_complete, snapshot=True).all_monsters == all_db_monsters.all_monsters
+    assert path_to_snapshot.stat().st_mtime_ns == snapshot_mtime
+
+    # Changing the JSON file rewrites the snapshot
+    with open(path_to_monsters_complete) as f:
+        monsters = json.load(f)
+    del monsters["2"]
+    with open(path_to_monsters_complete, "w") as f:
+        json.dump(monsters, f)
+    assert snapshot.load_snapshot(path_to_monsters_complete, all_monsters.SNAPSHOT_SCHEMA) is None
+    all_db_monsters = all_monsters.AllMonsters(path_to_monsters_complete)
+    assert len(all_db_monsters) == NUMBER_OF_MONSTERS - 1
+    assert all_monsters.AllMonsters(path_to_monsters_complete, snapshot=True).all_monsters == all_db_monsters.all_monsters
+    assert snapshot.load_snapshot(path_to_monsters_complete, all_monsters.SNAPSHOT_SCHEMA) == all_db_monsters.all_monsters
+
+    # A snapshot of different dataclass fields is rejected
+    header, pickled_data = path_to_snapshot.read_bytes().split(b"\n", 1)
+    header = json.loads(header)
+    header["schema"]["MonsterProperties"].append("new_property")
+    path_to_snapshot.write_bytes(json.dumps(header).encode("utf-8") + b"\n" + pickled_data)
+    assert snapshot.load_snapshot(path_to_monsters_complete, all_monsters.SNAPSHOT_SCHEMA) is None
+    assert all_monsters.AllMonsters(path_to_monsters_complete, snapshot=True).all_monsters == all_db_monsters.all_monsters
+    assert snapshot.load_snapshot(path_to_monsters_complete, all_monsters.SNAPSHOT_SCHEMA) == all_db_monsters.all_monsters
+
+    # A tampered (truncated) pickle falls back to the JSON file
+    snapshot_data = path_to_snapshot.read_bytes()
+    path_to_snapshot.write_bytes(snapshot_data[:len(snapshot_data) // 2])
+    assert snapshot.load_snapshot(path_to_monsters_complete, all_monsters.SNAPSHOT_SCHEMA) is None
+    assert all_monsters.AllMonsters(path_to_monsters_complete, snapshot=True).all_monsters == all_db_monsters.all_monsters
@@ -25,6 +25,7 @@ import json
 from pathlib import Path
 
 import config
+from builders.schema_validator import SchemaValidator
 
 
 def test_monsters_data():
@@ -34,17 +35,14 @@ def test_monsters_data():
     with open(path_to_schema, 'r') as f:
         schema = json.loads(f.read())
 
-    # Validator object with schema attached
-    v = config.MyValidator(schema)
+    # Compiled validator object with schema attached
+    v = SchemaValidator(schema)
 
     # Set the path to the monsters-json folder and get all the JSON files
     path_to_monsters_json_dir = Path(config.DOCS_PATH / "monsters-json")
     fis = path_to_monsters_json_dir.glob("*.json")
     fis = sorted(fis)
 
-    # Validate each file
-    for json_file in fis:
-        with open(json_file) as fi:
-            monster = json.load(fi)
-            # print(monster["id"])
-            assert v.validate(monster)
+    # Validate every file in a single batch, then report the errors of each invalid file
+    errors = v.validate_many(json.loads(json_file.read_text()) for json_file in fis)
+    assert not errors, {fis[position].name: error for position, error in errors.items()}
@@ -0,0 +1,116 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: scripts.wiki.page_text_store
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+
+import pytest
+
+from scripts.wiki.page_text_store import PageTextStore, journal_path, load_page_text
+
+TIMESTAMP = "2020-05-01T12:00:00Z"
+
+
+def test_page_text_store(tmp_path):
+    text_file_path = tmp_path / "page-text-items.json"
+    text_file_path.write_text(json.dumps({"Abyssal whip": "Old wiki text", "Bronze axe": "{{Infobox Item}}"}, indent=4))
+
+    page_text_store = PageTextStore(text_file_path)
+    page_text_store.append("Abyssal whip", TIMESTAMP, "{{Infobox Item|name=Abyssal whip}}")
+    page_text_store.append("Pet rock", TIMESTAMP, "{{Infobox Pet}}")
+    page_text_store.append("Missing page", None, None)
+    page_text_store.append("Pet rock", TIMESTAMP, "{{Infobox Pet|name=Pet rock}}")
+    page_text_store.flush()
+
+    # The JSON file is not changed until compaction, but both forms can be read
+    assert json.loads(text_file_path.read_text())["Abyssal whip"] == "Old wiki text"
+    assert len(page_text_store) == 3
+    assert page_text_store.get("Pet rock") == "{{Infobox Pet|name=Pet rock}}"
+    assert load_page_text(text_file_path) == {
+        "Abyssal whip": "{{Infobox Item|name=Abyssal whip}}",
+        "Bronze axe": "{{Infobox Item}}",
+        "Pet rock": "{{Infobox Pet|name=Pet rock}}",
+        "Missing page": "None"
+    }
+
+    # The journal is indexed again when the store is reopened
+    page_text_store.close()
+    page_text_store = PageTextStore(text_file_path)
+    assert "Pet rock" in page_text_store
+    assert page_text_store.timestamps["Abyssal whip"] == TIMESTAMP
+
+    page_text_store.compact()
+    assert not journal_path(text_file_path).exists()
+    assert json.loads(text_file_path.read_text()) == {
+        "Abyssal whip": "{{Infobox Item|name=Abyssal whip}}",
+        "Bronze axe": "{{Infobox Item}}",
+        "Pet rock": "{{Infobox Pet|name=Pet rock}}",
+        "Missing page": "None"
+    }
+
+
+def test_page_text_store_journal_only(tmp_path):
+    text_file_path = tmp_path / "page-text-monsters.json"
+    with pytest.raises(FileNotFoundError):
+        load_page_text(text_file_path)
+
+    page_text_store = PageTextStore(text_file_path)
+    page_text_store.compact()
+    assert not text_file_path.exists()
+
+    page_text_store.append("Goblin", TIMESTAMP, "{{Infobox Monster}}")
+    page_text_store.close()
+    assert load_page_text(text_file_path) == {"Goblin": "{{Infobox Monster}}"}
+
+
+def test_page_text_store_incomplete_record(tmp_path):
+    text_file_path = tmp_path / "page-text-monsters.json"
+    page_text_store = PageTextStore(text_file_path)
+    page_text_store.append("Goblin", TIMESTAMP, "{{Infobox Monster}}")
+    page_text_store.close()
+
+    # An interrupted extraction can leave a partly written record
+    with open(journal_path(text_file_path), "ab") as journal_file:
+        journal_file.write(b'{"title": "Imp", "timestamp": "2020-05-01T12:00:00Z", "wiki')
+    assert load_page_text(text_file_path) == {"Goblin": "{{Infobox Monster}}"}
+
+    page_text_store = PageTextStore(text_file_path)
+    page_text_store.append("Imp", TIMESTAMP, "{{Infobox Monster|name=Imp}}")
+    page_text_store.compact()
+    assert json.loads(text_file_path.read_text()) == {"Goblin": "{{Infobox Monster}}",
+                                                      "Imp": "{{Infobox Monster|name=Imp}}"}
+
+
+def test_page_text_store_remove(tmp_path):
+    text_file_path = tmp_path / "page-text-items.json"
+    text_file_path.write_text(json.dumps({"Abyssal whip": "{{Infobox Item}}", "Bronze axe": "{{Infobox Item}}"}))
+
+    page_text_store = PageTextStore(text_file_path)
+    page_text_store.append("Pet rock", TIMESTAMP, "{{Infobox Pet}}")
+    page_text_store.remove("Pet rock")
+    page_text_store.remove("Bronze axe")
+    page_text_store.close()
+    assert "Pet rock" not in PageTextStore(text_file_path)
+    assert load_page_text(text_file_path) == {"Abyssal whip": "{{Infobox Item}}"}
+
+    PageTextStore(text_file_path).compact()
+    assert json.loads(text_file_path.read_text()) == {"Abyssal whip": "{{Infobox Item}}"}
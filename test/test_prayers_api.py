@@ -22,8 +22,12 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 ###############################################################################
 """
 import os
+import json
+import pickle
+import shutil
 from pathlib import Path
 
+from osrsbox import snapshot
 from osrsbox.prayers_api import all_prayers
 
 # The current number of prayers being loaded from the db
@@ -44,3 +48,53 @@ def test_all_prayers_load_prayers_complete(path_to_docs_dir: Path):
 
     all_db_prayers = all_prayers.AllPrayers(str(path_to_prayers_complete))
     assert len(all_db_prayers.all_prayers) == NUMBER_OF_PRAYERS
+
+
+def test_all_prayers_load_prayers_snapshot(path_to_docs_dir: Path, tmp_path: Path):
+    path_to_prayers_complete = tmp_path / "prayers-complete.json"
+    shutil.copy(path_to_docs_dir / "prayers-complete.json", path_to_prayers_complete)
+
+    # Snapshots are only used when enabled
+    all_prayers.AllPrayers(path_to_prayers_complete)
+    assert not snapshot.snapshot_path(path_to_prayers_complete).exists()
+
+    # The first load saves a snapshot, the second load uses it
+    all_db_prayers = all_prayers.AllPrayers(path_to_prayers_complete, snapshot=True)
+    assert snapshot.snapshot_path(path_to_prayers_complete).is_file()
+    assert snapshot.load_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA) is not None
+    assert all_prayers.AllPrayers(path_to_prayers_complete, snapshot=True).all_prayers == all_db_prayers.all_prayers
+
+    # Changing the JSON file invalidates the snapshot
+    with open(path_to_prayers_complete) as f:
+        prayers = json.load(f)
+    prayers.popitem()
+    with open(path_to_prayers_complete, "w") as f:
+        json.dump(prayers, f)
+    assert snapshot.load_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA) is None
+    assert len(all_prayers.AllPrayers(path_to_prayers_complete, snapshot=True)) == NUMBER_OF_PRAYERS - 1
+
+
+class UnsafeSnapshotData:
+    """Pickled data that calls a function when it is unpickled."""
+    def __reduce__(self):
+        return os.getpid, ()
+
+
+def test_all_prayers_load_unsafe_snapshot(path_to_docs_dir: Path, tmp_path: Path):
+    path_to_prayers_complete = tmp_path / "prayers-complete.json"
+    shutil.copy(path_to_docs_dir / "prayers-complete.json", path_to_prayers_complete)
+    path_to_snapshot = snapshot.snapshot_path(path_to_prayers_complete)
+
+    # A snapshot with a valid header, but data that is not only prayer dataclasses, is not unpickled
+    assert snapshot.save_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA, [UnsafeSnapshotData()])
+    assert snapshot.load_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA) is None
+    assert len(all_prayers.AllPrayers(path_to_prayers_complete, snapshot=True)) == NUMBER_OF_PRAYERS
+
+    # A snapshot of anything other than a list of prayers is not used
+    for data in ({"1": "Thick Skin"}, [{"id": 1, "name": "Thick Skin"}]):
+        assert snapshot.save_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA, data)
+        assert snapshot.load_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA) is None
+
+    # A pickled (version 1) snapshot header is not unpickled
+    path_to_snapshot.write_bytes(pickle.dumps(UnsafeSnapshotData()))
+    assert snapshot.load_snapshot(path_to_prayers_complete, all_prayers.SNAPSHOT_SCHEMA) is None
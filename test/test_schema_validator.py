@@ -0,0 +1,133 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: builders.schema_validator
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import pickle
+
+import pytest
+
+import config
+from builders.schema_validator import SchemaValidator
+
+SCHEMA = {
+    "id": {"type": "integer", "required": True, "nullable": False, "min": 0, "description": "ID."},
+    "name": {"type": "string", "required": True, "nullable": False, "empty": False},
+    "weight": {"type": "float", "required": True, "nullable": True},
+    "wiki_url": {"type": "string", "required": False, "nullable": True, "regex": "https://.*"},
+    "attack_type": {"type": "list", "required": True, "nullable": False,
+                    "schema": {"type": "string", "allowed": ["melee", "magic", "ranged"]}},
+    "equipment": {"type": "dict", "required": True, "nullable": True, "schema": {
+        "slot": {"type": "string", "required": True, "nullable": False, "allowed": ["head", "weapon"]},
+        "requirements": {"type": "dict", "required": True, "nullable": True,
+                         "keysrules": {"type": "string"},
+                         "valuesrules": {"type": "integer", "min": 1, "max": 99}}
+    }},
+    "drops": {"type": "list", "required": True, "nullable": True, "schema": {"type": "dict", "schema": {
+        "id": {"type": "integer", "required": True, "nullable": False},
+        "rarity": {"type": "float", "required": True, "nullable": True, "max": 1.0}
+    }}}
+}
+
+VALID = {
+    "id": 4151,
+    "name": "Abyssal whip",
+    "weight": 0.453,
+    "wiki_url": "https://oldschool.runescape.wiki/w/Abyssal_whip",
+    "attack_type": ["melee"],
+    "equipment": {"slot": "weapon", "requirements": {"attack": 70}},
+    "drops": [{"id": 592, "rarity": 1.0}, {"id": 526, "rarity": None}]
+}
+
+INVALID_CHANGES = [
+    {"id": -1},
+    {"id": "4151"},
+    {"id": None},
+    {"id": True, "name": ""},
+    {"weight": 1},
+    {"weight": "0.453"},
+    {"wiki_url": "http://example.com"},
+    {"attack_type": ["melee", "stab"]},
+    {"attack_type": "melee"},
+    {"equipment": {"slot": "cape", "requirements": None}},
+    {"equipment": {"slot": "head"}},
+    {"equipment": {"slot": "head", "requirements": {"attack": 100}}},
+    {"equipment": {"slot": "head", "requirements": {1: 10}}},
+    {"equipment": {"slot": "head", "requirements": None, "unknown": 1}},
+    {"drops": [{"id": 592, "rarity": 2.0}]},
+    {"drops": [{"id": 592}]},
+    {"drops": [592]},
+    {"unknown": 1},
+]
+
+
+def test_schema_validator_valid():
+    v = SchemaValidator(SCHEMA)
+    assert v.check is not None
+    assert v.validate(VALID)
+    assert v.errors == dict()
+    assert v.validate(dict(VALID, weight=1.0, wiki_url=None, equipment=None, drops=None))
+    assert v.validate(dict(VALID, attack_type=[], drops=[]))
+
+
+@pytest.mark.parametrize("changes", INVALID_CHANGES)
+def test_schema_validator_matches_cerberus(changes):
+    document = dict(VALID, **changes)
+    cerberus_validator = config.MyValidator(SCHEMA)
+    v = SchemaValidator(SCHEMA)
+    assert v.validate(document) == cerberus_validator.validate(document)
+    assert v.errors == cerberus_validator.errors
+
+
+def test_schema_validator_missing_required():
+    document = dict(VALID)
+    del document["drops"]
+    cerberus_validator = config.MyValidator(SCHEMA)
+    v = SchemaValidator(SCHEMA)
+    assert not v.validate(document)
+    assert not cerberus_validator.validate(document)
+    assert v.errors == cerberus_validator.errors
+
+
+def test_schema_validator_validate_many():
+    v = SchemaValidator(SCHEMA)
+    documents = [VALID, dict(VALID, id=-1), VALID, dict(VALID, unknown=1)]
+    errors = v.validate_many(documents)
+    assert list(errors) == [1, 3]
+    assert errors[1] == {"id": ["min value is 0"]}
+    assert errors[3] == {"unknown": ["unknown field"]}
+
+
+def test_schema_validator_unsupported_rule():
+    # A schema with a rule that cannot be compiled is validated by Cerberus
+    schema = dict(SCHEMA, name={"type": "string", "required": True, "forbidden": ["Dwarf remains"]})
+    v = SchemaValidator(schema)
+    assert v.check is None
+    assert v.validate(VALID)
+    assert not v.validate(dict(VALID, name="Dwarf remains"))
+    assert v.errors == {"name": ["unallowed value Dwarf remains"]}
+
+
+def test_schema_validator_pickle():
+    v = pickle.loads(pickle.dumps(SchemaValidator(SCHEMA)))
+    assert v.check is not None
+    assert v.validate(VALID)
+    assert not v.validate(dict(VALID, id=-1))
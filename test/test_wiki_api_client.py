@@ -0,0 +1,131 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: scripts.wiki.wiki_api_client
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import time
+
+import pytest
+
+from scripts.wiki.wiki_api_client import WikiApiClient, close_default_clients, make_client
+from scripts.wiki.wiki_page_titles import WikiPageTitles
+
+REQUEST = {"action": "query", "list": "categorymembers", "cmtitle": "Category:Pets", "format": "json"}
+
+
+@pytest.fixture
+def client(stand_in_wiki):
+    client = WikiApiClient(stand_in_wiki.url, "osrsbox-agent", "phoil@osrsbox.com",
+                           max_workers=4, requests_per_second=0, max_retries=2, backoff_factor=0.01)
+    yield client
+    client.close()
+
+
+def test_get_retries(stand_in_wiki, client):
+    stand_in_wiki.record(REQUEST, {}, status=503, repeat=1)
+    stand_in_wiki.record(REQUEST, {"error": {"code": "maxlag"}}, repeat=1)
+    stand_in_wiki.record(REQUEST, {"batchcomplete": ""})
+
+    assert client.get(REQUEST) == {"batchcomplete": ""}
+    summary = client.metrics.summary()
+    assert (summary["requests"], summary["retries"], summary["failures"]) == (3, 2, 0)
+    assert summary["max"] >= summary["p50"] > 0
+
+
+def test_get_fails(stand_in_wiki, client):
+    stand_in_wiki.record(REQUEST, {}, status=503)
+
+    with pytest.raises(SystemExit):
+        client.get(REQUEST)
+    assert len(stand_in_wiki.requests) == 3
+    assert client.metrics.failures == 1
+
+
+def test_query_continue(stand_in_wiki, client):
+    stand_in_wiki.record(REQUEST, {"continue": {"cmcontinue": "page|2", "continue": "-||"}, "query": {"page": 1}})
+    stand_in_wiki.record(dict(REQUEST, cmcontinue="page|2", **{"continue": "-||"}), {"query": {"page": 2}})
+
+    assert [result["query"]["page"] for result in client.query(REQUEST)] == [1, 2]
+
+
+def test_map_connection_reuse(stand_in_wiki, client):
+    for number in range(12):
+        stand_in_wiki.record(dict(REQUEST, cmtitle=str(number)), {"number": number})
+
+    requests = [dict(REQUEST, cmtitle=str(number)) for number in range(12)]
+    assert [result["number"] for result in client.map(client.get, requests)] == list(range(12))
+    assert len(set(stand_in_wiki.client_ports)) <= client.max_workers
+
+    # Sequential requests use one connection
+    stand_in_wiki.client_ports.clear()
+    for request in requests:
+        client.get(request)
+    assert len(set(stand_in_wiki.client_ports)) == 1
+
+
+def test_rate_limiter(stand_in_wiki):
+    client = WikiApiClient(stand_in_wiki.url, "osrsbox-agent", "phoil@osrsbox.com",
+                           max_workers=4, requests_per_second=50)
+    start = time.monotonic()
+    list(client.map(client.get, [REQUEST] * 6))
+    client.close()
+    assert time.monotonic() - start >= 5 / 50
+
+
+def test_wiki_page_titles(stand_in_wiki, client):
+    for category, page_titles in [("Items", ["Abyssal whip", "File:Abyssal whip.png"]), ("Pets", ["Pet rock"])]:
+        stand_in_wiki.record({"action": "query", "list": "categorymembers", "cmtitle": f"Category:{category}",
+                              "format": "json", "cmlimit": "500"},
+                             {"query": {"categorymembers": [{"title": page_title} for page_title in page_titles]}})
+    stand_in_wiki.record({"action": "query", "prop": "revisions", "titles": "Abyssal whip|Pet rock",
+                          "format": "json", "rvprop": "timestamp"},
+                         {"query": {"pages": {
+                             "4151": {"title": "Abyssal whip", "revisions": [{"timestamp": "2020-05-01T12:00:00Z"}]},
+                             "3695": {"title": "Pet rock", "revisions": [{"timestamp": "2020-04-01T12:00:00Z"}]}}}})
+
+    wiki_page_titles = WikiPageTitles(stand_in_wiki.url, ["Items", "Pets"], "osrsbox-agent", "phoil@osrsbox.com",
+                                      client=client)
+    wiki_page_titles.extract_page_titles()
+    wiki_page_titles.extract_last_revision_timestamps()
+
+    assert wiki_page_titles.page_titles == {"Abyssal whip": "2020-05-01T12:00:00Z", "Pet rock": "2020-04-01T12:00:00Z"}
+    assert client.metrics.summary()["requests"] == 3
+
+
+def test_make_client_default_client(stand_in_wiki):
+    stand_in_wiki.record({"action": "query", "list": "categorymembers", "cmtitle": "Category:Pets",
+                          "format": "json", "cmlimit": "500"},
+                         {"query": {"categorymembers": [{"title": "Pet rock"}]}}, repeat=2)
+
+    # Every caller without a client shares one default client, instead of creating a worker pool each
+    wiki_page_titles = [WikiPageTitles(stand_in_wiki.url, ["Pets"], "osrsbox-agent", "phoil@osrsbox.com")
+                        for _ in range(2)]
+    assert wiki_page_titles[0].client is wiki_page_titles[1].client
+    assert make_client(stand_in_wiki.url, "osrsbox-agent", "phoil@osrsbox.com", None) is wiki_page_titles[0].client
+    assert make_client(stand_in_wiki.url, "other-agent", "phoil@osrsbox.com", None) is not wiki_page_titles[0].client
+    for titles in wiki_page_titles:
+        titles.extract_page_titles()
+        assert list(titles.page_titles) == ["Pet rock"]
+
+    close_default_clients()
+    assert wiki_page_titles[0].client.executor._shutdown
+    assert make_client(stand_in_wiki.url, "osrsbox-agent", "phoil@osrsbox.com", None) is not wiki_page_titles[0].client
+    close_default_clients()
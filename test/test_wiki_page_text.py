@@ -0,0 +1,139 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: scripts.wiki.wiki_page_text
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import json
+
+import pytest
+
+from scripts.wiki.page_text_store import PageTextStore
+from scripts.wiki.wiki_api_client import WikiApiClient
+from scripts.wiki.wiki_page_text import MAX_TITLES_PER_REQUEST, WikiPageTextBatch
+
+TIMESTAMP = "2020-05-01T12:00:00Z"
+PAGE_TITLES = [f"Item {number}" for number in range(1, MAX_TITLES_PER_REQUEST + 1)]
+PAGE_TITLES += ["Abyssal whip", "abyssal dagger", "Missing page"]
+
+
+def revisions_request(page_titles, **continue_entry):
+    request = {
+        "action": "query",
+        "prop": "revisions",
+        "rvprop": "content|timestamp",
+        "rvslots": "main",
+        "format": "json",
+        "titles": "|".join(page_titles)
+    }
+    request.update(continue_entry)
+    return request
+
+
+def page_entry(page_id, title, content=None):
+    page = {"pageid": page_id, "ns": 0, "title": title}
+    if content is not None:
+        page["revisions"] = [{
+            "timestamp": TIMESTAMP,
+            "slots": {"main": {"contentmodel": "wikitext", "contentformat": "text/x-wiki", "*": content}}
+        }]
+    return page
+
+
+@pytest.fixture
+def client(stand_in_wiki):
+    client = WikiApiClient(stand_in_wiki.url, "osrsbox-agent", "phoil@osrsbox.com", requests_per_second=0)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def recorded_wiki(stand_in_wiki):
+    # First batch: the response is too large, so "Item 50" content is in a continued response
+    first_batch = PAGE_TITLES[:MAX_TITLES_PER_REQUEST]
+    pages = {str(page_id): page_entry(page_id, title, f"{{{{Infobox Item|name={title}}}}}")
+             for page_id, title in enumerate(first_batch[:-1], start=1)}
+    pages["50"] = page_entry(50, "Item 50")
+    stand_in_wiki.record(revisions_request(first_batch), {
+        "continue": {"rvcontinue": "50|1234", "continue": "||"},
+        "query": {"pages": pages}
+    })
+    pages = {str(page_id): page_entry(page_id, title) for page_id, title in enumerate(first_batch[:-1], start=1)}
+    pages["50"] = page_entry(50, "Item 50", "{{Infobox Item|name=Item 50}}")
+    stand_in_wiki.record(revisions_request(first_batch, rvcontinue="50|1234", **{"continue": "||"}), {
+        "batchcomplete": "",
+        "query": {"pages": pages}
+    })
+
+    # Second batch: a normalized page title, and a page that does not exist
+    stand_in_wiki.record(revisions_request(PAGE_TITLES[MAX_TITLES_PER_REQUEST:]), {
+        "batchcomplete": "",
+        "query": {
+            "normalized": [{"from": "abyssal dagger", "to": "Abyssal dagger"}],
+            "pages": {
+                "-1": {"ns": 0, "title": "Missing page", "missing": ""},
+                "4151": page_entry(4151, "Abyssal whip", "{{Infobox Item|name=Abyssal whip}}"),
+                "13265": page_entry(13265, "Abyssal dagger", "{{Infobox Item|name=Abyssal dagger}}")
+            }
+        }
+    })
+    return stand_in_wiki
+
+
+def test_extract_pages_wiki_text(recorded_wiki, client):
+    wiki_page_text = WikiPageTextBatch(recorded_wiki.url, PAGE_TITLES, "osrsbox-agent", "phoil@osrsbox.com",
+                                       client=client)
+    batches = list(wiki_page_text.extract_pages_wiki_text())
+
+    assert [len(batch) for batch in batches] == [MAX_TITLES_PER_REQUEST, 3]
+    assert len(recorded_wiki.requests) == 3
+    assert wiki_page_text.wiki_text["Item 1"] == "{{Infobox Item|name=Item 1}}"
+    assert wiki_page_text.wiki_text["Item 50"] == "{{Infobox Item|name=Item 50}}"
+    assert wiki_page_text.wiki_text["abyssal dagger"] == "{{Infobox Item|name=Abyssal dagger}}"
+    assert wiki_page_text.wiki_text["Missing page"] is None
+    assert wiki_page_text.revision_timestamps["Abyssal whip"] == TIMESTAMP
+    assert wiki_page_text.revision_timestamps["Missing page"] is None
+    assert list(wiki_page_text.wiki_text) == PAGE_TITLES
+
+
+def test_export_wiki_text_to_store(recorded_wiki, client, tmp_path):
+    text_file_path = tmp_path / "page-text-items.json"
+    text_file_path.write_text(json.dumps({"Abyssal whip": "Old wiki text", "Bronze axe": "{{Infobox Item}}"}))
+    page_text_store = PageTextStore(text_file_path)
+
+    wiki_page_text = WikiPageTextBatch(recorded_wiki.url, PAGE_TITLES, "osrsbox-agent", "phoil@osrsbox.com",
+                                       client=client)
+    for page_titles in wiki_page_text.extract_pages_wiki_text():
+        wiki_page_text.export_wiki_text_to_store(page_text_store, page_titles)
+    assert page_text_store.timestamps["Abyssal whip"] == TIMESTAMP
+    page_text_store.compact()
+
+    json_data = json.loads(text_file_path.read_text())
+    assert len(json_data) == len(PAGE_TITLES) + 1
+    assert json_data["Bronze axe"] == "{{Infobox Item}}"
+    assert json_data["Abyssal whip"] == "{{Infobox Item|name=Abyssal whip}}"
+    assert json_data["Missing page"] == "None"
+
+
+def test_extract_pages_wiki_text_error(stand_in_wiki, client):
+    wiki_page_text = WikiPageTextBatch(stand_in_wiki.url, ["Abyssal whip"], "osrsbox-agent", "phoil@osrsbox.com",
+                                       client=client)
+    with pytest.raises(SystemExit):
+        list(wiki_page_text.extract_pages_wiki_text())
@@ -0,0 +1,178 @@
+"""
+Author:  PH01L
+Email:   phoil@osrsbox.com
+Website: https://www.osrsbox.com
+
+Description:
+Tests for module: scripts.wiki.wikitext_parser
+
+Copyright (c) 2020, PH01L
+
+###############################################################################
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+###############################################################################
+"""
+import pickle
+
+import mwparserfromhell
+import pytest
+
+from scripts.wiki import wikitext_parser
+from scripts.wiki.wikitext_parser import InfoboxCache, WikitextTemplateParser
+
+VERSIONED_WIKITEXT = """{{External|rs}}
+{{Infobox Item
+|version1 = Crawling
+|version2 = Airborne
+|name = Kalphite princess
+|id1 = 12647
+|id2 = 12654, 12655
+|tradeable = No
+}}
+{{Infobox Bonuses
+|astab = 0
+}}
+The '''Kalphite princess''' is a pet.
+"""
+
+WIKITEXT = """{{Infobox Monster
+|name = Goblin
+|id = 3029,3030
+|combat = 2
+}}
+"""
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    """Count the calls to mwparserfromhell.parse made by the wikitext parser."""
+    counts = {"parse": 0}
+    parse = mwparserfromhell.parse
+
+    def counted_parse(value):
+        counts["parse"] += 1
+        return parse(value)
+
+    monkeypatch.setattr(wikitext_parser.mwparserfromhell, "parse", counted_parse)
+    return counts
+
+
+def parse_infobox(wikitext, template_type, infobox_cache=None):
+    infobox_parser = WikitextTemplateParser(wikitext, infobox_cache)
+    assert infobox_parser.extract_infobox(template_type)
+    infobox_parser.determine_infobox_versions()
+    return infobox_parser
+
+
+def check_same_infobox(cached_parser, parser):
+    assert dict(cached_parser.template.params) == {str(param.name).strip(): str(param.value)
+                                                   for param in parser.template.params}
+    assert cached_parser.is_versioned == parser.is_versioned
+    assert cached_parser.version_identifiers == parser.version_identifiers
+    assert cached_parser.extract_infobox_ids() == parser.extract_infobox_ids()
+    assert cached_parser.extract_infobox_value("name") == parser.extract_infobox_value("name")
+    assert cached_parser.extract_infobox_value("tradeable") == parser.extract_infobox_value("tradeable")
+
+
+@pytest.mark.parametrize("wikitext", [
+    VERSIONED_WIKITEXT,
+    ["Kalphite princess", "2", VERSIONED_WIKITEXT]  # A processed wikitext entry
+])
+def test_infobox_cache_same_as_parser(parse_count, wikitext):
+    parser = parse_infobox(wikitext, "infobox item")
+    assert parse_count["parse"] == 1
+
+    infobox_cache = InfoboxCache()
+    for _ in range(3):
+        cached_parser = parse_infobox(wikitext, "infobox item", infobox_cache)
+        check_same_infobox(cached_parser, parser)
+    assert cached_parser.extract_infobox_ids() == {12647: "1", 12654: "2", 12655: "2"}
+
+    # A different infobox on the same page is also cached
+    assert parse_infobox(wikitext, "infobox bonuses", infobox_cache).template.has("astab")
+    assert not WikitextTemplateParser(wikitext, infobox_cache).extract_infobox("infobox pet")
+
+    # The page was only parsed once, for the first cached lookup
+    assert parse_count["parse"] == 2
+    assert len(infobox_cache) == 1
+
+
+def test_infobox_cache_save_load(tmp_path, parse_count):
+    path_to_cache = tmp_path / "infobox-cache-monsters.json"
+    parser = parse_infobox(WIKITEXT, "infobox monster")
+    infobox_cache = InfoboxCache(path_to_cache)
+    parse_infobox(WIKITEXT, "infobox monster", infobox_cache)
+    infobox_cache.save()
+    assert parse_count["parse"] == 2
+
+    infobox_cache = InfoboxCache(path_to_cache)
+    assert len(infobox_cache) == 1
+    cached_parser = parse_infobox(WIKITEXT, "infobox monster", infobox_cache)
+    check_same_infobox(cached_parser, parser)
+    assert cached_parser.extract_infobox_ids() == {3029: "", 3030: ""}
+    assert parse_count["parse"] == 2
+
+
+def test_infobox_cache_header_changed(tmp_path, monkeypatch):
+    path_to_cache = tmp_path / "infobox-cache-monsters.json"
+    infobox_cache = InfoboxCache(path_to_cache)
+    parse_infobox(WIKITEXT, "infobox monster", infobox_cache)
+    infobox_cache.save()
+    assert len(InfoboxCache(path_to_cache)) == 1
+
+    monkeypatch.setattr(wikitext_parser, "INFOBOX_CACHE_VERSION", wikitext_parser.INFOBOX_CACHE_VERSION + 1)
+    assert len(InfoboxCache(path_to_cache)) == 0
+
+    monkeypatch.undo()
+    monkeypatch.setattr(wikitext_parser.mwparserfromhell, "__version__", "0.0.1")
+    assert len(InfoboxCache(path_to_cache)) == 0
+
+
+def test_infobox_cache_prune(tmp_path):
+    path_to_cache = tmp_path / "infobox-cache-items.json"
+    infobox_cache = InfoboxCache(path_to_cache)
+    parse_infobox(WIKITEXT, "infobox monster", infobox_cache)
+    parse_infobox(VERSIONED_WIKITEXT, "infobox item", infobox_cache)
+    infobox_cache.save()
+
+    # Only the used pages are kept when pruning
+    infobox_cache = InfoboxCache(path_to_cache)
+    parse_infobox(VERSIONED_WIKITEXT, "infobox item", infobox_cache)
+    infobox_cache.save()
+    assert len(InfoboxCache(path_to_cache)) == 2
+    infobox_cache.save(prune=True)
+    infobox_cache = InfoboxCache(path_to_cache)
+    assert len(infobox_cache) == 1
+    parse_infobox(VERSIONED_WIKITEXT, "infobox item", infobox_cache)
+    assert not infobox_cache.pop_new_pages()
+
+
+def test_infobox_cache_merge_worker_pages(tmp_path, parse_count):
+    path_to_cache = tmp_path / "infobox-cache-items.json"
+    infobox_cache = InfoboxCache(path_to_cache)
+    parser = parse_infobox(VERSIONED_WIKITEXT, "infobox item")
+
+    # A worker process parses a page, and returns the new pages (pickled) with the item
+    worker_infobox_cache = InfoboxCache()
+    parse_infobox(VERSIONED_WIKITEXT, "infobox item", worker_infobox_cache)
+    new_pages = pickle.loads(pickle.dumps(worker_infobox_cache.pop_new_pages()))
+    assert len(new_pages) == 1
+    assert not worker_infobox_cache.pop_new_pages()
+
+    infobox_cache.update(new_pages)
+    cached_parser = parse_infobox(VERSIONED_WIKITEXT, "infobox item", infobox_cache)
+    check_same_infobox(cached_parser, parser)
+    assert parse_count["parse"] == 2
+
+    # The merged pages are used, so are kept when pruning
+    infobox_cache.save(prune=True)
+    assert len(InfoboxCache(path_to_cache)) == 1